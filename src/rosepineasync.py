@@ -0,0 +1,291 @@
+"""Highlighting from asyncio code without blocking the event loop.
+
+``pygments.highlight`` is CPU bound and can take a long time on large
+inputs. :class:`HighlightService` runs it on a bounded thread pool instead,
+with formatters pooled per variant, format and options so they are built
+once and then reused::
+
+    html = await highlight_async(code, "python", "rose-pine-moon", "html")
+
+At most ``max_pending`` calls are handed to the pool at a time; callers
+past that wait for a slot, which keeps a burst of large pastes from piling
+up unbounded work. Calls can be given a timeout, after which the work is
+abandoned at the next token, freeing its worker for other requests.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from queue import Empty, SimpleQueue
+from typing import Any, Optional, Union
+
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.token import _TokenType
+
+from rosepinemetrics import format_tokens
+from rosepineterm import formatter_for
+
+#: Default number of worker threads.
+MAX_WORKERS: int = 4
+
+#: Default number of calls handed to the workers at a time.
+MAX_PENDING: int = 64
+
+# Key of a pooled formatter: variant, format and sorted options.
+_Key = tuple[str, str, tuple[tuple[str, Any], ...]]
+
+
+class _Abandoned(Exception):
+    """Raised in a worker to stop a call that timed out or was cancelled."""
+
+
+class FormatterPool:
+    """Thread-safe pool of formatter instances.
+
+    Formatters keep no state between calls to ``format`` but are not meant
+    to be used by two threads at once, so each call borrows an instance
+    and returns it when done. The pool grows to the number of concurrent
+    calls and never shrinks.
+    """
+
+    def __init__(self) -> None:
+        self._free: dict[_Key, SimpleQueue[Formatter]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+
+    @contextmanager
+    def borrow(
+        self,
+        variant: str,
+        fmt: str,
+        **options: Any,
+    ) -> Iterator[Formatter]:
+        """Borrow a formatter for the duration of a ``with`` block.
+
+        Args:
+            variant (str): Rose Pine variant name.
+            fmt (str): Pygments formatter alias.
+            **options (Any): Formatter options. Their values must be
+                hashable.
+
+        Yields:
+            Formatter: Formatter no other thread is using.
+        """
+        key = (variant, fmt, tuple(sorted(options.items())))
+        with self._lock:
+            free = self._free.setdefault(key, SimpleQueue())
+        try:
+            formatter = free.get_nowait()
+        except Empty:
+            formatter = formatter_for(variant, fmt, **options)
+            with self._lock:
+                self.created += 1
+        try:
+            yield formatter
+        finally:
+            free.put(formatter)
+
+
+@lru_cache(maxsize=None)
+def _lexer_by_name(alias: str) -> Lexer:
+    return get_lexer_by_name(alias)
+
+
+def _watched(
+    tokens: Iterable[tuple[_TokenType, str]], abandoned: threading.Event
+) -> Iterator[tuple[_TokenType, str]]:
+    """Pass tokens through until the call is abandoned.
+
+    Args:
+        tokens (Iterable[tuple[_TokenType, str]]): Token stream.
+        abandoned (threading.Event): Set when the caller gave up.
+
+    Yields:
+        tuple[_TokenType, str]: The same tokens.
+
+    Raises:
+        _Abandoned: Once ``abandoned`` is set.
+    """
+    is_set = abandoned.is_set
+    for token in tokens:
+        if is_set():
+            raise _Abandoned()
+        yield token
+
+
+class HighlightService:
+    """Bounded, off-loop highlighting for asyncio applications.
+
+    A service can be used from several event loops; backpressure applies
+    per loop.
+
+    Args:
+        max_workers (int): Number of worker threads. Defaults to
+            :data:`MAX_WORKERS`.
+        max_pending (int): Number of calls handed to the workers at a time,
+            running or queued. Defaults to :data:`MAX_PENDING`.
+    """
+
+    def __init__(
+        self, max_workers: int = MAX_WORKERS, max_pending: int = MAX_PENDING
+    ) -> None:
+        self.max_pending = max_pending
+        self.pool = FormatterPool()
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="rose-pine-highlight"
+        )
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _highlight(
+        self,
+        code: str,
+        lexer: Lexer,
+        variant: str,
+        fmt: str,
+        options: dict[str, Any],
+        abandoned: threading.Event,
+    ) -> Union[str, bytes]:
+        """Highlight code on a worker thread."""
+        if abandoned.is_set():  # Timed out while queued.
+            raise _Abandoned()
+        with self.pool.borrow(variant, fmt, **options) as formatter:
+            tokens = _watched(lexer.get_tokens(code), abandoned)
+            return format_tokens(tokens, formatter)
+
+    async def highlight(
+        self,
+        code: str,
+        lexer: Union[str, Lexer],
+        variant: str = "rose-pine",
+        fmt: str = "html",
+        *,
+        timeout: Optional[float] = None,
+        **options: Any,
+    ) -> Union[str, bytes]:
+        """Highlight code off the event loop.
+
+        Args:
+            code (str): Source code.
+            lexer (Union[str, Lexer]): Lexer instance, or alias of a lexer
+                to use with its default options.
+            variant (str): Rose Pine variant name. Defaults to
+                ``rose-pine``.
+            fmt (str): Pygments formatter alias, e.g. ``terminal16m``.
+                Defaults to ``html``.
+            timeout (Optional[float]): Seconds to wait for the result,
+                including the time spent waiting for a free slot.
+            **options (Any): Formatter options, with hashable values.
+
+        Returns:
+            Union[str, bytes]: Output, as ``pygments.highlight`` returns it.
+
+        Raises:
+            asyncio.TimeoutError: If the timeout expired. The work is
+                stopped at the next token.
+        """
+        if isinstance(lexer, str):
+            lexer = _lexer_by_name(lexer)
+        job = partial(self._highlight, code, lexer, variant, fmt, options)
+        return await asyncio.wait_for(self._submit(job), timeout)
+
+    async def _submit(self, job: partial) -> Union[str, bytes]:
+        """Run a job on the executor once a slot is free.
+
+        Args:
+            job (partial): Callable taking the abandon event.
+
+        Returns:
+            Union[str, bytes]: Its result.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        await slots.acquire()
+        abandoned = threading.Event()
+        try:
+            future = self._executor.submit(job, abandoned)
+        except BaseException:
+            slots.release()
+            raise
+
+        def release(_: Future) -> None:
+            # The slot is only freed once the worker is really done.
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:  # The loop is closed.
+                pass
+
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+
+    def close(self, wait: bool = True) -> None:
+        """Shut the worker threads down.
+
+        Args:
+            wait (bool): Wait for the running calls to finish. Defaults to
+                ``True``.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> "HighlightService":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close(wait=False)
+
+
+_default: Optional[HighlightService] = None
+
+
+def default_service() -> HighlightService:
+    """Get the service used by :func:`highlight_async`, creating it once.
+
+    Returns:
+        HighlightService: Shared service with the default limits.
+    """
+    global _default
+    if _default is None:
+        _default = HighlightService()
+    return _default
+
+
+async def highlight_async(
+    code: str,
+    lexer: Union[str, Lexer],
+    variant: str = "rose-pine",
+    fmt: str = "html",
+    *,
+    timeout: Optional[float] = None,
+    **options: Any,
+) -> Union[str, bytes]:
+    """Highlight code off the event loop with the shared service.
+
+    See :meth:`HighlightService.highlight` for the arguments.
+
+    Args:
+        code (str): Source code.
+        lexer (Union[str, Lexer]): Lexer instance or alias.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        fmt (str): Pygments formatter alias. Defaults to ``html``.
+        timeout (Optional[float]): Seconds to wait for the result.
+        **options (Any): Formatter options, with hashable values.
+
+    Returns:
+        Union[str, bytes]: Output, as ``pygments.highlight`` returns it.
+    """
+    return await default_service().highlight(
+        code, lexer, variant, fmt, timeout=timeout, **options
+    )
@@ -0,0 +1,128 @@
+"""Highlighting of many short snippets in one call.
+
+A search results page may highlight hundreds of snippets per request, and
+each ``pygments.highlight`` call looks up and builds its lexer and
+formatter again, which for a snippet of a few lines costs more than the
+highlighting itself. :func:`highlight_batch` builds every lexer and the
+formatter once per batch, formats all snippets into a single buffer and
+returns them as slices of it::
+
+    batch = highlight_batch(
+        [(snippet.code, snippet.language) for snippet in results],
+        "rose-pine-moon",
+        "html",
+        nowrap=True,
+    )
+    for snippet, html in zip(results, batch):
+        ...
+
+Each slice is the same output as ``pygments.highlight`` with the same
+lexer and formatter gives for the snippet alone.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Union
+
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+
+from rosepinemetrics import format_tokens
+from rosepineterm import formatter_for
+
+
+class _Buffer:
+    """File-like sink keeping the written parts and their total size."""
+
+    def __init__(self) -> None:
+        self.parts: list[Any] = []
+        self.size = 0
+
+    def write(self, data: Union[str, bytes]) -> None:
+        self.parts.append(data)
+        self.size += len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class Batch(Sequence[Union[str, bytes]]):
+    """Output of a batch: one buffer and the span of every snippet in it.
+
+    Indexing and iterating slice the snippets out of :attr:`output`, which
+    can also be sent as is when the snippets end up next to each other.
+
+    Args:
+        output (Union[str, bytes]): Output of every snippet, in order;
+            bytes if the formatter has an ``encoding``.
+        offsets (list[int]): Start of every snippet in ``output``, followed
+            by its length.
+    """
+
+    def __init__(self, output: Union[str, bytes], offsets: list[int]) -> None:
+        self.output = output
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        start, end = self.span(index)
+        return self.output[start:end]
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        output, offsets = self.output, self.offsets
+        for start, end in zip(offsets, offsets[1:]):
+            yield output[start:end]
+
+    def span(self, index: int) -> tuple[int, int]:
+        """Get the offsets of a snippet in :attr:`output`.
+
+        Args:
+            index (int): Snippet index.
+
+        Returns:
+            tuple[int, int]: Start and end offsets.
+        """
+        index = range(len(self))[index]
+        return self.offsets[index], self.offsets[index + 1]
+
+
+def highlight_batch(
+    snippets: Iterable[tuple[str, Union[str, Lexer]]],
+    variant: str = "rose-pine",
+    fmt: str = "terminal16m",
+    **options: Any,
+) -> Batch:
+    """Highlight many snippets with the setup paid once.
+
+    Args:
+        snippets (Iterable[tuple[str, Union[str, Lexer]]]): Source code and
+            lexer of every snippet. Lexers given by name (a Pygments alias
+            such as ``python``) are built once per name.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        fmt (str): Pygments formatter alias. Defaults to ``terminal16m``.
+        **options (Any): Extra options passed on to the formatter.
+
+    Returns:
+        Batch: Output of every snippet, in order.
+
+    Raises:
+        ValueError: If the variant is unknown.
+        ClassNotFound: If no lexer or formatter has the alias.
+    """
+    formatter: Formatter = formatter_for(variant, fmt, **options)
+    lexers: dict[str, Lexer] = {}
+    buffer = _Buffer()
+    offsets = [0]
+    for code, lexer in snippets:
+        if isinstance(lexer, str):
+            if lexer not in lexers:
+                lexers[lexer] = get_lexer_by_name(lexer)
+            lexer = lexers[lexer]
+        format_tokens(lexer.get_tokens(code), formatter, buffer)
+        offsets.append(buffer.size)
+    empty = b"" if formatter.encoding else ""
+    return Batch(empty.join(buffer.parts), offsets)
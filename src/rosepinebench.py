@@ -0,0 +1,467 @@
+"""Highlighting throughput benchmarks for the Rose Pine styles.
+
+Measures tokens per second and MB per second for every variant with the
+``Terminal256``, ``TerminalTrueColor``, ``Html``, ``Latex`` and
+``RosePineHtml`` formatters, over generated Python, JSON and kernel log
+corpora. Lexing is timed once per corpus (it does not depend on the
+style), formatting once per variant and formatter, each time on the same
+pre-lexed tokens.
+
+Results can be compared against a stored baseline, flagging every case
+that got slower than a threshold::
+
+    python src/rosepinebench.py                 # compare to the baseline
+    python src/rosepinebench.py --update        # record a new baseline
+    python src/rosepinebench.py --compare-html  # HTML output size and time
+
+Like ``rosepinebuild.py``, this module is a development tool and is not
+shipped with the package.
+"""
+
+import argparse
+import io
+import json
+import platform
+import random
+import string
+import sys
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import pygments
+from pygments.formatter import Formatter
+from pygments.formatters import (
+    HtmlFormatter,
+    LatexFormatter,
+    Terminal256Formatter,
+    TerminalTrueColorFormatter,
+)
+from pygments.lexer import Lexer
+from pygments.lexers import JsonLexer, KernelLogLexer, PythonLexer
+from pygments.token import _TokenType
+
+from rosepinehtml import RosePineHtmlFormatter
+from rosepinepalette import VARIANTS, build_style
+
+#: Baseline the results are compared to by default.
+BASELINE_PATH: Path = Path(__file__).parents[1] / "benchmarks/baseline.json"
+
+#: Default slowdown, as a fraction of the baseline throughput, that counts
+#: as a regression.
+THRESHOLD: float = 0.25
+
+#: Formatters to benchmark, by Pygments alias.
+FORMATTERS: dict[str, type[Formatter]] = {
+    "terminal256": Terminal256Formatter,
+    "terminal16m": TerminalTrueColorFormatter,
+    "html": HtmlFormatter,
+    "latex": LatexFormatter,
+    "rose-pine-html": RosePineHtmlFormatter,
+}
+
+#: HTML formatters compared by :func:`compare_html`: class and options.
+HTML_FORMATTERS: dict[str, tuple[type[Formatter], dict[str, Any]]] = {
+    "html": (HtmlFormatter, {}),
+    "html noclasses": (HtmlFormatter, {"noclasses": True}),
+    "rose-pine-html": (RosePineHtmlFormatter, {}),
+    "rose-pine-html noclasses": (RosePineHtmlFormatter, {"noclasses": True}),
+}
+
+PYTHON_TEMPLATE = '''
+@dataclass(frozen=True)
+class {name}Handler(BaseHandler):
+    """Handle {name} requests.
+
+    Retries up to {n} times before giving up.
+    """
+
+    retries: int = {n}
+    pattern = re.compile(r"^/{name}/(?P<id>\\d+)$")
+
+    async def handle(self, request: Request, *args, **kwargs) -> Response:
+        # Look the record up, falling back to the cache.
+        for attempt in range(self.retries):
+            try:
+                record = await self.store.get(request.match["id"], timeout={f})
+            except TimeoutError as error:
+                log.warning(
+                    f"{{request.path}}: attempt {{attempt}}: {{error!r}}"
+                )
+                continue
+            value = record.value * {n}
+            return Response(200, {{"id": record.id, "value": value}})
+        return Response(503, b"unavailable")
+'''
+
+LOG_LEVELS = ("info", "warn", "error", "debug")
+
+
+def python_corpus(size: int, rng: random.Random) -> str:
+    """Generate Python source.
+
+    Args:
+        size (int): Approximate size, in characters.
+        rng (random.Random): Random source.
+
+    Returns:
+        str: Source code.
+    """
+    parts = ["import re\nfrom dataclasses import dataclass\n"]
+    total = len(parts[0])
+    while total < size:
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(8))
+        part = PYTHON_TEMPLATE.format(
+            name=name.title(), n=rng.randrange(1, 10), f=rng.random() * 10
+        )
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)
+
+
+def json_corpus(size: int, rng: random.Random) -> str:
+    """Generate a JSON document.
+
+    Args:
+        size (int): Approximate size, in characters.
+        rng (random.Random): Random source.
+
+    Returns:
+        str: Indented JSON array of records.
+    """
+    records = []
+    total = 0
+    while total < size:
+        record = {
+            "id": rng.randrange(10**9),
+            "name": f"item-{rng.randrange(10**6)}",
+            "active": rng.random() < 0.5,
+            "score": round(rng.random() * 100, 3),
+            "tags": rng.sample(["a", "b", "c", "d", "e"], 3),
+            "parent": None,
+        }
+        records.append(record)
+        total += 150
+    return json.dumps(records, indent=2) + "\n"
+
+
+def log_corpus(size: int, rng: random.Random) -> str:
+    """Generate a kernel log.
+
+    Args:
+        size (int): Approximate size, in characters.
+        rng (random.Random): Random source.
+
+    Returns:
+        str: ``dmesg`` style log lines.
+    """
+    lines = []
+    total = 0
+    clock = 0.0
+    while total < size:
+        clock += rng.random()
+        device = f"usb {rng.randrange(1, 4)}-{rng.randrange(1, 9)}"
+        level = rng.choice(LOG_LEVELS)
+        line = (
+            f"[{clock:12.6f}] {device}: {level}: new device number "
+            f"{rng.randrange(100)} using xhci_hcd\n"
+        )
+        lines.append(line)
+        total += len(line)
+    return "".join(lines)
+
+
+#: Corpora to benchmark: generator and lexer class.
+CORPORA: dict[str, tuple[Callable[[int, random.Random], str], type[Lexer]]] = {
+    "python": (python_corpus, PythonLexer),
+    "json": (json_corpus, JsonLexer),
+    "log": (log_corpus, KernelLogLexer),
+}
+
+
+class Measurement(NamedTuple):
+    """Timing of one benchmark case."""
+
+    tokens: int
+    size: int
+    seconds: float
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokens processed per second."""
+        return self.tokens / self.seconds
+
+    @property
+    def mb_per_second(self) -> float:
+        """Megabytes of source processed per second."""
+        return self.size / 1e6 / self.seconds
+
+
+def best_time(repeat: int, function: Callable[..., Any], *args: Any) -> float:
+    """Time a function, keeping the fastest of several runs.
+
+    Args:
+        repeat (int): Number of runs.
+        function (Callable[..., Any]): Function to time.
+        *args (Any): Arguments to call it with.
+
+    Returns:
+        float: Fastest run, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return max(best, 1e-9)
+
+
+def lex(lexer: Lexer, text: str) -> list[tuple[_TokenType, str]]:
+    """Lex text the way ``pygments.highlight`` does.
+
+    Args:
+        lexer (Lexer): Lexer to use.
+        text (str): Source.
+
+    Returns:
+        list[tuple[_TokenType, str]]: Tokens, after the lexer's filters.
+    """
+    return list(lexer.get_tokens(text))
+
+
+def format_tokens(
+    tokens: list[tuple[_TokenType, str]],
+    formatter: Formatter,
+) -> None:
+    """Format tokens into a discarded buffer.
+
+    Args:
+        tokens (list[tuple[_TokenType, str]]): Pre-lexed tokens.
+        formatter (Formatter): Formatter to use.
+    """
+    formatter.format(tokens, io.StringIO())
+
+
+def run(
+    variants: Sequence[str] = VARIANTS,
+    formatters: Sequence[str] = tuple(FORMATTERS),
+    corpora: Sequence[str] = tuple(CORPORA),
+    size: int = 256 * 1024,
+    repeat: int = 3,
+) -> dict[str, Measurement]:
+    """Run the benchmarks.
+
+    Args:
+        variants (Sequence[str]): Variants to benchmark.
+        formatters (Sequence[str]): Keys of :data:`FORMATTERS`.
+        corpora (Sequence[str]): Keys of :data:`CORPORA`.
+        size (int): Size of each corpus, in characters.
+        repeat (int): Runs per case; the fastest one is kept.
+
+    Returns:
+        dict[str, Measurement]: Measurements keyed by case, e.g.
+        ``python/lex`` or ``python/rose-pine-moon/html``.
+    """
+    results = {}
+    for corpus in corpora:
+        generate, lexer_class = CORPORA[corpus]
+        text = generate(size, random.Random(corpus))
+        lexer = lexer_class()
+        tokens = lex(lexer, text)
+        seconds = best_time(repeat, lex, lexer, text)
+        results[f"{corpus}/lex"] = Measurement(len(tokens), len(text), seconds)
+        for variant in variants:
+            for name in formatters:
+                formatter = FORMATTERS[name](style=build_style(variant))
+                seconds = best_time(repeat, format_tokens, tokens, formatter)
+                key = f"{corpus}/{variant}/{name}"
+                results[key] = Measurement(len(tokens), len(text), seconds)
+    return results
+
+
+def compare_html(
+    variant: str = "rose-pine",
+    corpora: Sequence[str] = tuple(CORPORA),
+    size: int = 256 * 1024,
+    repeat: int = 3,
+) -> str:
+    """Compare the output size and formatting time of the HTML formatters.
+
+    Args:
+        variant (str): Variant to use.
+        corpora (Sequence[str]): Keys of :data:`CORPORA`.
+        size (int): Size of each corpus, in characters.
+        repeat (int): Runs per case; the fastest one is kept.
+
+    Returns:
+        str: One line per corpus and formatter, with the output size in
+        bytes and relative to the source, and the formatting time.
+    """
+    lines = []
+    for corpus in corpora:
+        generate, lexer_class = CORPORA[corpus]
+        text = generate(size, random.Random(corpus))
+        tokens = lex(lexer_class(), text)
+        for name, (formatter_class, options) in HTML_FORMATTERS.items():
+            formatter = formatter_class(style=build_style(variant), **options)
+            output = pygments.format(tokens, formatter).encode("utf-8")
+            seconds = best_time(repeat, format_tokens, tokens, formatter)
+            lines.append(
+                f"{corpus:<8}{name:<26}{len(output):>12,} bytes"
+                f"  {len(output) / len(text):>5.2f}x source"
+                f"  {seconds * 1000:>8.1f} ms"
+            )
+    return "\n".join(lines)
+
+
+def to_json(results: dict[str, Measurement]) -> dict[str, Any]:
+    """Serialize results, with the environment they were measured in.
+
+    Args:
+        results (dict[str, Measurement]): Output of :func:`run`.
+
+    Returns:
+        dict[str, Any]: JSON-compatible data.
+    """
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "pygments": pygments.__version__,
+            "machine": platform.machine(),
+        },
+        "results": {
+            case: {
+                "tokens_per_second": round(m.tokens_per_second),
+                "mb_per_second": round(m.mb_per_second, 3),
+            }
+            for case, m in results.items()
+        },
+    }
+
+
+def regressions(
+    results: dict[str, Measurement],
+    baseline: dict[str, Any],
+    threshold: float = THRESHOLD,
+) -> list[str]:
+    """Find the cases that got slower than the baseline.
+
+    Args:
+        results (dict[str, Measurement]): Output of :func:`run`.
+        baseline (dict[str, Any]): Output of :func:`to_json`.
+        threshold (float): Tolerated slowdown, as a fraction of the baseline
+            throughput.
+
+    Returns:
+        list[str]: One message per regression; cases missing from the
+        baseline are ignored.
+    """
+    found = []
+    for case, measurement in results.items():
+        reference = baseline["results"].get(case)
+        if reference is None:
+            continue
+        expected = reference["mb_per_second"]
+        if measurement.mb_per_second < expected * (1 - threshold):
+            found.append(
+                f"{case}: {measurement.mb_per_second:.3f} MB/s, "
+                f"baseline {expected:.3f} MB/s"
+            )
+    return found
+
+
+def report(results: dict[str, Measurement]) -> str:
+    """Format results as a table.
+
+    Args:
+        results (dict[str, Measurement]): Output of :func:`run`.
+
+    Returns:
+        str: One line per case.
+    """
+    width = max(map(len, results), default=0)
+    return "\n".join(
+        f"{case:<{width}}  {m.tokens_per_second:>12,.0f} tokens/s"
+        f"  {m.mb_per_second:>8.2f} MB/s"
+        for case, m in results.items()
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments, ``sys.argv`` by default.
+
+    Returns:
+        int: Exit status, 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variant", action="append", choices=VARIANTS)
+    parser.add_argument("--formatter", action="append", choices=[*FORMATTERS])
+    parser.add_argument("--corpus", action="append", choices=[*CORPORA])
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=256,
+        help="corpus size in KiB (default: 256)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"tolerated slowdown (default: {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="write the results as the baseline",
+    )
+    parser.add_argument(
+        "--compare-html",
+        action="store_true",
+        help="compare the size and speed of the HTML formatters instead",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare_html:
+        print(
+            compare_html(
+                (args.variant or VARIANTS)[0],
+                args.corpus or tuple(CORPORA),
+                args.size * 1024,
+                args.repeat,
+            )
+        )
+        return 0
+
+    results = run(
+        args.variant or VARIANTS,
+        args.formatter or tuple(FORMATTERS),
+        args.corpus or tuple(CORPORA),
+        args.size * 1024,
+        args.repeat,
+    )
+    print(report(results))
+    if args.update:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(to_json(results), indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        message = f"no baseline at {args.baseline}, run with --update"
+        print(message, file=sys.stderr)
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    found = regressions(results, baseline, args.threshold)
+    for message in found:
+        print(f"regression: {message}", file=sys.stderr)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,645 @@
+"""Build-time generator for the precomputed Rose Pine tables.
+
+Running this module validates the style definitions, then regenerates
+``rosepinetables.py`` and the pre-parsed definitions in ``rosepinedefs.py``
+from them, so that the shipped package only carries constant data, and
+writes a WCAG contrast report::
+
+    python src/rosepinebuild.py
+
+The test suite checks that the committed files are up to date.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from pygments.formatters import (
+    HtmlFormatter,
+    TerminalTrueColorFormatter,
+)
+from pygments.formatters.terminal256 import EscapeSequence
+from pygments.style import StyleMeta
+from pygments.token import STANDARD_TYPES, _TokenType, string_to_tokentype
+
+from rosepinepalette import (
+    BACKGROUND_ROLE,
+    ENTRY_POINTS,
+    PALETTE,
+    PREFIXES,
+    ROLES,
+    STYLE_SLOTS,
+    THEMES,
+    TOKEN_ROLES,
+    VARIANTS,
+    make_color,
+    parse_style,
+    token_slot,
+)
+
+#: The 16 basic xterm colors, in SGR order (30-37, then 90-97).
+ANSI16: tuple[tuple[int, int, int], ...] = (
+    (0x00, 0x00, 0x00),
+    (0xCD, 0x00, 0x00),
+    (0x00, 0xCD, 0x00),
+    (0xCD, 0xCD, 0x00),
+    (0x00, 0x00, 0xEE),
+    (0xCD, 0x00, 0xCD),
+    (0x00, 0xCD, 0xCD),
+    (0xE5, 0xE5, 0xE5),
+    (0x7F, 0x7F, 0x7F),
+    (0xFF, 0x00, 0x00),
+    (0x00, 0xFF, 0x00),
+    (0xFF, 0xFF, 0x00),
+    (0x5C, 0x5C, 0xFF),
+    (0xFF, 0x00, 0xFF),
+    (0x00, 0xFF, 0xFF),
+    (0xFF, 0xFF, 0xFF),
+)
+
+#: The full xterm 256-color palette: the basic colors, the 6x6x6 color cube
+#: and the 24 step gray ramp.
+XTERM256: tuple[tuple[int, int, int], ...] = (
+    ANSI16
+    + tuple(
+        (levels[r], levels[g], levels[b])
+        for levels in [(0x00, 0x5F, 0x87, 0xAF, 0xD7, 0xFF)]
+        for r in range(6)
+        for g in range(6)
+        for b in range(6)
+    )
+    + tuple((v, v, v) for v in range(8, 248, 10))
+)
+
+#: The achromatic basic colors: black, white, bright black and bright white.
+ANSI16_GRAYS: tuple[int, ...] = (0, 7, 8, 15)
+
+#: OKLab chroma under which a color is mapped to a gray in 16-color mode.
+CHROMA_THRESHOLD: float = 0.05
+
+#: Style attributes a token role may add to its color.
+EXTRA_ATTRIBUTES: frozenset[str] = frozenset(
+    {"bold", "nobold", "italic", "noitalic", "underline", "nounderline"}
+)
+
+#: Minimum WCAG 2 contrast ratio of every conformance level, best first.
+WCAG_LEVELS: dict[str, float] = {"AAA": 7.0, "AA": 4.5, "AA-large": 3.0}
+
+TABLES_PATH: Path = Path(__file__).with_name("rosepinetables.py")
+
+DEFINITIONS_PATH: Path = Path(__file__).with_name("rosepinedefs.py")
+
+REPORT_PATH: Path = Path(__file__).parent.parent / "reports" / "contrast.json"
+
+_HEX = re.compile(r"#[0-9a-f]{6}")
+
+HEADER: str = '''"""{title}
+
+This file is generated by ``rosepinebuild.py``. Do not edit it by hand.
+"""
+
+# flake8: noqa
+# fmt: off
+'''
+
+
+def validate() -> None:
+    """Check the palettes, the ``Color`` dataclasses and the token roles.
+
+    Every color must be a lowercase ``#rrggbb`` string, every token role
+    must name a standard token type, a palette role and known attributes,
+    and Pygments must accept the resulting style strings.
+
+    Raises:
+        ValueError: Listing every problem found.
+    """
+    errors = []
+    for variant in VARIANTS:
+        palette = PALETTE[variant]
+        if tuple(palette) != ROLES:
+            errors.append(f"{variant}: roles differ from ROLES")
+        for role, color in palette.items():
+            if not _HEX.fullmatch(color):
+                errors.append(f"{variant}: {role} is not a #rrggbb color: {color!r}")
+        if any(variant not in table for table in (PREFIXES, ENTRY_POINTS, THEMES)):
+            errors.append(f"{variant}: missing from PREFIXES, ENTRY_POINTS or THEMES")
+            continue
+        color_class = make_color(variant)
+        for role in ROLES:
+            attribute = f"{PREFIXES[variant]}_{role}"
+            value = getattr(color_class, attribute, None)
+            if not isinstance(value, str) or not _HEX.fullmatch(value):
+                errors.append(f"{variant}: Color.{attribute} is not a color: {value!r}")
+    for token, (role, extra) in TOKEN_ROLES.items():
+        if string_to_tokentype(token) not in STANDARD_TYPES:
+            errors.append(f"{token}: not a standard token type")
+        if role not in ROLES:
+            errors.append(f"{token}: unknown role {role!r}")
+        for attribute in extra.split():
+            if attribute not in EXTRA_ATTRIBUTES:
+                errors.append(f"{token}: unknown attribute {attribute!r}")
+    if not errors:
+        errors += _check_parse()
+    if errors:
+        raise ValueError(
+            "invalid Rose Pine style definitions:\n"
+            + "\n".join(f"  {error}" for error in errors)
+        )
+
+
+def _check_parse() -> list[str]:
+    """Parse every variant and check that each slot has one definition."""
+    errors = []
+    order = None
+    for variant in VARIANTS:
+        try:
+            parsed = parse_style(variant)._styles
+        except AssertionError as err:  # How ``StyleMeta`` reports errors.
+            errors.append(f"{variant}: {err}")
+            continue
+        if order is None:
+            order = list(parsed)
+        elif list(parsed) != order:
+            errors.append(f"{variant}: token types differ from {VARIANTS[0]}")
+        slots: dict[int, list] = {}
+        for ttype, ndef in parsed.items():
+            if slots.setdefault(token_slot(ttype), ndef) != ndef:
+                errors.append(f"{variant}: {ttype} differs from its style slot")
+    return errors
+
+
+def hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Convert a ``#rrggbb`` (or bare ``rrggbb``) string into an RGB tuple.
+
+    Args:
+        color (str): Hex color.
+
+    Returns:
+        tuple[int, int, int]: Red, green and blue components.
+    """
+    value = int(color.lstrip("#"), 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+def srgb_to_linear(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
+    """Undo the sRGB transfer function.
+
+    Args:
+        rgb (tuple[int, int, int]): Red, green and blue components.
+
+    Returns:
+        tuple[float, float, float]: Linear light components, from 0 to 1.
+    """
+    r, g, b = (
+        c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+        for c in (v / 255 for v in rgb)
+    )
+    return r, g, b
+
+
+def srgb_to_oklab(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
+    """Convert an sRGB color into the OKLab perceptual color space.
+
+    See https://bottosson.github.io/posts/oklab/.
+
+    Args:
+        rgb (tuple[int, int, int]): Red, green and blue components.
+
+    Returns:
+        tuple[float, float, float]: Lightness, green-red and blue-yellow axes.
+    """
+    r, g, b = srgb_to_linear(rgb)
+    l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def relative_luminance(color: str) -> float:
+    """Compute the WCAG 2 relative luminance of a color.
+
+    Args:
+        color (str): Hex color.
+
+    Returns:
+        float: Luminance, from 0 for black to 1 for white.
+    """
+    r, g, b = srgb_to_linear(hex_to_rgb(color))
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(foreground: str, background: str) -> float:
+    """Compute the WCAG 2 contrast ratio of two colors.
+
+    Args:
+        foreground (str): Hex color.
+        background (str): Hex color.
+
+    Returns:
+        float: Ratio from 1 to 21; the order of the colors does not matter.
+    """
+    lighter, darker = sorted(
+        (relative_luminance(foreground), relative_luminance(background)),
+        reverse=True,
+    )
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def wcag_level(ratio: float) -> str:
+    """Get the best WCAG 2 conformance level a contrast ratio reaches.
+
+    Args:
+        ratio (float): Contrast ratio.
+
+    Returns:
+        str: One of :data:`WCAG_LEVELS`, or ``fail``.
+    """
+    for level, minimum in WCAG_LEVELS.items():
+        if ratio >= minimum:
+            return level
+    return "fail"
+
+
+def contrast_report() -> dict[str, object]:
+    """Compute the contrast of every token role against the background.
+
+    Returns:
+        dict[str, object]: The thresholds of :data:`WCAG_LEVELS`, then, per
+        variant, the background color, the color, contrast ratio and level
+        of every role used by :data:`TOKEN_ROLES`, the lowest ratio and the
+        role of every token type.
+    """
+    used = {role for role, _ in TOKEN_ROLES.values()}
+    report: dict[str, object] = {"thresholds": WCAG_LEVELS}
+    for variant in VARIANTS:
+        palette = PALETTE[variant]
+        background = palette[BACKGROUND_ROLE]
+        roles = {}
+        for role in ROLES:
+            if role in used:
+                ratio = round(contrast_ratio(palette[role], background), 2)
+                roles[role] = {
+                    "color": palette[role],
+                    "contrast": ratio,
+                    "level": wcag_level(ratio),
+                }
+        report[variant] = {
+            "background": background,
+            "roles": roles,
+            "minimum_contrast": min(role["contrast"] for role in roles.values()),
+            "tokens": {token: role for token, (role, _) in TOKEN_ROLES.items()},
+        }
+    return report
+
+
+#: OKLab coordinates of the 256 xterm colors.
+XTERM256_OKLAB: tuple[tuple[float, float, float], ...] = tuple(
+    srgb_to_oklab(rgb) for rgb in XTERM256
+)
+
+
+def oklab_distance(lab: tuple[float, float, float], index: int) -> float:
+    """Compute the squared perceptual distance to an xterm color.
+
+    Args:
+        lab (tuple[float, float, float]): OKLab color.
+        index (int): Index into :data:`XTERM256`.
+
+    Returns:
+        float: Squared Euclidean distance in OKLab.
+    """
+    return sum((x - y) ** 2 for x, y in zip(lab, XTERM256_OKLAB[index]))
+
+
+def closest_xterm256(color: str) -> int:
+    """Find the perceptually closest of the fixed 256-color palette entries.
+
+    The 16 basic colors are left out: terminals remap them to their own
+    theme, so only the color cube and the gray ramp have known values.
+    Unlike ``Terminal256Formatter``, which compares RGB values, the search
+    is done in OKLab.
+
+    Args:
+        color (str): Hex color.
+
+    Returns:
+        int: Index into :data:`XTERM256`, from 16 to 255.
+    """
+    lab = srgb_to_oklab(hex_to_rgb(color))
+    return min(range(16, 256), key=lambda index: oklab_distance(lab, index))
+
+
+def closest_ansi16(color: str) -> int:
+    """Find the closest of the 16 basic terminal colors.
+
+    Since terminals remap the basic colors to their own theme, keeping the
+    hue matters more than matching exact values: colors with a noticeable
+    OKLab chroma go to the basic color of closest hue, normal or bright,
+    whichever is perceptually closer. Other colors go to the closest gray.
+
+    Args:
+        color (str): Hex color.
+
+    Returns:
+        int: Index of the closest color in :data:`ANSI16`.
+    """
+    lab = srgb_to_oklab(hex_to_rgb(color))
+    if math.hypot(lab[1], lab[2]) < CHROMA_THRESHOLD:
+        return min(ANSI16_GRAYS, key=lambda index: oklab_distance(lab, index))
+    hue = math.atan2(lab[2], lab[1])
+
+    def hue_distance(index: int) -> float:
+        _, a, b = XTERM256_OKLAB[index]
+        return abs((math.atan2(b, a) - hue + math.pi) % math.tau - math.pi)
+
+    normal = min(range(1, 7), key=hue_distance)
+    return min((normal, normal + 8), key=lambda index: oklab_distance(lab, index))
+
+
+def ansi16_escapes(style: StyleMeta) -> dict[str, tuple[str, str]]:
+    """Compute 16-color SGR sequences for every token type of a style.
+
+    Args:
+        style (StyleMeta): Style to convert.
+
+    Returns:
+        dict[str, tuple[str, str]]: ``(on, off)`` pairs keyed by token name.
+    """
+    escapes = {}
+    for ttype, ndef in style:
+        on, off = [], []
+        if ndef["color"]:
+            index = closest_ansi16(ndef["color"])
+            on.append(str(30 + index if index < 8 else 82 + index))
+            off.append("39")
+        if ndef["bgcolor"]:
+            index = closest_ansi16(ndef["bgcolor"])
+            on.append(str(40 + index if index < 8 else 92 + index))
+            off.append("49")
+        if ndef["bold"]:
+            on.append("01")
+        if ndef["underline"]:
+            on.append("04")
+        if ndef["italic"]:
+            on.append("03")
+        if ndef["bold"] or ndef["underline"] or ndef["italic"]:
+            off.append("00")
+        escapes[str(ttype)] = (
+            f"\x1b[{';'.join(on)}m" if on else "",
+            f"\x1b[{';'.join(off)}m" if off else "",
+        )
+    return escapes
+
+
+def ansi256_escapes(style: StyleMeta) -> dict[str, tuple[str, str]]:
+    """Compute 256-color SGR sequences for every token type of a style.
+
+    The sequences are built the same way as in ``Terminal256Formatter``,
+    but with colors picked by :func:`closest_xterm256`.
+
+    Args:
+        style (StyleMeta): Style to convert.
+
+    Returns:
+        dict[str, tuple[str, str]]: ``(on, off)`` pairs keyed by token name.
+    """
+    escapes = {}
+    for ttype, ndef in style:
+        escape = EscapeSequence(
+            fg=closest_xterm256(ndef["color"]) if ndef["color"] else None,
+            bg=closest_xterm256(ndef["bgcolor"]) if ndef["bgcolor"] else None,
+            bold=ndef["bold"],
+            underline=ndef["underline"],
+            italic=ndef["italic"],
+        )
+        escapes[str(ttype)] = (escape.color_string(), escape.reset_string())
+    return escapes
+
+
+def terminal_escapes() -> dict[str, dict[str, dict[str, tuple[str, str]]]]:
+    """Compute the SGR tables for every variant and color depth.
+
+    The true color table comes straight from ``TerminalTrueColorFormatter``,
+    so it is byte-identical to what the formatter would build at runtime.
+    The 256-color and 16-color tables use perceptual color matching.
+
+    Returns:
+        dict[str, dict[str, dict[str, tuple[str, str]]]]: Tables keyed by
+        variant, then by depth (``truecolor``, ``256`` or ``16``).
+    """
+    return {
+        variant: {
+            "truecolor": TerminalTrueColorFormatter(style=style).style_string,
+            "256": ansi256_escapes(style),
+            "16": ansi16_escapes(style),
+        }
+        for variant, style in ((name, parse_style(name)) for name in VARIANTS)
+    }
+
+
+def quantized() -> dict[str, dict[str, tuple[int, int]]]:
+    """Map every palette color to its closest 256-color and 16-color index.
+
+    Returns:
+        dict[str, dict[str, tuple[int, int]]]: ``(256-color, 16-color)``
+        index pairs keyed by variant, then by lowercase ``#rrggbb`` color.
+    """
+    return {
+        variant: {
+            color: (closest_xterm256(color), closest_ansi16(color))
+            for color in sorted(set(PALETTE[variant].values()))
+        }
+        for variant in VARIANTS
+    }
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Args:
+        css (str): Stylesheet as produced by ``HtmlFormatter``.
+
+    Returns:
+        str: Minified stylesheet.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def stylesheets() -> dict[str, bytes]:
+    """Render the minified class-based stylesheet of every variant.
+
+    Returns:
+        dict[str, bytes]: UTF-8 encoded CSS for the ``.highlight`` class,
+        keyed by variant.
+    """
+    return {
+        variant: minify_css(
+            HtmlFormatter(style=parse_style(variant)).get_style_defs(".highlight")
+        ).encode("utf-8")
+        for variant in VARIANTS
+    }
+
+
+def inline_styles() -> dict[str, dict[str, str]]:
+    """Collect the inline ``style`` attribute of every token type.
+
+    Returns:
+        dict[str, dict[str, str]]: Inline CSS keyed by variant, then by token
+        name. Token types without any style are left out.
+    """
+    styles = {}
+    for variant in VARIANTS:
+        formatter = HtmlFormatter(style=parse_style(variant))
+        styles[variant] = {
+            str(ttype): css for css, ttype, _ in formatter.class2style.values() if css
+        }
+    return styles
+
+
+def etags(sheets: dict[str, bytes]) -> dict[str, str]:
+    """Compute a strong HTTP ``ETag`` for every stylesheet.
+
+    Args:
+        sheets (dict[str, bytes]): Stylesheets keyed by variant.
+
+    Returns:
+        dict[str, str]: Quoted entity tags keyed by variant.
+    """
+    return {
+        variant: f'"{hashlib.sha256(css).hexdigest()[:32]}"'
+        for variant, css in sheets.items()
+    }
+
+
+def sections() -> Iterator[tuple[str, object]]:
+    """Yield every ``(constant name, value)`` pair of the generated module.
+
+    Yields:
+        tuple[str, object]: Constant name and its value.
+    """
+    yield "TERMINAL_ESCAPES", terminal_escapes()
+    yield "QUANTIZED", quantized()
+    sheets = stylesheets()
+    yield "STYLESHEETS", sheets
+    yield "STYLESHEET_ETAGS", etags(sheets)
+    yield "INLINE_STYLES", inline_styles()
+
+
+def token_slots() -> dict[_TokenType, int]:
+    """Map every token type of the styles to its style slot.
+
+    Returns:
+        dict[_TokenType, int]: Index into :data:`STYLE_SLOTS` of every token
+        type, in the order ``StyleMeta`` lists them.
+    """
+    return {ttype: token_slot(ttype) for ttype in parse_style(VARIANTS[0])._styles}
+
+
+def slot_styles() -> dict[str, tuple[tuple[object, ...], ...]]:
+    """Collect the ``StyleMeta`` parse of every style slot.
+
+    Returns:
+        dict[str, tuple[tuple[object, ...], ...]]: ``_styles`` entry of
+        every slot, keyed by variant.
+    """
+    styles = {}
+    for variant in VARIANTS:
+        slots: dict[int, tuple[object, ...]] = {}
+        for ttype, ndef in parse_style(variant)._styles.items():
+            slots.setdefault(token_slot(ttype), tuple(ndef))
+        styles[variant] = tuple(slots[slot] for slot in range(len(STYLE_SLOTS)))
+    return styles
+
+
+def definition_sections() -> Iterator[tuple[str, object]]:
+    """Yield the ``(constant name, value)`` pairs of the definitions module.
+
+    Yields:
+        tuple[str, object]: Constant name and its value.
+    """
+    yield "TOKEN_SLOTS", token_slots()
+    yield "SLOT_STYLES", slot_styles()
+
+
+def literal(value: object, indent: int = 0) -> str:
+    """Render a constant as Python source, one mapping entry per line.
+
+    Args:
+        value (object): Constant built from dicts, tuples, strings and numbers.
+        indent (int): Current indentation level. Defaults to 0.
+
+    Returns:
+        str: Python source for ``value``.
+    """
+    if not isinstance(value, dict) or not value:
+        return repr(value)
+    pad = "    " * (indent + 1)
+    lines = [f"{pad}{key!r}: {literal(val, indent + 1)}," for key, val in value.items()]
+    return "{\n" + "\n".join(lines) + "\n" + "    " * indent + "}"
+
+
+def render(
+    source: Callable[[], Iterator[tuple[str, object]]] = sections,
+    title: str = "Precomputed Rose Pine tables.",
+    imports: str = "",
+) -> str:
+    """Render the source of a generated module.
+
+    Args:
+        source (Callable[[], Iterator[tuple[str, object]]]): Function
+            yielding its constants. Defaults to :func:`sections`.
+        title (str): First line of its docstring.
+        imports (str): Import statements the constants need.
+
+    Returns:
+        str: Python source code.
+    """
+    parts = [HEADER.format(title=title) + imports]
+    for name, value in source():
+        parts.append(f"{name} = {literal(value)}\n")
+    return "\n".join(parts)
+
+
+def render_definitions() -> str:
+    """Render the source of the pre-parsed definitions module.
+
+    Returns:
+        str: Python source code.
+    """
+    return render(
+        definition_sections,
+        "Pre-parsed Rose Pine style definitions.",
+        "from pygments.token import Token\n",
+    )
+
+
+def render_report() -> str:
+    """Render the contrast report as JSON.
+
+    Returns:
+        str: JSON document, see :func:`contrast_report`.
+    """
+    return json.dumps(contrast_report(), indent=2) + "\n"
+
+
+def main() -> None:
+    """Validate the definitions, then write the generated files."""
+    validate()
+    TABLES_PATH.write_text(render(), encoding="utf-8")
+    DEFINITIONS_PATH.write_text(render_definitions(), encoding="utf-8")
+    REPORT_PATH.parent.mkdir(exist_ok=True)
+    REPORT_PATH.write_text(render_report(), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
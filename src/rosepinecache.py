@@ -0,0 +1,256 @@
+"""On-disk cache of rendered output, addressed by content.
+
+Highlighting the same code with the same lexer, style and formatter
+options always gives the same output, so :class:`RenderCache` stores it
+under a hash of all of these. Entries are zlib-compressed files, read back
+through ``mmap``; the cache survives process restarts and evicts the least
+recently used entries once it grows past its size limit::
+
+    cache = RenderCache("~/.cache/rose-pine")
+    html = cache.highlight(code, PythonLexer(), HtmlFormatter(style=style))
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.style import StyleMeta
+
+from rosepinemetrics import active, highlight
+
+#: Default size limit of a cache, in bytes of compressed output.
+MAX_SIZE: int = 256 * 1024 * 1024
+
+#: Suffix of the entry files.
+SUFFIX: str = ".z"
+
+# First byte of an entry: whether the output was text or encoded bytes.
+_TEXT, _BYTES = b"s", b"b"
+
+
+@lru_cache(maxsize=None)
+def style_fingerprint(style: StyleMeta) -> str:
+    """Identify a style class by its name and definitions.
+
+    Including the definitions means that cached output is not reused once
+    the palette of a style changes.
+
+    Args:
+        style (StyleMeta): Any Pygments style class.
+
+    Returns:
+        str: Qualified class name and a hash of its definitions, e.g.
+        ``rosepinemoon.RosePineMoonStyle:1f0c...``.
+    """
+    rules = sorted((str(token), rule) for token, rule in style.styles.items())
+    colors = (style.background_color, style.highlight_color)
+    digest = hashlib.sha256(repr((*colors, rules)).encode()).hexdigest()
+    return f"{style.__module__}.{style.__qualname__}:{digest[:16]}"
+
+
+def _class_name(instance: object) -> str:
+    cls = type(instance)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def render_key(code: str, lexer: Lexer, formatter: Formatter) -> str:
+    """Compute the cache key of a rendering.
+
+    Args:
+        code (str): Source code.
+        lexer (Lexer): Lexer, identified by its class, options and filters
+            with their options.
+        formatter (Formatter): Formatter, identified by its class, style and
+            options.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    options = {k: v for k, v in formatter.options.items() if k != "style"}
+    meta = (
+        _class_name(lexer),
+        sorted(lexer.options.items()),
+        [(_class_name(f), sorted(f.options.items())) for f in lexer.filters],
+        _class_name(formatter),
+        style_fingerprint(formatter.style),
+        sorted(options.items()),
+    )
+    digest = hashlib.sha256(repr(meta).encode())
+    digest.update(b"\0")
+    digest.update(code.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Content-addressed store of rendered output.
+
+    The recency order is kept in memory and rebuilt from the files'
+    modification times when a cache is opened, so it carries over between
+    processes. Several processes may share a directory; each one only
+    accounts for the entries it has seen when enforcing the size limit.
+
+    Args:
+        directory (Union[str, os.PathLike]): Where to keep the entries.
+        max_size (int): Size limit, in bytes of compressed output.
+            Defaults to :data:`MAX_SIZE`.
+        level (int): zlib compression level. Defaults to 6.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_size: int = MAX_SIZE,
+        level: int = 6,
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Index the entries already on disk, oldest first."""
+        found = []
+        for path in self.directory.glob(f"*/*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / (key + SUFFIX)
+
+    @property
+    def size(self) -> int:
+        """Total size of the known entries, in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        """Look up a rendering.
+
+        Args:
+            key (str): Key from :func:`render_key`.
+
+        Returns:
+            Optional[Union[str, bytes]]: Cached output, or ``None``.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle, mmap.mmap(
+                handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as view:
+                kind, size = view[:1], len(view)
+                data = zlib.decompress(view[1:])
+            os.utime(path)  # Keeps the recency order across restarts.
+        except (OSError, ValueError, zlib.error):
+            # Missing (e.g. evicted by another process), empty or corrupt.
+            self._forget(key)
+            self.misses += 1
+            self._count("cache_misses")
+            return None
+        self._forget(key)
+        self._entries[key] = size
+        self._size += size
+        self.hits += 1
+        self._count("cache_hits")
+        return data.decode("utf-8") if kind == _TEXT else data
+
+    def put(self, key: str, output: Union[str, bytes]) -> None:
+        """Store a rendering, evicting old entries if needed.
+
+        Outputs larger than the whole cache once compressed are not stored.
+
+        Args:
+            key (str): Key from :func:`render_key`.
+            output (Union[str, bytes]): Output of ``pygments.highlight``.
+        """
+        if isinstance(output, str):
+            blob = _TEXT + zlib.compress(output.encode("utf-8"), self.level)
+        else:
+            blob = _BYTES + zlib.compress(output, self.level)
+        if len(blob) > self.max_size:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp.")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._forget(key)
+        self._entries[key] = len(blob)
+        self._size += len(blob)
+        self._evict()
+
+    @staticmethod
+    def _count(name: str) -> None:
+        metrics = active()
+        if metrics is not None:
+            metrics.count(name)
+
+    def _forget(self, key: str) -> None:
+        self._size -= self._entries.pop(key, 0)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits."""
+        while self._size > self.max_size:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Delete every known entry."""
+        while self._entries:
+            key, _ = self._entries.popitem()
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+        self._size = 0
+
+    def highlight(
+        self, code: str, lexer: Lexer, formatter: Formatter
+    ) -> Union[str, bytes]:
+        """Highlight code like ``pygments.highlight``, going through the cache.
+
+        Args:
+            code (str): Source code.
+            lexer (Lexer): Lexer to use.
+            formatter (Formatter): Formatter to use.
+
+        Returns:
+            Union[str, bytes]: Output, as ``pygments.highlight`` returns it.
+        """
+        key = render_key(code, lexer, formatter)
+        output = self.get(key)
+        if output is None:
+            output = highlight(code, lexer, formatter)
+            self.put(key, output)
+        return output
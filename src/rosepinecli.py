@@ -0,0 +1,295 @@
+"""``rose-pine-highlight``: highlight whole directory trees in parallel.
+
+Files are spread across a process pool. Each worker builds its formatter
+once and keeps one lexer instance per lexer class, so the per-file cost is
+only lexing and formatting. Results are written atomically next to their
+relative path in the output directory, and the run ends with a throughput
+report::
+
+    rose-pine-highlight src/ build/html --style rose-pine-dawn --format html
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import pygments
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.lexers import find_lexer_class_for_filename
+from pygments.util import ClassNotFound
+
+from rosepinepalette import VARIANTS
+from rosepineterm import TERMINAL_FORMATS, formatter_for
+
+
+class Result(NamedTuple):
+    """Outcome of highlighting a single file."""
+
+    path: Path
+    bytes_in: int
+    bytes_out: int
+    error: Optional[str] = None
+
+
+# Per-process state, set up once by ``init_worker``.
+_formatter: Optional[Formatter] = None
+_lexers: dict[type, Lexer] = {}
+
+
+def make_formatter(
+    variant: str,
+    fmt: str,
+    options: dict[str, Any],
+) -> Formatter:
+    """Build the formatter for a variant and output format.
+
+    Args:
+        variant (str): Rose Pine variant name.
+        fmt (str): Pygments formatter alias, e.g. ``html`` or ``terminal16m``.
+        options (dict[str, Any]): Extra formatter options.
+
+    Returns:
+        Formatter: Formatter encoding its output as UTF-8.
+    """
+    return formatter_for(variant, fmt, **{**options, "encoding": "utf-8"})
+
+
+def output_suffix(formatter: Formatter) -> str:
+    """Get the file suffix for a formatter's output.
+
+    Formatters extending a stock one without claiming its filenames, like
+    ``RosePineHtmlFormatter``, get the suffix of the stock formatter.
+
+    Args:
+        formatter (Formatter): Formatter in use.
+
+    Returns:
+        str: Suffix of the first filename pattern of the formatter or of the
+        closest class it extends that has one, or ``.txt``.
+    """
+    for cls in type(formatter).__mro__:
+        filenames = vars(cls).get("filenames")
+        if filenames:
+            return filenames[0].lstrip("*")
+    return ".txt"
+
+
+def init_worker(variant: str, fmt: str, options: dict[str, Any]) -> None:
+    """Set up the formatter shared by every file of a worker.
+
+    Args:
+        variant (str): Rose Pine variant name.
+        fmt (str): Pygments formatter alias.
+        options (dict[str, Any]): Extra formatter options.
+    """
+    global _formatter
+    _formatter = make_formatter(variant, fmt, options)
+    _lexers.clear()
+
+
+def lexer_for(path: Path, code: str) -> Lexer:
+    """Get the worker's lexer instance for a file.
+
+    Args:
+        path (Path): File being highlighted.
+        code (str): Its content, used to disambiguate lexers.
+
+    Returns:
+        Lexer: Cached lexer instance.
+
+    Raises:
+        ClassNotFound: If no lexer handles the file.
+    """
+    cls = find_lexer_class_for_filename(path.name, code)
+    if cls is None:
+        raise ClassNotFound(f"no lexer for filename {path.name!r}")
+    if cls not in _lexers:
+        _lexers[cls] = cls()
+    return _lexers[cls]
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers never see it half written.
+
+    The file keeps the permissions of the file it replaces, or gets those
+    of a newly created file, instead of the private ones of the temporary
+    file.
+
+    Args:
+        path (Path): Destination.
+        data (bytes): Content.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def highlight_file(source: Path, destination: Path) -> Result:
+    """Highlight one file with the worker's formatter.
+
+    Args:
+        source (Path): File to highlight.
+        destination (Path): Output path, without the format suffix.
+
+    Returns:
+        Result: Sizes read and written, or the error that occurred.
+    """
+    assert _formatter is not None, "init_worker() was not called"  # noqa: S101
+    try:
+        data = source.read_bytes()
+        code = data.decode("utf-8", errors="replace")
+        output = pygments.highlight(code, lexer_for(source, code), _formatter)
+        suffix = output_suffix(_formatter)
+        write_atomic(destination.with_name(destination.name + suffix), output)
+    except (OSError, ClassNotFound) as error:
+        return Result(source, 0, 0, str(error))
+    return Result(source, len(data), len(output))
+
+
+def iter_files(root: Path, pattern: str) -> Iterator[Path]:
+    """List the files to highlight, skipping hidden files and directories.
+
+    Args:
+        root (Path): Directory tree to walk.
+        pattern (str): Glob pattern the file names must match.
+
+    Yields:
+        Path: Files, in a stable order.
+    """
+    for path in sorted(root.rglob(pattern)):
+        relative = path.relative_to(root)
+        hidden = any(part.startswith(".") for part in relative.parts)
+        if path.is_file() and not hidden:
+            yield path
+
+
+def parse_options(values: Sequence[str]) -> dict[str, Any]:
+    """Parse ``-O`` formatter options, like ``pygmentize`` does.
+
+    Args:
+        values (Sequence[str]): Comma-separated ``key=value`` lists.
+
+    Returns:
+        dict[str, Any]: Options; keys without a value are set to ``True``.
+    """
+    options: dict[str, Any] = {}
+    for value in values:
+        for item in filter(None, (part.strip() for part in value.split(","))):
+            key, sep, val = item.partition("=")
+            options[key] = val if sep else True
+    return options
+
+
+def parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Parse the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments, ``sys.argv`` by default.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rose-pine-highlight",
+        description="Highlight a directory tree with a Rose Pine style.",
+    )
+    parser.add_argument("source", type=Path, help="directory to highlight")
+    parser.add_argument("output", type=Path, help="directory to write to")
+    parser.add_argument(
+        "-s", "--style", choices=VARIANTS, default="rose-pine", help="variant"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        default="html",
+        help=f"Pygments formatter alias (default: html), or one of "
+        f"{', '.join(TERMINAL_FORMATS)}",
+    )
+    parser.add_argument(
+        "-O",
+        dest="options",
+        action="append",
+        default=[],
+        metavar="OPTIONS",
+        help="formatter options, e.g. full,linenos=table",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes",
+    )
+    parser.add_argument("-g", "--glob", default="*", help="file name pattern")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run ``rose-pine-highlight``.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments, ``sys.argv`` by default.
+
+    Returns:
+        int: Exit status, 1 if any file could not be highlighted.
+    """
+    args = parse_args(argv)
+    options = parse_options(args.options)
+    try:
+        make_formatter(args.style, args.format, options)
+    except ClassNotFound as error:
+        print(f"rose-pine-highlight: {error}", file=sys.stderr)
+        return 2
+
+    files = list(iter_files(args.source, args.glob))
+    destinations = [args.output / p.relative_to(args.source) for p in files]
+    initargs = (args.style, args.format, options)
+
+    start = time.perf_counter()
+    if args.jobs <= 1:
+        init_worker(*initargs)
+        results = list(map(highlight_file, files, destinations))
+    else:
+        n = max(1, len(files) // (args.jobs * 4))
+        with ProcessPoolExecutor(
+            args.jobs, initializer=init_worker, initargs=initargs
+        ) as pool:
+            jobs = pool.map(highlight_file, files, destinations, chunksize=n)
+            results = list(jobs)
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    failed = [result for result in results if result.error]
+    for result in failed:
+        print(f"skipped {result.path}: {result.error}", file=sys.stderr)
+    done = len(results) - len(failed)
+    size = sum(result.bytes_in for result in results)
+    print(
+        f"highlighted {done} files ({size / 1e6:.2f} MB) in {elapsed:.2f}s: "
+        f"{done / elapsed:.1f} files/s, {size / 1e6 / elapsed:.2f} MB/s",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
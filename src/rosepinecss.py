@@ -0,0 +1,94 @@
+"""Pre-rendered CSS for serving the Rose Pine styles over HTTP.
+
+The stylesheets are rendered from ``HtmlFormatter.get_style_defs`` at build
+time (see ``rosepinebuild.py``), so workers can serve them without building
+a formatter. The same ``bytes`` object is returned on every call.
+"""
+
+from rosepinetables import INLINE_STYLES, STYLESHEET_ETAGS, STYLESHEETS
+
+#: CSS class the stylesheets are scoped to, as in ``HtmlFormatter``.
+CSS_CLASS: str = "highlight"
+
+#: ``Content-Type`` to serve the stylesheets with.
+CONTENT_TYPE: str = "text/css; charset=utf-8"
+
+
+def _check(variant: str) -> None:
+    if variant not in STYLESHEETS:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+
+
+def stylesheet(variant: str = "rose-pine") -> bytes:
+    """Get the minified stylesheet of a variant.
+
+    The rules are scoped to the ``.highlight`` class, which is the default
+    ``cssclass`` of ``HtmlFormatter``.
+
+    Args:
+        variant (str): Variant name. Defaults to ``rose-pine``.
+
+    Returns:
+        bytes: UTF-8 encoded CSS.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    _check(variant)
+    return STYLESHEETS[variant]
+
+
+def etag(variant: str = "rose-pine") -> str:
+    """Get the strong HTTP ``ETag`` of a variant's stylesheet.
+
+    Args:
+        variant (str): Variant name. Defaults to ``rose-pine``.
+
+    Returns:
+        str: Quoted entity tag, derived from the SHA-256 of the CSS.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    _check(variant)
+    return STYLESHEET_ETAGS[variant]
+
+
+def inline_styles(variant: str = "rose-pine") -> dict[str, str]:
+    """Get the inline ``style`` attribute of every styled token type.
+
+    These are the declarations ``HtmlFormatter`` inlines with
+    ``noclasses=True``. Token types missing from the mapping inherit the
+    declarations of their closest parent, see :func:`inline_style`.
+
+    Args:
+        variant (str): Variant name. Defaults to ``rose-pine``.
+
+    Returns:
+        dict[str, str]: CSS declarations keyed by token name, e.g.
+        ``Token.Keyword``.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    _check(variant)
+    return INLINE_STYLES[variant]
+
+
+def inline_style(variant: str, token: str) -> str:
+    """Get the inline ``style`` attribute of a token type.
+
+    Args:
+        variant (str): Variant name.
+        token (str): Token name, e.g. ``Token.Name.Builtin.Pseudo``.
+
+    Returns:
+        str: CSS declarations, or an empty string for unstyled tokens.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    styles = inline_styles(variant)
+    while token not in styles and "." in token:
+        token = token.rsplit(".", 1)[0]
+    return styles.get(token, "")
@@ -0,0 +1,97 @@
+"""Pre-parsed Rose Pine style definitions.
+
+This file is generated by ``rosepinebuild.py``. Do not edit it by hand.
+"""
+
+# flake8: noqa
+# fmt: off
+from pygments.token import Token
+
+TOKEN_SLOTS = {
+    Token: 0,
+    Token.Comment: 1,
+    Token.Error: 3,
+    Token.Keyword: 6,
+    Token.Keyword.Namespace: 6,
+    Token.Keyword.Constant: 5,
+    Token.Keyword.Type: 7,
+    Token.Name: 2,
+    Token.Name.Builtin: 2,
+    Token.Name.Builtin.Pseudo: 3,
+    Token.Name.Class: 7,
+    Token.Name.Decorator: 8,
+    Token.Name.Exception: 7,
+    Token.Name.Function: 3,
+    Token.Name.Variable: 2,
+    Token.Name.Variable.Magic: 3,
+    Token.Literal: 0,
+    Token.Literal.Number: 5,
+    Token.Operator: 6,
+    Token.Operator.Word: 6,
+    Token.Literal.String: 4,
+    Token.Literal.String.Affix: 6,
+    Token.Literal.String.Escape: 6,
+    Token.Literal.String.Interpol: 2,
+    Token.Text: 2,
+    Token.Punctuation: 1,
+    Token.Text.Whitespace: 2,
+    Token.Escape: 0,
+    Token.Other: 0,
+    Token.Keyword.Declaration: 6,
+    Token.Keyword.Pseudo: 6,
+    Token.Keyword.Reserved: 6,
+    Token.Name.Attribute: 2,
+    Token.Name.Constant: 2,
+    Token.Name.Entity: 2,
+    Token.Name.Function.Magic: 3,
+    Token.Name.Property: 2,
+    Token.Name.Label: 2,
+    Token.Name.Namespace: 2,
+    Token.Name.Other: 2,
+    Token.Name.Tag: 2,
+    Token.Name.Variable.Class: 2,
+    Token.Name.Variable.Global: 2,
+    Token.Name.Variable.Instance: 2,
+    Token.Literal.Date: 0,
+    Token.Literal.String.Backtick: 4,
+    Token.Literal.String.Char: 4,
+    Token.Literal.String.Delimiter: 4,
+    Token.Literal.String.Doc: 4,
+    Token.Literal.String.Double: 4,
+    Token.Literal.String.Heredoc: 4,
+    Token.Literal.String.Other: 4,
+    Token.Literal.String.Regex: 4,
+    Token.Literal.String.Single: 4,
+    Token.Literal.String.Symbol: 4,
+    Token.Literal.Number.Bin: 5,
+    Token.Literal.Number.Float: 5,
+    Token.Literal.Number.Hex: 5,
+    Token.Literal.Number.Integer: 5,
+    Token.Literal.Number.Integer.Long: 5,
+    Token.Literal.Number.Oct: 5,
+    Token.Punctuation.Marker: 1,
+    Token.Comment.Hashbang: 1,
+    Token.Comment.Multiline: 1,
+    Token.Comment.Preproc: 1,
+    Token.Comment.PreprocFile: 1,
+    Token.Comment.Single: 1,
+    Token.Comment.Special: 1,
+    Token.Generic: 0,
+    Token.Generic.Deleted: 0,
+    Token.Generic.Emph: 0,
+    Token.Generic.Error: 0,
+    Token.Generic.Heading: 0,
+    Token.Generic.Inserted: 0,
+    Token.Generic.Output: 0,
+    Token.Generic.Prompt: 0,
+    Token.Generic.Strong: 0,
+    Token.Generic.Subheading: 0,
+    Token.Generic.EmphStrong: 0,
+    Token.Generic.Traceback: 0,
+}
+
+SLOT_STYLES = {
+    'rose-pine': (('', 0, 0, 0, '', '', 0, 0, 0), ('908caa', 0, 0, 0, '', '', 0, 0, 0), ('e0def4', 0, 0, 0, '', '', 0, 0, 0), ('eb6f92', 0, 0, 0, '', '', 0, 0, 0), ('f6c177', 0, 0, 0, '', '', 0, 0, 0), ('ebbcba', 0, 0, 0, '', '', 0, 0, 0), ('31748f', 0, 0, 0, '', '', 0, 0, 0), ('9ccfd8', 0, 0, 0, '', '', 0, 0, 0), ('c4a7e7', 1, 0, 0, '', '', 0, 0, 0)),
+    'rose-pine-moon': (('', 0, 0, 0, '', '', 0, 0, 0), ('908caa', 0, 0, 0, '', '', 0, 0, 0), ('e0def4', 0, 0, 0, '', '', 0, 0, 0), ('eb6f92', 0, 0, 0, '', '', 0, 0, 0), ('f6c177', 0, 0, 0, '', '', 0, 0, 0), ('ea9a97', 0, 0, 0, '', '', 0, 0, 0), ('3e8fb0', 0, 0, 0, '', '', 0, 0, 0), ('9ccfd8', 0, 0, 0, '', '', 0, 0, 0), ('c4a7e7', 1, 0, 0, '', '', 0, 0, 0)),
+    'rose-pine-dawn': (('', 0, 0, 0, '', '', 0, 0, 0), ('797593', 0, 0, 0, '', '', 0, 0, 0), ('575279', 0, 0, 0, '', '', 0, 0, 0), ('b4637a', 0, 0, 0, '', '', 0, 0, 0), ('ea9d34', 0, 0, 0, '', '', 0, 0, 0), ('d7827e', 0, 0, 0, '', '', 0, 0, 0), ('286983', 0, 0, 0, '', '', 0, 0, 0), ('56949f', 0, 0, 0, '', '', 0, 0, 0), ('907aa9', 1, 0, 0, '', '', 0, 0, 0)),
+}
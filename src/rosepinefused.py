@@ -0,0 +1,197 @@
+"""Fused lexing and formatting of Python source in 24-bit color.
+
+``pygments.highlight(code, PythonLexer(), TerminalTrueColorFormatter(...))``
+runs a generator chain (the lexer loop, ``get_tokens``, the filters and
+the formatter loop) and looks up the escapes of every token by its type
+name, walking up the token hierarchy on a miss, while the lexer tries the
+rules of the current state one regular expression at a time.
+:func:`highlight_python` runs the ``RegexLexer`` loop of ``PythonLexer``
+itself, with the rules of each state joined into a single expression, and
+writes the escapes of each match as soon as it is found, from a table keyed
+by token type built from :data:`rosepinetables.TERMINAL_ESCAPES`::
+
+    output = highlight_python(code, "rose-pine-moon")
+
+The output is byte-identical to the generic pipeline with
+:class:`rosepineterm.RosePineTrueColorFormatter` (or the stock
+``TerminalTrueColorFormatter``) and a Rose Pine style.
+"""
+
+import re
+from functools import lru_cache
+from typing import IO, Any, Callable, Optional
+
+import pygments
+from pygments.lexers import PythonLexer
+from pygments.token import Error, Text, _TokenType
+
+from rosepinepalette import VARIANTS, write_escaped
+from rosepinetables import TERMINAL_ESCAPES
+from rosepineterm import formatter_for
+
+
+class _Escapes(dict):
+    """``(on, off)`` escapes by token type, resolved like the formatter."""
+
+    def __init__(self, table: dict[str, tuple[str, str]]) -> None:
+        super().__init__()
+        self.table = table
+
+    def __missing__(self, ttype: _TokenType) -> tuple[str, str]:
+        name = ttype
+        while str(name) not in self.table:
+            name = name.parent
+        self[ttype] = escapes = self.table[str(name)]
+        return escapes
+
+
+@lru_cache(maxsize=None)
+def _escapes(variant: str) -> _Escapes:
+    return _Escapes(TERMINAL_ESCAPES[variant]["truecolor"])
+
+
+# Global inline flags, only valid at the start of a pattern.
+_INLINE_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# The regular expression of a state and the rule of each of its groups.
+_State = tuple[Callable[[str, int], Optional[re.Match[str]]], dict[int, Any]]
+
+
+@lru_cache(maxsize=None)
+def _states(lexer_class: type) -> Optional[dict[str, _State]]:
+    """Join the rules of every state of a lexer into one expression.
+
+    An alternation tries its branches in order at the same position, just
+    as ``RegexLexer`` tries the rules of a state one after the other, so a
+    single match finds the same rule; ``lastindex`` tells which one. Rules
+    whose patterns cannot be joined (e.g. back-references, which would be
+    renumbered) leave the lexer to the generic pipeline.
+    """
+    states = {}
+    for state, rules in lexer_class._tokens.items():
+        branches = []
+        for index, (rexmatch, _, _) in enumerate(rules):
+            pattern = rexmatch.__self__.pattern
+            if re.search(r"\\[1-9]|\(\?P=|\(\?\(", pattern):
+                return None
+            flags = _INLINE_FLAGS.match(pattern)
+            if flags:
+                pattern = f"(?{flags.group(1)}:{pattern[flags.end():]})"
+            branches.append(f"(?P<_{index}>{pattern})")
+        try:
+            regex = re.compile("|".join(branches), lexer_class.flags)
+        except re.error:
+            return None
+        names = regex.groupindex
+        states[state] = (
+            regex.match,
+            {names[f"_{index}"]: rule for index, rule in enumerate(rules)},
+        )
+    return states
+
+
+@lru_cache(maxsize=None)
+def _lexer(options: tuple[tuple[str, Any], ...]) -> PythonLexer:
+    return PythonLexer(**dict(options))
+
+
+def highlight_python(
+    code: str,
+    variant: str = "rose-pine",
+    outfile: Optional[IO[str]] = None,
+    **options: Any,
+) -> Optional[str]:
+    """Highlight Python source in 24-bit color in a single pass.
+
+    Args:
+        code (str): Python source code.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        outfile (Optional[IO[str]]): Stream to write to instead of returning
+            the output.
+        **options (Any): ``PythonLexer`` options, with hashable values.
+            Lexers with filters go through the generic pipeline.
+
+    Returns:
+        Optional[str]: Output, unless ``outfile`` is given.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+    lexer = _lexer(tuple(sorted(options.items())))
+    if lexer.filters or _states(PythonLexer) is None:
+        formatter = formatter_for(variant, "terminal16m")
+        return pygments.highlight(code, lexer, formatter, outfile)
+    text = lexer._preprocess_lexer_input(code)
+    output = _format(lexer, text, _escapes(variant))
+    if outfile is None:
+        return output
+    outfile.write(output)
+    return None
+
+
+def _format(lexer: PythonLexer, text: str, escapes: _Escapes) -> str:
+    """Run the ``RegexLexer`` loop, writing escapes for every token."""
+    parts: list[str] = []
+    write = parts.append
+
+    def emit(ttype: _TokenType, value: str) -> None:
+        # ``TerminalTrueColorFormatter.format_unencoded`` for one token.
+        on, off = escapes[ttype]
+        write_escaped(write, value, on, off)
+
+    states = _states(type(lexer))
+    stack = ["root"]
+    match, rules = states["root"]
+    pos = 0
+    end = len(text)
+    while True:
+        m = match(text, pos)
+        if m is not None:
+            rexmatch, action, new_state = rules[m.lastindex]
+            if action is not None:
+                if type(action) is _TokenType:
+                    value = m.group(m.lastindex)
+                    if "\n" in value:
+                        emit(action, value)
+                    elif value:
+                        on, off = escapes[action]
+                        write(on + value + off)
+                else:
+                    # Callbacks expect the groups of their own rule.
+                    for _, ttype, value in action(lexer, rexmatch(text, pos)):
+                        emit(ttype, value)
+            pos = m.end()
+            if new_state is not None:
+                if type(new_state) is tuple:
+                    for state in new_state:
+                        if state == "#pop":
+                            if len(stack) > 1:
+                                stack.pop()
+                        elif state == "#push":
+                            stack.append(stack[-1])
+                        else:
+                            stack.append(state)
+                elif type(new_state) is int:
+                    if abs(new_state) >= len(stack):
+                        del stack[1:]
+                    else:
+                        del stack[new_state:]
+                elif new_state == "#push":
+                    stack.append(stack[-1])
+                else:
+                    raise ValueError(f"wrong state def: {new_state!r}")
+                match, rules = states[stack[-1]]
+        else:
+            if pos >= end:
+                break
+            if text[pos] == "\n":
+                # At EOL, reset state to "root", like RegexLexer does.
+                stack = ["root"]
+                match, rules = states["root"]
+                emit(Text.Whitespace, "\n")
+            else:
+                emit(Error, text[pos])
+            pos += 1
+    return "".join(parts)
@@ -0,0 +1,393 @@
+"""Golden-file tests of the output of every variant and format.
+
+The expected output of every variant, for every format in :data:`FORMATS`,
+is generated from a sample corpus and stored next to it: each file of the
+corpus is one sample, and so is every token role of
+:data:`rosepinepalette.TOKEN_ROLES`, formatted on its own. Adding a token
+role or a corpus file only takes regenerating the files::
+
+    python src/rosepinegolden.py            # verify against tests/golden
+    python src/rosepinegolden.py --update   # regenerate the golden files
+    python src/rosepinegolden.py --corpus ~/src --golden /tmp/golden -j 8
+
+The manifest (``manifest.json``) holds a digest of every sample and of
+every output; the outputs themselves are stored zlib-compressed, one file
+per variant and format, and only read to show what changed. Verification
+renders the samples in worker processes, one sample per task, and only
+compares digests.
+
+Like ``rosepinebuild.py``, this module is a development tool and is not
+shipped with the package.
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import pygments
+from pygments.formatter import Formatter
+from pygments.lexers import (
+    find_lexer_class_for_filename,
+    get_lexer_for_filename,
+)
+from pygments.token import _TokenType, string_to_tokentype
+
+from rosepinehtml import RosePineHtmlFormatter
+from rosepinepalette import TOKEN_ROLES, VARIANTS
+from rosepineterm import formatter_for
+
+#: Golden files checked by the tests.
+GOLDEN_PATH: Path = Path(__file__).parent.parent / "tests" / "golden"
+
+#: Sample corpus of the golden files.
+CORPUS_PATH: Path = GOLDEN_PATH / "corpus"
+
+#: Formats the output is generated for, by Pygments alias.
+FORMATS: tuple[str, ...] = (
+    "terminal16m",
+    "terminal256",
+    "terminal16",
+    "html",
+    "rose-pine-html",
+)
+
+#: Version of the layout of the golden files.
+VERSION: int = 1
+
+#: Name of the sample of every token role.
+ROLES_SAMPLE: str = "roles"
+
+#: Lines of difference shown per changed output.
+DIFF_LINES: int = 20
+
+# The outputs of a sample: variant/format, then key, to output.
+_Outputs = dict[str, dict[str, str]]
+
+
+def digest(text: str) -> str:
+    """Hash a sample or an output.
+
+    Args:
+        text (str): Text to hash.
+
+    Returns:
+        str: Hexadecimal BLAKE2b digest.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def make_formatter(variant: str, fmt: str) -> Formatter:
+    """Build the formatter of a variant for a golden format.
+
+    Args:
+        variant (str): Rose Pine variant name.
+        fmt (str): Format, see :data:`FORMATS`.
+
+    Returns:
+        Formatter: Formatter with its default options.
+    """
+    if fmt == "rose-pine-html":
+        return RosePineHtmlFormatter(style=variant)
+    return formatter_for(variant, fmt)
+
+
+def iter_samples(corpus: Path) -> Iterator[str]:
+    """List the samples of a corpus.
+
+    Args:
+        corpus (Path): Corpus directory.
+
+    Yields:
+        str: :data:`ROLES_SAMPLE`, then the path relative to the corpus of
+        every file that a lexer matches by name, in sorted order. Files are
+        read as UTF-8.
+    """
+    yield ROLES_SAMPLE
+    for path in sorted(corpus.rglob("*")):
+        if path.is_file() and find_lexer_class_for_filename(path.name):
+            yield path.relative_to(corpus).as_posix()
+
+
+def read_sample(corpus: Path, sample: str) -> str:
+    """Read the source of a sample.
+
+    Args:
+        corpus (Path): Corpus directory.
+        sample (str): Sample name, see :func:`iter_samples`.
+
+    Returns:
+        str: Source of the sample; for :data:`ROLES_SAMPLE`, the name of
+        every token role on its own line.
+    """
+    if sample == ROLES_SAMPLE:
+        return "".join(f"{token}\n" for token in TOKEN_ROLES)
+    return (corpus / sample).read_text(encoding="utf-8")
+
+
+def _role_tokens(token: str) -> list[tuple[_TokenType, str]]:
+    """Get the token stream of a token role, on its own line."""
+    return [(string_to_tokentype(token), token + "\n")]
+
+
+def render_sample(corpus: Path, sample: str) -> tuple[str, _Outputs]:
+    """Render a sample in every variant and format.
+
+    The file samples are lexed once with the lexer matching their name and
+    give one output each; the token role sample gives one output per role,
+    keyed ``roles/<token type>``.
+
+    Args:
+        corpus (Path): Corpus directory.
+        sample (str): Sample name, see :func:`iter_samples`.
+
+    Returns:
+        tuple[str, _Outputs]: Digest of the source of the sample, and the
+        outputs of every ``variant/format``, by key.
+    """
+    source = read_sample(corpus, sample)
+    if sample == ROLES_SAMPLE:
+        streams = {
+            f"{ROLES_SAMPLE}/{token}": _role_tokens(token)
+            for token in source.splitlines()
+        }
+    else:
+        lexer = get_lexer_for_filename(sample, source)
+        streams = {sample: list(lexer.get_tokens(source))}
+    outputs: _Outputs = {}
+    for variant in VARIANTS:
+        for fmt in FORMATS:
+            formatter = make_formatter(variant, fmt)
+            outputs[f"{variant}/{fmt}"] = {
+                key: pygments.format(tokens, formatter)
+                for key, tokens in streams.items()
+            }
+    return digest(source), outputs
+
+
+def digest_sample(corpus: Path, sample: str) -> tuple[str, _Outputs]:
+    """Render a sample like :func:`render_sample`, keeping output digests.
+
+    Args:
+        corpus (Path): Corpus directory.
+        sample (str): Sample name.
+
+    Returns:
+        tuple[str, _Outputs]: Digest of the source, and the digest of
+        every output.
+    """
+    source, outputs = render_sample(corpus, sample)
+    return source, {
+        case: {key: digest(output) for key, output in results.items()}
+        for case, results in outputs.items()
+    }
+
+
+def _run(
+    function: Any, corpus: Path, samples: list[str], jobs: int
+) -> list[tuple[str, _Outputs]]:
+    if jobs <= 1 or len(samples) <= 1:
+        return [function(corpus, sample) for sample in samples]
+    with ProcessPoolExecutor(min(jobs, len(samples))) as pool:
+        return list(pool.map(function, [corpus] * len(samples), samples))
+
+
+def _output_path(golden: Path, case: str) -> Path:
+    return golden / "outputs" / (case.replace("/", ".") + ".z")
+
+
+def generate(
+    corpus: Path = CORPUS_PATH, golden: Path = GOLDEN_PATH, jobs: int = 1
+) -> int:
+    """Write the golden files of a corpus.
+
+    Args:
+        corpus (Path): Corpus directory. Defaults to :data:`CORPUS_PATH`.
+        golden (Path): Directory of the golden files. Defaults to
+            :data:`GOLDEN_PATH`.
+        jobs (int): Worker processes. Defaults to 1.
+
+    Returns:
+        int: Number of outputs written.
+    """
+    samples = list(iter_samples(corpus))
+    results = _run(render_sample, corpus, samples, jobs)
+    sources = {sample: source for sample, (source, _) in zip(samples, results)}
+    merged: _Outputs = {}
+    for _, outputs in results:
+        for case, values in outputs.items():
+            merged.setdefault(case, {}).update(values)
+    manifest = {
+        "version": VERSION,
+        "samples": sources,
+        "outputs": {
+            case: {key: digest(output) for key, output in values.items()}
+            for case, values in merged.items()
+        },
+    }
+    (golden / "outputs").mkdir(parents=True, exist_ok=True)
+    for stale in (golden / "outputs").glob("*.z"):
+        stale.unlink()
+    for case, values in merged.items():
+        data = json.dumps(values, sort_keys=True, ensure_ascii=False)
+        _output_path(golden, case).write_bytes(zlib.compress(data.encode(), 9))
+    (golden / "manifest.json").write_text(
+        json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return sum(len(values) for values in merged.values())
+
+
+def load_outputs(golden: Path, case: str) -> dict[str, str]:
+    """Read the stored outputs of a variant and format.
+
+    Args:
+        golden (Path): Directory of the golden files.
+        case (str): ``variant/format``.
+
+    Returns:
+        dict[str, str]: Expected output by key.
+    """
+    return json.loads(zlib.decompress(_output_path(golden, case).read_bytes()))
+
+
+def _diff(expected: str, actual: str) -> str:
+    lines = difflib.unified_diff(
+        [repr(line) for line in expected.splitlines(keepends=True)],
+        [repr(line) for line in actual.splitlines(keepends=True)],
+        "expected",
+        "actual",
+        lineterm="",
+    )
+    shown = [line for _, line in zip(range(DIFF_LINES), lines)]
+    return "\n".join(shown)
+
+
+def verify(
+    corpus: Path = CORPUS_PATH, golden: Path = GOLDEN_PATH, jobs: int = 1
+) -> list[str]:
+    """Check a corpus against its golden files.
+
+    Outputs are compared by digest; the stored outputs are only read for
+    the ones that differ, to show the difference.
+
+    Args:
+        corpus (Path): Corpus directory. Defaults to :data:`CORPUS_PATH`.
+        golden (Path): Directory of the golden files. Defaults to
+            :data:`GOLDEN_PATH`.
+        jobs (int): Worker processes. Defaults to 1.
+
+    Returns:
+        list[str]: Description of every difference; empty if the output
+        matches.
+    """
+    text = (golden / "manifest.json").read_text(encoding="utf-8")
+    manifest = json.loads(text)
+    if manifest.get("version") != VERSION:
+        return [f"unknown golden files version: {manifest.get('version')!r}"]
+    samples = list(iter_samples(corpus))
+    problems = [
+        f"{sample}: not in the golden files"
+        for sample in samples
+        if sample not in manifest["samples"]
+    ]
+    problems += [
+        f"{sample}: missing from the corpus"
+        for sample in manifest["samples"]
+        if sample not in samples
+    ]
+    samples = [sample for sample in samples if sample in manifest["samples"]]
+    changed: dict[str, list[str]] = {}
+    for sample, (source, outputs) in zip(
+        samples, _run(digest_sample, corpus, samples, jobs)
+    ):
+        if source != manifest["samples"][sample]:
+            problems.append(f"{sample}: source changed since the golden files")
+            continue
+        for case, digests in outputs.items():
+            expected = manifest["outputs"].get(case, {})
+            keys = changed.setdefault(case, [])
+            keys += [k for k, v in digests.items() if expected.get(k) != v]
+    for case, keys in changed.items():
+        if keys:
+            problems += _describe(corpus, golden, case, keys)
+    return problems
+
+
+def _describe(
+    corpus: Path,
+    golden: Path,
+    case: str,
+    keys: list[str],
+) -> list[str]:
+    """Show how the outputs of some keys differ from the golden ones."""
+    path = _output_path(golden, case)
+    stored = load_outputs(golden, case) if path.exists() else {}
+    formatter = make_formatter(*case.split("/"))
+    problems = []
+    for key in keys:
+        if key not in stored:
+            problems.append(f"{case}: {key}: no golden output")
+            continue
+        diff = _diff(stored[key], _render_key(corpus, key, formatter))
+        problems.append(f"{case}: {key}: output changed\n{diff}")
+    return problems
+
+
+def _render_key(corpus: Path, key: str, formatter: Formatter) -> str:
+    if key.startswith(f"{ROLES_SAMPLE}/"):
+        tokens = _role_tokens(key.partition("/")[2])
+    else:
+        source = read_sample(corpus, key)
+        tokens = list(get_lexer_for_filename(key, source).get_tokens(source))
+    return pygments.format(tokens, formatter)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Verify or regenerate the golden files from the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments, ``sys.argv`` by default.
+
+    Returns:
+        int: Exit status, 1 if the output does not match.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--golden", type=Path, default=GOLDEN_PATH)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="regenerate the golden files"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.update:
+        count = generate(args.corpus, args.golden, args.jobs)
+        elapsed = time.perf_counter() - start
+        print(f"wrote {count} outputs to {args.golden} in {elapsed:.2f}s")
+        return 0
+    problems = verify(args.corpus, args.golden, args.jobs)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    count = len(problems)
+    print(f"verified {args.corpus} in {elapsed:.2f}s: {count} differences")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
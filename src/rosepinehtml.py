@@ -0,0 +1,184 @@
+"""Compact HTML output with one-letter classes shared by every variant.
+
+``HtmlFormatter`` gives each token type its own class (``nf``, ``kn``,
+``s2`` ...) and, with ``noclasses=True``, inlines a ``style`` attribute on
+every span, so the markup ends up several times the size of the source.
+:class:`RosePineHtmlFormatter` instead gives every style slot (see
+:data:`rosepinepalette.STYLE_SLOTS`) a one-letter class, leaves text in
+the default color unwrapped, and joins adjacent tokens of the same slot
+into one span. The classes are the same for every variant, so a page can
+switch themes by swapping its :func:`stylesheet`::
+
+    formatter = RosePineHtmlFormatter(style="rose-pine-moon")
+    html = pygments.highlight(code, lexer, formatter)
+    css = stylesheet("rose-pine-moon")
+"""
+
+import string
+from functools import lru_cache
+from typing import Any
+
+from pygments.formatters import HtmlFormatter
+from pygments.style import StyleMeta
+from pygments.token import Text, Token, _TokenType
+
+from rosepinepalette import STYLE_SLOTS, VARIANTS, build_style, token_slot
+from rosepineroles import slot_token
+
+#: Slot of the default text color, set on the container instead of spans.
+TEXT_SLOT: int = token_slot(Text)
+
+# Text nodes only need these escaped; quotes are left alone.
+_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+#: Class of every style slot; empty for unstyled and default-color text.
+SLOT_CLASSES: tuple[str, ...] = tuple(
+    (
+        ""
+        if slot in (0, TEXT_SLOT)
+        else string.ascii_lowercase[slot - 1 - (slot > TEXT_SLOT)]
+    )
+    for slot in range(len(STYLE_SLOTS))
+)
+
+
+def _declarations(style: StyleMeta, ttype: _TokenType) -> list[str]:
+    """List the CSS declarations of a token type, as ``HtmlFormatter`` does."""
+    ndef = style.style_for_token(ttype)
+    parts = []
+    if ndef["color"]:
+        parts.append(f"color: #{ndef['color']}")
+    if ndef["bold"]:
+        parts.append("font-weight: bold")
+    if ndef["italic"]:
+        parts.append("font-style: italic")
+    if ndef["underline"]:
+        parts.append("text-decoration: underline")
+    if ndef["bgcolor"]:
+        parts.append(f"background-color: #{ndef['bgcolor']}")
+    return parts
+
+
+def _minified(declarations: list[str]) -> str:
+    return ";".join(d.replace(": ", ":") for d in declarations)
+
+
+@lru_cache(maxsize=None)
+def stylesheet(variant: str = "rose-pine", cssclass: str = "highlight") -> str:
+    """Get the minified stylesheet shared by every page of a variant.
+
+    Args:
+        variant (str): Variant name. Defaults to ``rose-pine``.
+        cssclass (str): Class of the container, as the ``cssclass`` option
+            of the formatter. Defaults to ``highlight``.
+
+    Returns:
+        str: CSS rules for the container and every slot class.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+    return stylesheet_for(build_style(variant), cssclass)
+
+
+def stylesheet_for(style: StyleMeta, cssclass: str = "highlight") -> str:
+    """Render the minified stylesheet of any style using the token roles.
+
+    Unlike :func:`stylesheet`, the result is not cached, e.g. for styles
+    derived with :mod:`rosepinetransform`.
+
+    Args:
+        style (StyleMeta): Style class.
+        cssclass (str): Class of the container. Defaults to ``highlight``.
+
+    Returns:
+        str: CSS rules for the container and every slot class.
+    """
+    text = _minified(_declarations(style, Text))
+    rules = [f".{cssclass}{{background:{style.background_color};{text}}}"]
+    for slot, name in enumerate(SLOT_CLASSES):
+        if name:
+            declarations = _minified(_declarations(style, slot_token(slot)))
+            rules.append(f".{cssclass} .{name}{{{declarations}}}")
+    return "".join(rules)
+
+
+class _Openers(dict):
+    """Span opening tags by token type, with unquoted one-letter classes."""
+
+    def __init__(self, classprefix: str) -> None:
+        super().__init__()
+        self.classprefix = classprefix
+
+    def __missing__(self, ttype: _TokenType) -> str:
+        name = SLOT_CLASSES[token_slot(ttype)]
+        opener = f"<span class={self.classprefix}{name}>" if name else ""
+        self[ttype] = opener
+        return opener
+
+
+class RosePineHtmlFormatter(HtmlFormatter):
+    """``HtmlFormatter`` writing one-letter slot classes.
+
+    Takes the options of ``HtmlFormatter``. ``get_style_defs`` returns the
+    rules of the slot classes, so ``full`` and ``cssfile`` keep working.
+    Class names are written without quotes and only ``&``, ``<`` and ``>``
+    are escaped, both of which are valid HTML5. With ``noclasses``, the
+    default text color is set on the container, so with ``nowrap`` too the
+    enclosing element has to set it.
+
+    Options accepted besides those of ``HtmlFormatter``:
+
+    ``style`` : string or style class
+        Rose Pine variant name, or its style class. Defaults to
+        ``rose-pine``.
+    """
+
+    name = "RosePineHTML"
+    aliases = ["rose-pine-html"]
+    filenames: list[str] = []
+
+    def __init__(self, **options: Any) -> None:
+        style = options.get("style", "rose-pine")
+        if isinstance(style, str):
+            if style not in VARIANTS:
+                raise ValueError(f"unknown Rose Pine variant: {style!r}")
+            options["style"] = build_style(style)
+        super().__init__(**options)
+        if self.noclasses:
+            # Text in the default color is not wrapped in spans, so its color
+            # goes on the container, before any user ``cssstyles``.
+            styles = _declarations(self.style, Text)
+            if self.cssstyles:
+                styles.append(self.cssstyles)
+            self.cssstyles = "; ".join(styles)
+        elif not self.debug_token_types:
+            self.span_element_openers = _Openers(self.classprefix)
+
+    def _get_css_classes(self, ttype: _TokenType) -> str:
+        name = SLOT_CLASSES[token_slot(ttype)]
+        return self.classprefix + name if name else ""
+
+    def _get_css_class(self, ttype: _TokenType) -> str:
+        return self._get_css_classes(ttype)
+
+    @lru_cache(maxsize=100)  # As in ``HtmlFormatter``.
+    def _translate_parts(self, value: str) -> list[str]:
+        return value.translate(_ESCAPES).split("\n")
+
+    def _create_stylesheet(self) -> None:
+        # ``ttype2class`` and ``class2style`` drive ``get_style_defs`` and
+        # ``noclasses``; the "level" sorts the rules in slot order.
+        self.ttype2class = {Token: ""}
+        text = "; ".join(_declarations(self.style, Text))
+        self.class2style = {"": (text, Text, 0)}
+        for slot in range(len(STYLE_SLOTS)):
+            ttype = slot_token(slot)
+            name = self._get_css_classes(ttype)
+            if name:
+                declarations = "; ".join(_declarations(self.style, ttype))
+                self.class2style[name] = (declarations, ttype, slot)
+        for ttype, _ in self.style:
+            self.ttype2class[ttype] = self._get_css_classes(ttype)
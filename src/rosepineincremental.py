@@ -0,0 +1,252 @@
+"""Incremental re-highlighting of editor and REPL buffers.
+
+Re-highlighting a whole IPython or radian cell on every keystroke gets
+slow as the cell grows. :class:`IncrementalHighlighter` keeps, for every
+line of the buffer, the lexer state it starts in and its rendered output.
+When the buffer changes, lexing resumes a few lines before the first
+changed line, from one whose cached state it checks, and stops as soon as a
+line after the edit starts in the same state as before, so the work depends
+on the size of the edit rather than the size of the buffer::
+
+    highlighter = IncrementalHighlighter(PythonLexer(), "rose-pine-moon")
+    highlighter.update(buffer)  # Range of the lines that were redrawn.
+    output = highlighter.render()
+
+Rendering is done line by line, which gives the same output as rendering
+the whole buffer for the terminal formatters (the default) and the other
+line-oriented formatters, but not e.g. for ``HtmlFormatter``.
+"""
+
+import io
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.token import _TokenType
+
+from rosepinelexer import ROOT, can_resume, normalize, tokens_from
+from rosepineterm import formatter_for
+
+
+class IncrementalHighlighter:
+    """Highlighter caching the lexer state and output of every line.
+
+    Lexers that cannot be resumed (see :func:`rosepinelexer.can_resume`)
+    still work, but re-lex the whole buffer on every change. The lexer's
+    ``stripnl``, ``stripall`` and filters are not applied: a buffer is
+    highlighted as typed.
+
+    Args:
+        lexer (Lexer): Lexer to use.
+        variant (str): Rose Pine variant name. Defaults to
+            ``rose-pine-moon``.
+        fmt (str): Pygments formatter alias. Defaults to ``terminal16m``.
+        formatter (Optional[Formatter]): Formatter to use instead of
+            building one from ``variant`` and ``fmt``.
+        lookahead (int): Number of characters before an edit to re-lex
+            from. Lexers that keep multi-line constructs in their state,
+            like ``PythonLexer``, need none. Lexers matching them with a
+            single regular expression, like ``MarkdownLexer`` with code
+            fences, need as much as those constructs can span, see
+            :func:`rosepinelexer.lex_chunks`. Defaults to 0.
+        **options (Any): Extra formatter options.
+    """
+
+    def __init__(
+        self,
+        lexer: Lexer,
+        variant: str = "rose-pine-moon",
+        fmt: str = "terminal16m",
+        formatter: Optional[Formatter] = None,
+        lookahead: int = 0,
+        **options: Any,
+    ) -> None:
+        self.lexer = lexer
+        self.lookahead = lookahead
+        self.formatter = formatter or formatter_for(variant, fmt, **options)
+        self.resumable = can_resume(lexer)
+        #: Lines of the buffer, with their line endings.
+        self.lines: list[str] = []
+        #: State stack each line starts in, or ``None`` where a token spans
+        #: the line break before it.
+        self.states: list[Optional[tuple[str, ...]]] = []
+        #: Rendered output of each line.
+        self.rendered: list[str] = []
+        #: Number of lines re-lexed by the last update.
+        self.relexed = 0
+
+    def split(self, text: str) -> list[str]:
+        """Preprocess a buffer like Pygments does and split it into lines.
+
+        Args:
+            text (str): Whole buffer.
+
+        Returns:
+            list[str]: Lines, each ending with a newline.
+        """
+        text = normalize(self.lexer, text)
+        if self.lexer.ensurenl and not text.endswith("\n"):
+            text += "\n"
+        *lines, last = text.split("\n")
+        return [line + "\n" for line in lines] + ([last] if last else [])
+
+    def _render(self, tokens: list[tuple[_TokenType, str]]) -> str:
+        buffer = io.StringIO()
+        self.formatter.format(tokens, buffer)
+        return buffer.getvalue()
+
+    def _tokens(
+        self, text: str, start: int, offset: int, line_states: list
+    ) -> Iterator[tuple[int, _TokenType, str]]:
+        """Lex the buffer from a line start."""
+        if not self.resumable:
+            return self.lexer.get_tokens_unprocessed(text)
+        stack = list(self.states[start] if start < len(self.states) else ROOT)
+        return tokens_from(
+            self.lexer, text, stack, line_states=line_states, start=offset
+        )
+
+    def update(self, text: str) -> range:
+        """Bring the cache up to date with the new content of the buffer.
+
+        Args:
+            text (str): Whole buffer.
+
+        Returns:
+            range: Indices of the lines whose output was rebuilt.
+        """
+        old, new = self.lines, self.split(text)
+        common = min(len(old), len(new))
+        first = 0
+        while first < common and old[first] == new[first]:
+            first += 1
+        if first == len(old) == len(new):
+            self.relexed = 0
+            return range(first, first)
+        suffix = 0
+        while suffix < common - first and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        # Resume from the closest line before the edit, and at least
+        # ``lookahead`` characters before it, whose state is known.
+        first = min(first, len(old) - 1) if self.resumable else 0
+        first = max(first, 0)
+        offset = edit = sum(map(len, new[:first]))
+        while first > 0 and (
+            self.states[first] is None or edit - offset < self.lookahead
+        ):
+            first -= 1
+            offset -= len(new[first])
+
+        # The state cached for ``first`` is only valid if the lines before it
+        # still lex the same way: a regular expression tried before it may
+        # have looked past it, into the edit (e.g. a docstring that an
+        # inserted quote now closes). Check it by lexing from an earlier line
+        # in the root state, outside of any open construct, going further
+        # back, up to the start of the buffer, until they agree.
+        whole = "".join(new)
+        back = 1
+        while True:
+            start, start_at = first, offset
+            while start > 0:
+                if first - start >= back and self.states[start] == ROOT:
+                    break
+                start -= 1
+                start_at -= len(new[start])
+            check = first if start > 0 else None
+            relexed = self._relex(new, whole, start, start_at, check, suffix)
+            if relexed is not None:
+                break
+            back *= 2
+        states, rendered, stop = relexed
+
+        delta = len(new) - len(old)
+        if stop == len(new):
+            tail_states: list[Optional[tuple[str, ...]]] = []
+            tail_rendered: list[str] = []
+        else:
+            tail = stop - delta
+            tail_states = self.states[tail:]
+            tail_rendered = self.rendered[tail:]
+        changed = start
+        while changed < first:
+            if rendered[changed - start] != self.rendered[changed]:
+                break
+            changed += 1
+        count = stop - start
+        self.lines = new
+        self.states = self.states[:start] + states[:count] + tail_states
+        self.rendered = self.rendered[:start] + rendered + tail_rendered
+        self.relexed = stop - start
+        return range(changed, stop)
+
+    def _relex(
+        self,
+        new: list[str],
+        whole: str,
+        first: int,
+        offset: int,
+        check: Optional[int],
+        suffix: int,
+    ) -> Optional[tuple[list[Optional[tuple[str, ...]]], list[str], int]]:
+        """Lex the buffer from a line until it lines up with the cache again.
+
+        Returns the state and output of every line lexed and the line it
+        stopped at, or ``None`` if line ``check`` does not start in its
+        cached state.
+        """
+        line_states: list[tuple[int, tuple[str, ...]]] = []
+        states: list[Optional[tuple[str, ...]]] = []
+        rendered: list[str] = []
+        delta = len(new) - len(self.lines)
+        line, line_start = first, offset
+        tokens: list[tuple[_TokenType, str]] = []
+        state_pending = True
+        stop: Optional[int] = None
+        lexed = self._tokens(whole, first, offset, line_states)
+        for position, ttype, value in lexed:
+            if state_pending:
+                state_pending = False
+                state = None
+                saved = line_states[-1] if line_states else None
+                if saved and saved[0] == position == line_start:
+                    state = saved[1]
+                if line == check and state != self.states[check]:
+                    return None
+                if (
+                    state is not None
+                    and line >= len(new) - suffix
+                    and line > first
+                    and line > (check or 0)
+                    and self.states[line - delta] == state
+                ):
+                    stop = line
+                    break
+                states.append(state)
+            while value:
+                piece, newline, value = value.partition("\n")
+                tokens.append((ttype, piece + newline))
+                position += len(piece) + len(newline)
+                if newline:
+                    rendered.append(self._render(tokens))
+                    tokens = []
+                    line += 1
+                    line_start = position
+                    if value:
+                        # The token goes on past the line break.
+                        if line == check:
+                            return None
+                        states.append(None)
+                    else:
+                        state_pending = True
+        if tokens:
+            rendered.append(self._render(tokens))
+        return states, rendered, len(new) if stop is None else stop
+
+    def render(self) -> str:
+        """Get the output for the whole buffer.
+
+        Returns:
+            str: Concatenated output of every line.
+        """
+        return "".join(self.rendered)
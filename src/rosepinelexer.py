@@ -0,0 +1,330 @@
+"""Resumable lexing on top of Pygments' ``RegexLexer``.
+
+``RegexLexer.get_tokens_unprocessed`` can start from any state stack but
+keeps the stack it ends with to itself. :func:`tokens_from` runs the same
+loop on a caller-owned stack, so text can be lexed piece by piece (e.g.
+line by line or chunk by chunk) and the lexer resumed exactly where it
+stopped.
+"""
+
+import bisect
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+from pygments.lexer import Lexer, RegexLexer
+from pygments.lexers.special import OutputLexer, TextLexer
+from pygments.token import Error, Whitespace, _TokenType
+
+#: State stack every ``RegexLexer`` starts from.
+ROOT: tuple[str, ...] = ("root",)
+
+#: Default context, in characters, kept after the tokens committed by
+#: :func:`lex_chunks` and :func:`resync_chunks`.
+LOOKAHEAD: int = 16 * 1024
+
+#: Default size, in characters, the text carried over from one chunk to the
+#: next by :func:`lex_chunks` and :func:`resync_chunks` can grow to.
+MAX_CARRY: int = 1024 * 1024
+
+# ``get_tokens_unprocessed`` of the lexers giving the same tokens for a text
+# as for its lines lexed one by one.
+_STATELESS = (
+    TextLexer.get_tokens_unprocessed,
+    OutputLexer.get_tokens_unprocessed,
+)
+
+
+def can_resume(lexer: Lexer) -> bool:
+    """Check whether a lexer can be driven by :func:`tokens_from`.
+
+    Only plain ``RegexLexer`` subclasses qualify: lexers that override
+    ``get_tokens_unprocessed`` (including ``ExtendedRegexLexer`` and the
+    delegating lexers) post-process the token stream in ways that cannot
+    be resumed.
+
+    Args:
+        lexer (Lexer): Any Pygments lexer instance.
+
+    Returns:
+        bool: ``True`` if the lexer can be resumed from a saved state.
+    """
+    method = type(lexer).get_tokens_unprocessed
+    regex = RegexLexer.get_tokens_unprocessed
+    return isinstance(lexer, RegexLexer) and method is regex
+
+
+def is_stateless(lexer: Lexer) -> bool:
+    """Check whether a lexer can lex a document a piece at a time.
+
+    Lexers like ``TextLexer`` give a single token for the whole text, which
+    is the same, once formatted, as the tokens of its lines lexed one by
+    one.
+
+    Args:
+        lexer (Lexer): Any Pygments lexer instance.
+
+    Returns:
+        bool: ``True`` if the lexer keeps no state from one line to the next.
+    """
+    return type(lexer).get_tokens_unprocessed in _STATELESS
+
+
+def normalize(lexer: Lexer, text: str) -> str:
+    """Apply the newline and tab preprocessing Pygments does before lexing.
+
+    Stripping (``stripnl``, ``stripall``) and ``ensurenl`` apply to the whole
+    document and are left to the caller.
+
+    Args:
+        lexer (Lexer): Lexer whose options to honour.
+        text (str): Piece of the document, split at line boundaries.
+
+    Returns:
+        str: Normalized text.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if lexer.tabsize > 0:
+        text = text.expandtabs(lexer.tabsize)
+    return text
+
+
+def tokens_from(
+    lexer: RegexLexer,
+    text: str,
+    stack: list[str],
+    checkpoints: Optional[list[int]] = None,
+    line_states: Optional[list[tuple[int, tuple[str, ...]]]] = None,
+    start: int = 0,
+) -> Iterator[tuple[int, _TokenType, str]]:
+    """Lex text starting from, and updating, a saved state stack.
+
+    This is ``RegexLexer.get_tokens_unprocessed`` with the state stack owned
+    by the caller: once the generator is exhausted, ``stack`` holds the
+    state to resume from when lexing the text that follows.
+
+    Args:
+        lexer (RegexLexer): Lexer accepted by :func:`can_resume`.
+        text (str): Text to lex.
+        stack (list[str]): State stack, updated in place.
+        checkpoints (Optional[list[int]]): If given, the offset of every
+            line start where a match begins in the root state is appended
+            to it. Lexing can restart from scratch at those offsets.
+        line_states (Optional[list[tuple[int, tuple[str, ...]]]]): If given,
+            the offset and state stack of every line start where a match
+            begins are appended to it. Lexing can resume from those offsets
+            with a copy of the stack. The list is filled as tokens are
+            yielded, so it can be inspected while lexing.
+        start (int): Offset to start lexing at, e.g. a line start saved in
+            ``line_states``. Unlike slicing ``text``, this keeps the text
+            before it visible to look-behind assertions. Defaults to 0.
+
+    Yields:
+        tuple[int, _TokenType, str]: Offset in ``text``, token type and value.
+    """
+    pos = start
+    tokendefs = lexer._tokens
+    statetokens = tokendefs[stack[-1]]
+    while True:
+        if (
+            line_states is not None
+            and (pos == 0 or text[pos - 1] == "\n")
+            and (not line_states or line_states[-1][0] != pos)
+        ):
+            # Zero-width matches can visit a position twice; the first
+            # stack is the one lexing resumes from.
+            line_states.append((pos, tuple(stack)))
+        if (
+            checkpoints is not None
+            and (pos == 0 or text[pos - 1] == "\n")
+            and len(stack) == 1
+            and stack[0] == "root"
+        ):
+            checkpoints.append(pos)
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group()
+                    else:
+                        yield from action(lexer, m)
+                pos = m.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(stack) > 1:
+                                    stack.pop()
+                            elif state == "#push":
+                                stack.append(stack[-1])
+                            else:
+                                stack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(stack):
+                            del stack[1:]
+                        else:
+                            del stack[new_state:]
+                    elif new_state == "#push":
+                        stack.append(stack[-1])
+                    else:
+                        raise ValueError(f"wrong state def: {new_state!r}")
+                    statetokens = tokendefs[stack[-1]]
+                break
+        else:
+            if pos >= len(text):
+                break
+            if text[pos] == "\n":
+                # At EOL, reset state to "root", like RegexLexer does.
+                stack[:] = ROOT
+                statetokens = tokendefs["root"]
+                yield pos, Whitespace, "\n"
+            else:
+                yield pos, Error, text[pos]
+            pos += 1
+
+
+def lex_chunks(
+    lexer: RegexLexer,
+    chunks: Iterable[str],
+    lookahead: int = LOOKAHEAD,
+    max_carry: int = MAX_CARRY,
+) -> Iterator[tuple[int, _TokenType, str]]:
+    """Lex a document given as consecutive chunks of whole lines.
+
+    Lexing each chunk on its own would cut through constructs that span
+    lines (e.g. Python docstrings or Markdown code fences) and change how
+    they are lexed. Instead, tokens are only yielded up to the last line
+    start where a match begins that is at least ``lookahead`` characters
+    before the end of the text seen so far; the rest is lexed again, from
+    the state saved there, together with the next chunk. This gives the
+    same tokens as lexing the whole document at once, as long as no single
+    regular expression needs to look further than ``lookahead`` characters
+    ahead.
+
+    A token spanning more than ``max_carry`` characters of lines, or a line
+    that long, leaves no such line start. The tokens starting before the
+    last ``lookahead`` characters are then yielded anyway and lexing
+    restarts after them in the root state, as Pygments does after an
+    unmatched line break, so the tokens that follow may differ from lexing
+    the whole document.
+
+    Args:
+        lexer (RegexLexer): Lexer accepted by :func:`can_resume`.
+        chunks (Iterable[str]): Preprocessed document, split at line
+            boundaries.
+        lookahead (int): Number of characters of context kept after the
+            yielded tokens. Defaults to :data:`LOOKAHEAD`.
+        max_carry (int): Number of characters of context past which tokens
+            are yielded anyway. Defaults to :data:`MAX_CARRY`.
+
+    Yields:
+        tuple[int, _TokenType, str]: Offset in the document, token type and
+        value.
+    """
+    carry = ""
+    start = 0  # Document offset of ``carry``.
+    stack = ROOT  # State ``carry`` starts in.
+    for chunk in chunks:
+        text = carry + chunk
+        if len(text) <= lookahead:
+            carry = text
+            continue
+        limit = len(text) - lookahead
+        line_states: list[tuple[int, tuple[str, ...]]] = []
+        tokens = []
+        lexed = tokens_from(lexer, text, list(stack), line_states=line_states)
+        for token in lexed:
+            if token[0] > limit:
+                break
+            tokens.append(token)
+        cut, cut_stack = 0, stack
+        for offset, state in reversed(line_states):
+            if offset <= limit:
+                cut, cut_stack = offset, state
+                break
+        if not cut and len(text) > max_carry:
+            last_offset, _, last_value = tokens[-1]
+            cut, cut_stack = last_offset + len(last_value), ROOT
+        for offset, ttype, value in tokens:
+            if offset >= cut:
+                break
+            yield start + offset, ttype, value
+        carry = text[cut:]
+        start += cut
+        stack = cut_stack
+    for offset, ttype, value in tokens_from(lexer, carry, list(stack)):
+        yield start + offset, ttype, value
+
+
+def resync_chunks(
+    lexer: Lexer,
+    chunks: Iterable[str],
+    lookahead: int = LOOKAHEAD,
+    max_carry: int = MAX_CARRY,
+) -> Iterator[tuple[int, _TokenType, str]]:
+    """Lex a document given as chunks with a lexer that cannot be resumed.
+
+    Lexers rejected by :func:`can_resume`, such as ``JsonLexer`` or
+    ``CLexer``, can only lex from scratch. Each chunk is lexed together
+    with the text carried over from the previous one, and tokens are
+    yielded up to the last token at least ``lookahead`` characters before
+    the end from which lexing the rest again from scratch gives the same
+    tokens; candidates are tried going twice as far back each time. Like
+    :func:`lex_chunks`, this gives the same tokens as lexing the whole
+    document at once, as long as the lexer does not need to look further
+    than ``lookahead`` characters ahead.
+
+    When no such token is found within ``max_carry`` characters (e.g. in a
+    long YAML block), the tokens starting before the last ``lookahead``
+    characters are yielded anyway and lexing restarts from scratch after
+    them, so the tokens that follow may differ from lexing the whole
+    document.
+
+    Args:
+        lexer (Lexer): Any Pygments lexer.
+        chunks (Iterable[str]): Preprocessed document, split at line
+            boundaries.
+        lookahead (int): Number of characters of context kept after the
+            yielded tokens. Defaults to :data:`LOOKAHEAD`.
+        max_carry (int): Number of characters of context past which tokens
+            are yielded anyway. Defaults to :data:`MAX_CARRY`.
+
+    Yields:
+        tuple[int, _TokenType, str]: Offset in the document, token type and
+        value.
+    """
+    carry = ""
+    start = 0  # Document offset of ``carry``.
+    for chunk in chunks:
+        text = carry + chunk
+        limit = len(text) - lookahead
+        if limit <= 0:
+            carry = text
+            continue
+        tokens = list(lexer.get_tokens_unprocessed(text))
+        offsets = [offset for offset, _, _ in tokens]
+        cut = 0
+        target = limit
+        while target > 0:
+            # The first of the tokens starting at the last offset before it.
+            index = bisect.bisect_right(offsets, target) - 1
+            index = bisect.bisect_left(offsets, offsets[index])
+            if index == 0:
+                break
+            offset = offsets[index]
+            rest = [(o - offset, t, v) for o, t, v in tokens[index:]]
+            if list(lexer.get_tokens_unprocessed(text[offset:])) == rest:
+                cut = offset
+                break
+            target = 2 * offset - len(text)
+        if not cut and len(text) > max_carry:
+            index = bisect.bisect_right(offsets, limit)
+            cut = offsets[index] if index < len(offsets) else len(text)
+        for offset, ttype, value in tokens:
+            if offset >= cut:
+                break
+            yield start + offset, ttype, value
+        carry = text[cut:]
+        start += cut
+    for offset, ttype, value in lexer.get_tokens_unprocessed(carry):
+        yield start + offset, ttype, value
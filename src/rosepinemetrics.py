@@ -0,0 +1,334 @@
+"""Opt-in instrumentation of the highlight pipeline.
+
+Nothing is recorded unless a :class:`Metrics` collector is active. While
+one is, the highlight entry points of this package (:func:`highlight`,
+:meth:`rosepinecache.RenderCache.highlight`,
+:func:`rosepinestream.highlight_stream`, :mod:`rosepineasync`,
+:func:`rosepinebatch.highlight_batch` and the formatters built by
+:func:`rosepineterm.formatter_for`) report to it:
+
+* wall time per stage: ``style`` (building a formatter, which resolves the
+  style of every token type), ``lex`` (time spent producing tokens) and
+  ``format`` (the rest of the formatting pass);
+* tokens processed, output bytes, highlight calls, cache hits and misses.
+
+Collectors are process-wide, like Prometheus client registries, so work
+done on worker threads is recorded too::
+
+    with collect() as metrics:
+        serve_requests()
+    metrics.write_prometheus("/var/lib/node_exporter/rose_pine.prom")
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+import pygments
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.token import _TokenType
+
+#: Stages whose wall time is recorded.
+STAGES: tuple[str, ...] = ("style", "lex", "format")
+
+#: Counters, in export order.
+COUNTERS: tuple[str, ...] = (
+    "highlights",
+    "tokens",
+    "output_bytes",
+    "cache_hits",
+    "cache_misses",
+)
+
+_active: Optional["Metrics"] = None
+
+
+class Metrics:
+    """Thread-safe collection of stage timings and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        #: Wall time spent in each stage, in seconds.
+        self.seconds: Counter[str] = Counter()
+        #: Number of times each stage ran.
+        self.calls: Counter[str] = Counter()
+        #: Values of the counters listed in :data:`COUNTERS`.
+        self.counters: Counter[str] = Counter()
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Record a run of a stage.
+
+        Args:
+            stage (str): Stage name, see :data:`STAGES`.
+            seconds (float): Wall time it took.
+        """
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.calls[stage] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): Counter name, see :data:`COUNTERS`.
+            value (int): Amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self.counters[name] += value
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the body of a ``with`` block as a stage.
+
+        Args:
+            name (str): Stage name.
+
+        Yields:
+            None: Control to the timed block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Fraction of cache lookups that hit, or ``None`` before any."""
+        lookups = self.counters["cache_hits"] + self.counters["cache_misses"]
+        return self.counters["cache_hits"] / lookups if lookups else None
+
+    def reset(self) -> None:
+        """Set every timing and counter back to zero."""
+        with self._lock:
+            self.seconds.clear()
+            self.calls.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the current values as plain data.
+
+        Returns:
+            dict[str, Any]: ``stages`` (seconds and calls per stage), the
+            counters and ``cache_hit_rate``.
+        """
+        with self._lock:
+            data: dict[str, Any] = {
+                "stages": {
+                    stage: {
+                        "seconds": self.seconds[stage],
+                        "calls": self.calls[stage],
+                    }
+                    for stage in STAGES
+                },
+                **{name: self.counters[name] for name in COUNTERS},
+            }
+        data["cache_hit_rate"] = self.cache_hit_rate
+        return data
+
+    def to_prometheus(self, prefix: str = "rose_pine") -> str:
+        """Render the values in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix. Defaults to ``rose_pine``.
+
+        Returns:
+            str: Exposition text.
+        """
+        data = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Wall time spent per stage.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        for stage, values in data["stages"].items():
+            metric = f'{prefix}_stage_seconds_total{{stage="{stage}"}}'
+            lines.append(f"{metric} {values['seconds']}")
+        lines += [
+            f"# HELP {prefix}_stage_calls_total Number of runs per stage.",
+            f"# TYPE {prefix}_stage_calls_total counter",
+        ]
+        for stage, values in data["stages"].items():
+            metric = f'{prefix}_stage_calls_total{{stage="{stage}"}}'
+            lines.append(f"{metric} {values['calls']}")
+        for name in COUNTERS:
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {data[name]}"]
+        if data["cache_hit_rate"] is not None:
+            metric = f"{prefix}_cache_hit_ratio"
+            rate = data["cache_hit_rate"]
+            lines += [f"# TYPE {metric} gauge", f"{metric} {rate}"]
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        """Render the values as JSON.
+
+        Returns:
+            str: JSON object, see :meth:`snapshot`.
+        """
+        return json.dumps(self.snapshot(), indent=2) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path]) -> None:
+        """Write the Prometheus text atomically, e.g. for node_exporter.
+
+        Args:
+            path (Union[str, Path]): Destination, usually ending in ``.prom``.
+        """
+        _write_atomic(Path(path), self.to_prometheus())
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Write the JSON snapshot atomically.
+
+        Args:
+            path (Union[str, Path]): Destination.
+        """
+        _write_atomic(Path(path), self.to_json())
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _size(data: Union[str, bytes]) -> int:
+    return len(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+def active() -> Optional[Metrics]:
+    """Get the active collector.
+
+    Returns:
+        Optional[Metrics]: The collector of the innermost :func:`collect`
+        block, or ``None`` when not collecting.
+    """
+    return _active
+
+
+@contextmanager
+def collect(metrics: Optional[Metrics] = None) -> Iterator[Metrics]:
+    """Make a collector active for the duration of a ``with`` block.
+
+    Args:
+        metrics (Optional[Metrics]): Collector to record into, e.g. one
+            kept for the lifetime of a server. Defaults to a new one.
+
+    Yields:
+        Metrics: The active collector.
+    """
+    global _active
+    previous, _active = _active, metrics or Metrics()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+class _CountingWriter:
+    """File-like wrapper counting the bytes written through it."""
+
+    def __init__(self, stream: IO[Any]) -> None:
+        self.stream = stream
+        self.size = 0
+
+    def write(self, data: Union[str, bytes]) -> int:
+        self.size += _size(data)
+        return self.stream.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+class _Timed:
+    """Token stream wrapper recording the time spent producing tokens."""
+
+    def __init__(self, tokens: Iterable[tuple[_TokenType, str]]) -> None:
+        self.tokens = tokens
+        self.seconds = 0.0
+        self.count = 0
+
+    def __iter__(self) -> Iterator[tuple[_TokenType, str]]:
+        clock = time.perf_counter
+        iterator = iter(self.tokens)
+        while True:
+            start = clock()
+            try:
+                token = next(iterator)
+            except StopIteration:
+                self.seconds += clock() - start
+                return
+            self.seconds += clock() - start
+            self.count += 1
+            yield token
+
+
+def format_tokens(
+    tokens: Iterable[tuple[_TokenType, str]],
+    formatter: Formatter,
+    outfile: Optional[IO[Any]] = None,
+) -> Optional[Union[str, bytes]]:
+    """Format a token stream like ``pygments.format``, recording metrics.
+
+    Tokens are usually produced lazily while formatting; the time spent
+    producing them is recorded as ``lex`` and the remainder as ``format``.
+
+    Args:
+        tokens (Iterable[tuple[_TokenType, str]]): Token stream.
+        formatter (Formatter): Formatter to use.
+        outfile (Optional[IO[Any]]): Stream to write to instead of
+            returning the output.
+
+    Returns:
+        Optional[Union[str, bytes]]: Output, unless ``outfile`` is given.
+    """
+    metrics = _active
+    if metrics is None:
+        return pygments.format(tokens, formatter, outfile)
+    timed = _Timed(tokens)
+    writer = _CountingWriter(outfile) if outfile is not None else None
+    start = time.perf_counter()
+    try:
+        output = pygments.format(timed, formatter, writer)
+    finally:
+        metrics.add_time("lex", timed.seconds)
+        metrics.add_time("format", time.perf_counter() - start - timed.seconds)
+        metrics.count("tokens", timed.count)
+        metrics.count("highlights")
+    if writer is not None:
+        metrics.count("output_bytes", writer.size)
+    elif output is not None:
+        metrics.count("output_bytes", _size(output))
+    return output
+
+
+def highlight(
+    code: str,
+    lexer: Lexer,
+    formatter: Formatter,
+    outfile: Optional[IO[Any]] = None,
+) -> Optional[Union[str, bytes]]:
+    """Drop-in replacement for ``pygments.highlight`` that records metrics.
+
+    Args:
+        code (str): Source code.
+        lexer (Lexer): Lexer to use.
+        formatter (Formatter): Formatter to use.
+        outfile (Optional[IO[Any]]): Stream to write to instead of
+            returning the output.
+
+    Returns:
+        Optional[Union[str, bytes]]: Output, unless ``outfile`` is given.
+    """
+    return format_tokens(lexer.get_tokens(code), formatter, outfile)
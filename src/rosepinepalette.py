@@ -0,0 +1,327 @@
+"""Single source of truth for the Rose Pine palettes and token roles.
+
+Every variant shares the same token to role mapping and only differs in
+the color each role resolves to. The Pygments style classes are built from
+these tables on first use, so importing a variant module stays cheap and
+the variants cannot drift apart.
+"""
+
+from functools import lru_cache
+
+# Importing ``typing`` would slow down importing the variant modules.
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+#: Palette roles as defined by rose-pine: https://rosepinetheme.com/palette.
+ROLES: tuple[str, ...] = (
+    "base",
+    "surface",
+    "overlay",
+    "muted",
+    "subtle",
+    "text",
+    "love",
+    "gold",
+    "rose",
+    "pine",
+    "foam",
+    "iris",
+    "highlightlow",
+    "highlightmed",
+    "highlighthigh",
+)
+
+#: Hex color of every role, keyed by variant name.
+PALETTE: dict[str, dict[str, str]] = {
+    "rose-pine": {
+        "base": "#191724",
+        "surface": "#1f1d2e",
+        "overlay": "#26233a",
+        "muted": "#6e6a86",
+        "subtle": "#908caa",
+        "text": "#e0def4",
+        "love": "#eb6f92",
+        "gold": "#f6c177",
+        "rose": "#ebbcba",
+        "pine": "#31748f",
+        "foam": "#9ccfd8",
+        "iris": "#c4a7e7",
+        "highlightlow": "#21202e",
+        "highlightmed": "#403d52",
+        "highlighthigh": "#524f67",
+    },
+    "rose-pine-moon": {
+        "base": "#232136",
+        "surface": "#2a273f",
+        "overlay": "#393552",
+        "muted": "#6e6a86",
+        "subtle": "#908caa",
+        "text": "#e0def4",
+        "love": "#eb6f92",
+        "gold": "#f6c177",
+        "rose": "#ea9a97",
+        "pine": "#3e8fb0",
+        "foam": "#9ccfd8",
+        "iris": "#c4a7e7",
+        "highlightlow": "#2a283e",
+        "highlightmed": "#44415a",
+        "highlighthigh": "#56526e",
+    },
+    "rose-pine-dawn": {
+        "base": "#faf4ed",
+        "surface": "#fffaf3",
+        "overlay": "#f2e9e1",
+        "muted": "#9893a5",
+        "subtle": "#797593",
+        "text": "#575279",
+        "love": "#b4637a",
+        "gold": "#ea9d34",
+        "rose": "#d7827e",
+        "pine": "#286983",
+        "foam": "#56949f",
+        "iris": "#907aa9",
+        "highlightlow": "#f4ede8",
+        "highlightmed": "#dfdad9",
+        "highlighthigh": "#cecacd",
+    },
+}
+
+#: Palette role and extra style attributes of every styled token type.
+TOKEN_ROLES: dict[str, tuple[str, str]] = {
+    "Comment": ("subtle", ""),
+    "Error": ("love", ""),
+    "Keyword.Namespace": ("pine", ""),
+    "Keyword.Constant": ("rose", ""),
+    "Keyword.Type": ("foam", ""),
+    "Keyword": ("pine", ""),
+    "Name.Builtin.Pseudo": ("love", ""),
+    "Name.Builtin": ("text", ""),
+    "Name.Class": ("foam", ""),
+    "Name.Decorator": ("iris", "bold"),
+    "Name.Exception": ("foam", ""),
+    "Name.Function": ("love", ""),
+    "Name.Variable.Magic": ("love", ""),
+    "Name": ("text", ""),
+    "Number": ("rose", ""),
+    "Operator.Word": ("pine", ""),
+    "Operator": ("pine", ""),
+    "String.Affix": ("pine", ""),
+    "String.Escape": ("pine", ""),
+    "String.Interpol": ("text", ""),
+    "String": ("gold", ""),
+    "Text": ("text", ""),
+    "Punctuation": ("subtle", ""),
+}
+
+#: Stable index of every distinct role and extra attributes pair used by
+#: :data:`TOKEN_ROLES`, shared by all variants. Index 0 is unstyled text.
+STYLE_SLOTS: tuple[tuple[str, str], ...] = (("", ""),) + tuple(
+    sorted(
+        set(TOKEN_ROLES.values()),
+        key=lambda pair: (ROLES.index(pair[0]), pair),
+    )
+)
+
+#: Role used for the background of every variant.
+BACKGROUND_ROLE: str = "base"
+
+#: Prefix of the ``Color`` attributes of every variant.
+PREFIXES: dict[str, str] = {
+    "rose-pine": "pine",
+    "rose-pine-moon": "moon",
+    "rose-pine-dawn": "dawn",
+}
+
+#: Module and class name of the entry point of every variant.
+ENTRY_POINTS: dict[str, tuple[str, str]] = {
+    "rose-pine": ("rosepine", "RosePineStyle"),
+    "rose-pine-moon": ("rosepinemoon", "RosePineMoonStyle"),
+    "rose-pine-dawn": ("rosepinedawn", "RosePineDawnStyle"),
+}
+
+#: Human readable theme name of every variant.
+THEMES: dict[str, str] = {
+    "rose-pine": "Rose Pine main",
+    "rose-pine-moon": "Rose Pine Moon",
+    "rose-pine-dawn": "Rose Pine Dawn",
+}
+
+VARIANTS: tuple[str, ...] = tuple(PALETTE)
+
+#: Pygments formatter aliases served by the precomputed terminal formatters,
+#: and their color depth.
+TERMINAL_FORMATS: dict[str, str] = {
+    "terminal16m": "truecolor",
+    "terminal256": "256",
+    "terminal16": "16",
+}
+
+
+def make_color(variant: str) -> type:
+    """Build the ``Color`` dataclass of a variant.
+
+    Args:
+        variant (str): Variant name, e.g. ``rose-pine-moon``.
+
+    Returns:
+        type: Frozen dataclass holding the absolute colors as attributes
+        prefixed with the variant, e.g. ``moon_base``.
+    """
+    from dataclasses import dataclass
+
+    prefix = PREFIXES[variant]
+    namespace: dict[str, object] = {
+        f"{prefix}_{role}": color for role, color in PALETTE[variant].items()
+    }
+    url = "https://rosepinetheme.com/palette"
+    namespace["__doc__"] = f"Absolute colors as defined by rose-pine: {url}."
+    namespace["__module__"] = ENTRY_POINTS[variant][0]
+    return dataclass(frozen=True)(type("Color", (), namespace))
+
+
+@lru_cache(maxsize=None)
+def _slots() -> dict[object, int]:
+    from pygments.token import string_to_tokentype
+
+    return {
+        string_to_tokentype(token): STYLE_SLOTS.index(pair)
+        for token, pair in TOKEN_ROLES.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def token_slot(ttype: object) -> int:
+    """Get the style slot of a token type.
+
+    Token types without a role of their own use the role of their closest
+    parent, as in the Pygments styles.
+
+    Args:
+        ttype (object): Pygments token type, e.g. ``Token.Name.Builtin``.
+
+    Returns:
+        int: Index into :data:`STYLE_SLOTS`.
+    """
+    slots = _slots()
+    while ttype is not None and ttype not in slots:
+        ttype = ttype.parent  # type: ignore[attr-defined]
+    return slots.get(ttype, 0)
+
+
+def write_escaped(
+    write: "Callable[[str], object]", value: str, on: str, off: str
+) -> None:
+    """Write a token the way the Pygments terminal formatters do.
+
+    Every line of the token is wrapped in the escape sequences on its own,
+    so that line breaks are written uncolored.
+
+    Args:
+        write (Callable[[str], object]): Function writing a string.
+        value (str): Token value.
+        on (str): Escape sequence starting the token's style.
+        off (str): Escape sequence ending it.
+    """
+    if "\n" not in value:
+        if value:
+            write(on + value + off)
+        return
+    *lines, last = value.split("\n")
+    for line in lines:
+        if line:
+            write(on + line + off)
+        write("\n")
+    if last:
+        write(on + last + off)
+
+
+def style_definitions(variant: str) -> dict[str, str]:
+    """Resolve the token roles of a variant into Pygments style strings.
+
+    Args:
+        variant (str): Variant name.
+
+    Returns:
+        dict[str, str]: Style definition keyed by token type name.
+    """
+    return role_definitions(PALETTE[variant])
+
+
+def role_definitions(palette: dict[str, str]) -> dict[str, str]:
+    """Resolve the token roles into Pygments style strings for any palette.
+
+    Args:
+        palette (dict[str, str]): Hex color of every role.
+
+    Returns:
+        dict[str, str]: Style definition keyed by token type name.
+    """
+    return {
+        token: f"{palette[role]} {extra}".rstrip()
+        for token, (role, extra) in TOKEN_ROLES.items()
+    }
+
+
+def _namespace(variant: str) -> dict[str, object]:
+    """Build the class namespace of a variant's style."""
+    from pygments.token import string_to_tokentype
+
+    return {
+        "__doc__": f"Soho vibes for Pygments. Based on the colors of {THEMES[variant]} theme.",  # noqa: E501
+        "__module__": ENTRY_POINTS[variant][0],
+        "name": variant,
+        "background_color": PALETTE[variant][BACKGROUND_ROLE],
+        "styles": {
+            string_to_tokentype(token): definition
+            for token, definition in style_definitions(variant).items()
+        },
+    }
+
+
+def parse_style(variant: str) -> type:
+    """Build the style class of a variant by parsing its style strings.
+
+    Pygments parses and checks every definition, as for any other style.
+    This is what ``rosepinebuild.py`` uses to generate the pre-parsed
+    definitions that :func:`build_style` loads.
+
+    Args:
+        variant (str): Variant name.
+
+    Returns:
+        type: A new ``Style`` subclass.
+    """
+    from pygments.style import Style
+
+    from rosepineresolve import RosePineStyleMeta
+
+    name = ENTRY_POINTS[variant][1]
+    return RosePineStyleMeta(name, (Style,), _namespace(variant))
+
+
+@lru_cache(maxsize=None)
+def build_style(variant: str) -> type:
+    """Build the Pygments style class of a variant.
+
+    The class is only built once per process, so every caller gets the
+    same object. Pygments is only imported here, which keeps importing the
+    palette (and the variant modules) cheap. The definitions are loaded
+    already parsed and validated from the generated ``rosepinedefs``
+    module instead of going through the parsing of ``StyleMeta``.
+
+    Args:
+        variant (str): Variant name.
+
+    Returns:
+        type: The ``Style`` subclass, e.g. ``RosePineMoonStyle``.
+    """
+    from pygments.style import Style
+
+    from rosepinedefs import SLOT_STYLES, TOKEN_SLOTS
+    from rosepineresolve import RosePineStyleMeta
+
+    namespace = _namespace(variant)
+    namespace["token_slots"] = TOKEN_SLOTS
+    namespace["slot_styles"] = SLOT_STYLES[variant]
+    return RosePineStyleMeta(ENTRY_POINTS[variant][1], (Style,), namespace)
@@ -0,0 +1,232 @@
+"""Parallel highlighting of a single large file.
+
+A single file (generated code, SQL dumps, logs) can be hundreds of
+megabytes, and ``pygments.highlight`` runs on one core.
+:func:`highlight_parallel` splits the text into chunks at likely resync
+points, top-level lines after a blank line, and lexes and formats the
+chunks in worker processes::
+
+    output = highlight_parallel(dump, SqlLexer(), "rose-pine-moon", jobs=8)
+
+A split point is only kept if lexing the chunk before it really reaches it
+in the root state, at a line start where a match begins (a checkpoint, see
+:func:`rosepinelexer.tokens_from`). Otherwise the two chunks around it are
+lexed again as one. Each chunk is lexed with some context on both sides,
+so the output is byte-identical to the serial ``pygments.highlight``.
+
+Only formats whose output is a plain concatenation of per-line output can
+be split: the terminal formats without line numbers, and HTML with
+``nowrap``. Other formats, lexers that cannot be resumed (see
+:func:`rosepinelexer.can_resume`) and lexers with filters fall back to a
+serial run.
+"""
+
+import re
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+import pygments
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.token import _TokenType
+
+from rosepinelexer import LOOKAHEAD, ROOT, can_resume, tokens_from
+from rosepinestream import iter_chunks
+from rosepineterm import TERMINAL_FORMATS, formatter_for
+
+#: Default chunk size, in characters.
+CHUNK_SIZE: int = 1024 * 1024
+
+#: Characters of context given to a chunk before its start, for look-behind
+#: assertions.
+LOOKBEHIND: int = 1024
+
+# Top-level line after a blank line, then any line start.
+_RESYNC = (re.compile(r"\n[ \t]*\n(?=\S)"), re.compile(r"\n"))
+
+# A chunk: its start and end offsets in the document.
+_Span = tuple[int, int]
+
+
+def can_split(lexer: Lexer, fmt: str, options: dict[str, Any]) -> bool:
+    """Check whether a lexer and format can be highlighted in chunks.
+
+    Args:
+        lexer (Lexer): Lexer to use.
+        fmt (str): Pygments formatter alias.
+        options (dict[str, Any]): Formatter options.
+
+    Returns:
+        bool: ``True`` if :func:`highlight_parallel` can split the work.
+    """
+    if not can_resume(lexer) or lexer.filters:
+        return False
+    if fmt in TERMINAL_FORMATS:
+        return not options.get("linenos")
+    return fmt == "html" and bool(options.get("nowrap"))
+
+
+def split_points(text: str, chunk_size: int) -> list[int]:
+    """Pick the offsets to split a document at.
+
+    Args:
+        text (str): Preprocessed document.
+        chunk_size (int): Approximate chunk size, in characters.
+
+    Returns:
+        list[int]: Increasing line start offsets, from 0 to ``len(text)``.
+    """
+    points = [0]
+    while points[-1] + chunk_size < len(text):
+        target = points[-1] + chunk_size
+        for pattern in _RESYNC:
+            match = pattern.search(text, target, target + chunk_size)
+            if match:
+                break
+        else:
+            match = _RESYNC[-1].search(text, target)
+        if match is None or match.end() >= len(text):
+            break
+        points.append(match.end())
+    return points + [len(text)]
+
+
+@lru_cache(maxsize=None)
+def _formatter(
+    variant: str, fmt: str, options: tuple[tuple[str, Any], ...]
+) -> Formatter:
+    return formatter_for(variant, fmt, **dict(options))
+
+
+def highlight_chunk(
+    text: str,
+    start: int,
+    end: int,
+    lexer: Lexer,
+    variant: str,
+    fmt: str,
+    options: tuple[tuple[str, Any], ...],
+) -> Optional[Union[str, bytes]]:
+    """Lex and format a chunk, if its end is a checkpoint.
+
+    Args:
+        text (str): The chunk with some context on both sides.
+        start (int): Offset of the chunk in ``text``, a checkpoint.
+        end (int): Offset of its end in ``text``.
+        lexer (Lexer): Lexer to use.
+        variant (str): Rose Pine variant name.
+        fmt (str): Pygments formatter alias.
+        options (tuple[tuple[str, Any], ...]): Sorted formatter options.
+
+    Returns:
+        Optional[Union[str, bytes]]: Output of the chunk, or ``None`` if
+        lexing it does not reach ``end`` in the root state.
+    """
+    # Unpickled lexers skip the metaclass call that compiles the token
+    # definitions of their class.
+    lexer = type(lexer)(**lexer.options)
+    checkpoints: list[int] = []
+    tokens: list[tuple[_TokenType, str]] = []
+    for position, ttype, value in tokens_from(
+        lexer, text, list(ROOT), checkpoints, start=start
+    ):
+        if position >= end:
+            break
+        tokens.append((ttype, value))
+    if end < len(text) and (not checkpoints or checkpoints[-1] != end):
+        return None
+    return pygments.format(tokens, _formatter(variant, fmt, options))
+
+
+def highlight_parallel(
+    code: str,
+    lexer: Lexer,
+    variant: str = "rose-pine",
+    fmt: str = "terminal16m",
+    jobs: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    **options: Any,
+) -> Union[str, bytes]:
+    """Highlight one document in parallel worker processes.
+
+    Args:
+        code (str): Source code.
+        lexer (Lexer): Lexer to use; it must be picklable.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        fmt (str): Pygments formatter alias. Defaults to ``terminal16m``.
+        jobs (Optional[int]): Number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int): Approximate chunk size, in characters. Defaults
+            to :data:`CHUNK_SIZE`.
+        executor (Optional[Executor]): Pool to run the chunks on instead of
+            starting one for this call.
+        **options (Any): Extra formatter options, with hashable values.
+
+    Returns:
+        Union[str, bytes]: The same output as ``pygments.highlight``.
+    """
+    if not can_split(lexer, fmt, options) or len(code) <= chunk_size:
+        formatter = formatter_for(variant, fmt, **options)
+        return pygments.highlight(code, lexer, formatter)
+    text = "".join(iter_chunks([code], lexer, len(code) + 1))
+    points = split_points(text, chunk_size)
+    args = (text, points, lexer, variant, fmt, options)
+    if executor is None:
+        with ProcessPoolExecutor(jobs) as pool:
+            return _highlight_points(*args, pool)
+    return _highlight_points(*args, executor)
+
+
+def _highlight_points(
+    text: str,
+    points: list[int],
+    lexer: Lexer,
+    variant: str,
+    fmt: str,
+    options: dict[str, Any],
+    executor: Executor,
+) -> Union[str, bytes]:
+    """Highlight the chunks between split points, merging failed ones.
+
+    A chunk whose end is not a resync point is merged with the next one.
+    If a merged chunk fails as well, the split points cannot be trusted
+    for this text, and the rest of it is lexed here in one go rather than
+    resubmitting ever larger chunks, which would be quadratic.
+    """
+    key = tuple(sorted(options.items()))
+
+    def arguments(span: _Span) -> tuple[Any, ...]:
+        start, end = span
+        before = max(start - LOOKBEHIND, 0)
+        after = end if end == len(text) else end + LOOKAHEAD
+        chunk = text[before:after]
+        return chunk, start - before, end - before, lexer, variant, fmt, key
+
+    def submit(span: _Span) -> Future:
+        return executor.submit(highlight_chunk, *arguments(span))
+
+    spans = list(zip(points, points[1:]))
+    futures = [submit(span) for span in spans]
+    outputs = []
+    merged = -1
+    i = 0
+    while i < len(spans):
+        output = futures[i].result()
+        if output is None and i == merged:
+            for future in futures[i:]:
+                future.cancel()
+            rest = arguments((spans[i][0], len(text)))
+            outputs.append(highlight_chunk(*rest))
+            break
+        if output is None:
+            # The split point after this chunk is not a resync point.
+            futures[i + 1].cancel()
+            spans[i + 1] = (spans[i][0], spans[i + 1][1])
+            futures[i + 1] = submit(spans[i + 1])
+            merged = i + 1
+        else:
+            outputs.append(output)
+        i += 1
+    return outputs[0][:0].join(outputs)
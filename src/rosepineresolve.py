@@ -0,0 +1,129 @@
+"""Flattened token to style resolution for the Rose Pine styles.
+
+``StyleMeta.style_for_token`` rebuilds a fresh dict on every call, and
+formatters call it for every token type they meet. The Rose Pine styles
+use :class:`RosePineStyleMeta` instead, which resolves every token type of
+the style (including all of ``pygments.token.STANDARD_TYPES``) once, when
+the class is created, so ``style_for_token`` is a single dict lookup.
+
+A class namespace may also carry ``token_slots`` and ``slot_styles``, the
+style slot of every token type and the ``StyleMeta`` parse of every slot,
+as generated in ``rosepinedefs`` by ``rosepinebuild.py``. The style
+strings are then not parsed again, and each slot is resolved only once.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pygments.style import StyleMeta
+from pygments.token import STANDARD_TYPES, _TokenType
+
+
+@dataclass(frozen=True, slots=True)
+class StyleRecord:
+    """Resolved style of a token type.
+
+    Colors use the same bare ``rrggbb`` notation as ``style_for_token``.
+    """
+
+    color: Optional[str]
+    bold: bool
+    italic: bool
+    bgcolor: Optional[str]
+
+
+class RosePineStyleMeta(StyleMeta):
+    """``StyleMeta`` that resolves every token type up front.
+
+    The resolved definitions are shared between callers and must be treated
+    as read-only, which is already how Pygments' formatters use them.
+    """
+
+    _resolved: dict[_TokenType, dict[str, Any]]
+    _records: dict[_TokenType, StyleRecord]
+
+    def __new__(
+        mcs, name: str, bases: tuple[type, ...], dct: dict[str, Any]
+    ) -> "RosePineStyleMeta":
+        """Create the style class and its resolution tables.
+
+        Args:
+            name (str): Class name.
+            bases (tuple[type, ...]): Base classes.
+            dct (dict[str, Any]): Class namespace, optionally with
+                ``token_slots`` and ``slot_styles``.
+
+        Returns:
+            RosePineStyleMeta: The style class.
+        """
+        slots = dct.pop("token_slots", None)
+        slot_styles = dct.pop("slot_styles", None)
+        if slots is None:
+            cls = super().__new__(mcs, name, bases, dct)
+            resolve = StyleMeta.style_for_token
+            cls._resolved = {t: resolve(cls, t) for t in cls._styles}
+        else:
+            # What ``StyleMeta.__new__`` leaves behind, minus the parsing.
+            cls = type.__new__(mcs, name, bases, dct)
+            for token in STANDARD_TYPES:
+                cls.styles.setdefault(token, "")
+            cls._styles = {
+                token: list(slot_styles[slot]) for token, slot in slots.items()
+            }
+            first: dict[int, _TokenType] = {}
+            for token, slot in slots.items():
+                first.setdefault(slot, token)
+            by_slot = {
+                slot: StyleMeta.style_for_token(cls, token)
+                for slot, token in first.items()
+            }
+            cls._resolved = {t: by_slot[slot] for t, slot in slots.items()}
+        cls._records = {
+            token: StyleRecord(
+                color=ndef["color"],
+                bold=ndef["bold"],
+                italic=ndef["italic"],
+                bgcolor=ndef["bgcolor"],
+            )
+            for token, ndef in cls._resolved.items()
+        }
+        return cls
+
+    def style_for_token(cls, token: _TokenType) -> dict[str, Any]:
+        """Get the resolved style definition of a token type.
+
+        Args:
+            token (_TokenType): Token type known to the style.
+
+        Returns:
+            dict[str, Any]: Shared definition, as ``StyleMeta.style_for_token``
+            would build it.
+        """
+        return cls._resolved[token]
+
+    def record_for_token(cls, token: _TokenType) -> StyleRecord:
+        """Get the compact resolved style of any token type.
+
+        Token types the style does not know about, e.g. ones created by a
+        third-party lexer, resolve to their closest known parent and are
+        added to the table.
+
+        Args:
+            token (_TokenType): Token type.
+
+        Returns:
+            StyleRecord: Resolved style.
+        """
+        try:
+            return cls._records[token]
+        except KeyError:
+            parent = token.parent
+            if parent is None:
+                raise
+            record = cls._records[token] = cls.record_for_token(parent)
+            return record
+
+    @property
+    def records(cls) -> dict[_TokenType, StyleRecord]:
+        """Resolved style of every token type known to the style."""
+        return cls._records
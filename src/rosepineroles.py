@@ -0,0 +1,143 @@
+"""Role-based intermediate representation for switching variants cheaply.
+
+The three variants style the same token types with the same palette roles
+and only differ in the color of each role. :func:`lex_runs` therefore lexes
+a document once into ``(text, slot)`` runs, where the slot is an index
+into :data:`rosepinepalette.STYLE_SLOTS` (a role and its extra
+attributes), and :func:`render` turns the runs into the output of any
+variant with a table lookup per run, without running the lexer again::
+
+    runs = lex_runs(code, PythonLexer())
+    dark = render(runs, "rose-pine")
+    light = render(runs, "rose-pine-dawn")
+"""
+
+import io
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any
+
+from pygments.lexer import Lexer
+from pygments.token import Token, _TokenType, string_to_tokentype
+
+from rosepinefilter import merge_tokens
+from rosepinepalette import (
+    STYLE_SLOTS,
+    TOKEN_ROLES,
+    VARIANTS,
+    token_slot,
+    write_escaped,
+)
+from rosepinetables import TERMINAL_ESCAPES
+from rosepineterm import TERMINAL_FORMATS, formatter_for
+
+#: A run of text sharing a style slot.
+Run = tuple[str, int]
+
+
+@lru_cache(maxsize=None)
+def slot_token(slot: int) -> _TokenType:
+    """Get a token type standing for a style slot.
+
+    Args:
+        slot (int): Index into :data:`rosepinepalette.STYLE_SLOTS`.
+
+    Returns:
+        _TokenType: The first token type of :data:`TOKEN_ROLES` using the
+        slot's role and attributes, or ``Token`` for unstyled text.
+    """
+    for token, pair in TOKEN_ROLES.items():
+        if pair == STYLE_SLOTS[slot]:
+            return string_to_tokentype(token)
+    return Token
+
+
+def lex_runs(code: str, lexer: Lexer) -> list[Run]:
+    """Lex code into runs of text sharing a style slot.
+
+    Args:
+        code (str): Source code.
+        lexer (Lexer): Lexer to use.
+
+    Returns:
+        list[Run]: ``(text, slot)`` runs; adjacent runs have different
+        slots.
+    """
+    merged = merge_tokens(lexer.get_tokens(code), key=token_slot)
+    return [(text, token_slot(ttype)) for ttype, text in merged]
+
+
+def tokens(runs: Iterable[Run]) -> Iterator[tuple[_TokenType, str]]:
+    """Turn runs back into a token stream any formatter can use.
+
+    Args:
+        runs (Iterable[Run]): Output of :func:`lex_runs`.
+
+    Yields:
+        tuple[_TokenType, str]: One token per run, of the slot's token type.
+    """
+    for text, slot in runs:
+        yield slot_token(slot), text
+
+
+@lru_cache(maxsize=None)
+def escapes(variant: str, depth: str) -> tuple[tuple[str, str], ...]:
+    """Get the terminal escape pair of every style slot.
+
+    Args:
+        variant (str): Variant name.
+        depth (str): Color depth, one of ``truecolor``, ``256`` or ``16``.
+
+    Returns:
+        tuple[tuple[str, str], ...]: ``(on, off)`` pairs indexed by slot.
+    """
+    table = TERMINAL_ESCAPES[variant][depth]
+    slots = range(len(STYLE_SLOTS))
+    return tuple(table[str(slot_token(slot))] for slot in slots)
+
+
+def _render_terminal(
+    runs: Iterable[Run],
+    table: tuple[tuple[str, str], ...],
+) -> str:
+    """Render runs the way the Pygments terminal formatters do."""
+    parts = []
+    write = parts.append
+    for text, slot in runs:
+        on, off = table[slot]
+        write_escaped(write, text, on, off)
+    return "".join(parts)
+
+
+def render(
+    runs: Iterable[Run],
+    variant: str = "rose-pine",
+    fmt: str = "terminal16m",
+    **options: Any,
+) -> str:
+    """Render runs with a variant.
+
+    The terminal formats without extra options are rendered straight from
+    the precomputed escape tables. Other formats go through their Pygments
+    formatter, which only does a table lookup per run as well.
+
+    Args:
+        runs (Iterable[Run]): Output of :func:`lex_runs`.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        fmt (str): Pygments formatter alias. Defaults to ``terminal16m``.
+        **options (Any): Extra formatter options.
+
+    Returns:
+        str: Output, the same as formatting :func:`tokens` of the runs.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+    if fmt in TERMINAL_FORMATS and not options:
+        return _render_terminal(runs, escapes(variant, TERMINAL_FORMATS[fmt]))
+    formatter = formatter_for(variant, fmt, **options)
+    buffer = io.StringIO()
+    formatter.format(tokens(runs), buffer)
+    return buffer.getvalue()
@@ -0,0 +1,294 @@
+"""Read-only Rose Pine tables shared by the workers of pre-fork servers.
+
+Each worker of a pre-fork server (gunicorn, uWSGI ...) that highlights
+code imports the tables, builds the styles and resolves their escapes on
+its own. With this module the master process builds everything once and
+writes it to a file with :func:`export`; workers map the file read-only
+with :func:`attach`, so the operating system shares its pages between
+them, and format straight from it without importing
+:mod:`rosepinetables` or building a style::
+
+    # gunicorn.conf.py
+    def on_starting(server):
+        rosepineshared.export("/dev/shm/rose-pine.tables")
+
+    def post_fork(server, worker):
+        global TABLES
+        TABLES = rosepineshared.attach("/dev/shm/rose-pine.tables")
+
+    # In a request handler.
+    formatter = TABLES.formatter("rose-pine-moon", "terminal256")
+    output = pygments.highlight(code, lexer, formatter)
+
+The escape tables hold one entry per style slot (see
+:data:`rosepinepalette.STYLE_SLOTS`), since every token type of a slot has
+the same style. The stylesheets are returned as views of the mapping,
+without being copied.
+
+Layout: ``b"RPSH"``, the format version (``u16``), two bytes of padding
+and the size of the index (``u32``), all little-endian, then the index, a
+UTF-8 JSON object, and the data it points into.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Any, Union
+
+from pygments.formatter import Formatter
+from pygments.token import _TokenType
+
+from rosepinepalette import (
+    TERMINAL_FORMATS,
+    VARIANTS,
+    token_slot,
+    write_escaped,
+)
+
+#: Magic bytes the file starts with.
+MAGIC: bytes = b"RPSH"
+
+#: Version of the layout.
+VERSION: int = 1
+
+_PREAMBLE = struct.Struct("<4sHxxI")
+
+# Separates the escape sequences of a table, which never contain it.
+_SEPARATOR = "\0"
+
+
+def build() -> bytes:
+    """Build the shared tables from the precomputed ones.
+
+    Returns:
+        bytes: Contents of the file, see the module documentation.
+    """
+    import rosepinecss
+    import rosepinehtml
+    from rosepineroles import escapes
+
+    data = bytearray()
+    blobs: dict[str, list[int]] = {}
+
+    def add(key: str, blob: bytes) -> None:
+        blobs[key] = [len(data), len(blob)]
+        data.extend(blob)
+
+    for variant in VARIANTS:
+        for depth in TERMINAL_FORMATS.values():
+            pairs = [part for pair in escapes(variant, depth) for part in pair]
+            add(f"{variant}/escapes/{depth}", _SEPARATOR.join(pairs).encode())
+        add(f"{variant}/stylesheet", rosepinecss.stylesheet(variant))
+        compact = rosepinehtml.stylesheet(variant).encode()
+        add(f"{variant}/compact-stylesheet", compact)
+    etags = {variant: rosepinecss.etag(variant) for variant in VARIANTS}
+    index = {"blobs": blobs, "etags": etags}
+    encoded = json.dumps(index, separators=(",", ":")).encode()
+    return _PREAMBLE.pack(MAGIC, VERSION, len(encoded)) + encoded + data
+
+
+def export(path: Union[str, Path]) -> None:
+    """Write the shared tables atomically, e.g. in the master process.
+
+    Workers that attached to an earlier file keep their mapping.
+
+    Args:
+        path (Union[str, Path]): Destination, ideally on a ``tmpfs`` such as
+            ``/dev/shm``.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(build())
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class SharedTables:
+    """Lookups into a shared tables buffer.
+
+    Args:
+        buffer (Any): Contents of a file written by :func:`export`, usually
+            a read-only ``mmap``.
+
+    Raises:
+        ValueError: If the buffer does not hold shared tables of a known
+            version.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self._view = memoryview(buffer)
+        if len(self._view) < _PREAMBLE.size:
+            raise ValueError("not a Rose Pine shared tables file")
+        magic, version, size = _PREAMBLE.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a Rose Pine shared tables file")
+        header = _PREAMBLE.size
+        start = header + size
+        index = json.loads(bytes(self._view[header:start]))
+        self._blobs: dict[str, list[int]] = index["blobs"]
+        self._etags: dict[str, str] = index["etags"]
+        self._data = self._view[start:]
+        self._escapes: dict[tuple[str, str], tuple[tuple[str, str], ...]] = {}
+
+    def _blob(self, key: str) -> memoryview:
+        offset, size = self._blobs[key]
+        end = offset + size
+        return self._data[offset:end]
+
+    def _check(self, variant: str) -> None:
+        if variant not in self._etags:
+            raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+
+    def escapes(self, variant: str, depth: str) -> tuple[tuple[str, str], ...]:
+        """Get the terminal escape pair of every style slot.
+
+        Args:
+            variant (str): Variant name.
+            depth (str): Color depth, one of ``truecolor``, ``256`` or ``16``.
+
+        Returns:
+            tuple[tuple[str, str], ...]: ``(on, off)`` pairs indexed by slot,
+            as :func:`rosepineroles.escapes`.
+
+        Raises:
+            ValueError: If the variant or depth is unknown.
+        """
+        try:
+            return self._escapes[variant, depth]
+        except KeyError:
+            pass
+        self._check(variant)
+        if depth not in TERMINAL_FORMATS.values():
+            raise ValueError(f"unknown color depth: {depth!r}")
+        blob = str(self._blob(f"{variant}/escapes/{depth}"), "utf-8")
+        parts = blob.split(_SEPARATOR)
+        table = tuple(zip(parts[::2], parts[1::2]))
+        self._escapes[variant, depth] = table
+        return table
+
+    def stylesheet(
+        self, variant: str = "rose-pine", compact: bool = False
+    ) -> memoryview:
+        """Get a stylesheet of a variant without copying it.
+
+        Args:
+            variant (str): Variant name. Defaults to ``rose-pine``.
+            compact (bool): Get the stylesheet of
+                :class:`rosepinehtml.RosePineHtmlFormatter` instead of the
+                one of ``HtmlFormatter`` (see :func:`rosepinecss.stylesheet`).
+
+        Returns:
+            memoryview: UTF-8 encoded CSS.
+
+        Raises:
+            ValueError: If the variant is unknown.
+        """
+        self._check(variant)
+        kind = "compact-stylesheet" if compact else "stylesheet"
+        return self._blob(f"{variant}/{kind}")
+
+    def etag(self, variant: str = "rose-pine") -> str:
+        """Get the HTTP ``ETag`` of the ``HtmlFormatter`` stylesheet.
+
+        Args:
+            variant (str): Variant name. Defaults to ``rose-pine``.
+
+        Returns:
+            str: Quoted entity tag, as :func:`rosepinecss.etag`.
+
+        Raises:
+            ValueError: If the variant is unknown.
+        """
+        self._check(variant)
+        return self._etags[variant]
+
+    def formatter(
+        self,
+        variant: str = "rose-pine",
+        fmt: str = "terminal16m",
+        **options: Any,
+    ) -> "SharedTerminalFormatter":
+        """Build a terminal formatter reading the shared escapes.
+
+        Args:
+            variant (str): Variant name. Defaults to ``rose-pine``.
+            fmt (str): Terminal formatter alias, see :data:`TERMINAL_FORMATS`.
+                Defaults to ``terminal16m``.
+            **options (Any): Base formatter options, e.g. ``encoding``.
+
+        Returns:
+            SharedTerminalFormatter: Formatter writing the same output as
+            :func:`rosepineterm.formatter_for` would.
+
+        Raises:
+            ValueError: If the variant or format is unknown.
+        """
+        if fmt not in TERMINAL_FORMATS:
+            raise ValueError(f"not a terminal format: {fmt!r}")
+        return SharedTerminalFormatter(
+            self.escapes(variant, TERMINAL_FORMATS[fmt]), **options
+        )
+
+    def release(self) -> None:
+        """Drop the views into the buffer, so that it can be closed."""
+        self._data.release()
+        self._view.release()
+
+
+def attach(path: Union[str, Path]) -> SharedTables:
+    """Map a file written by :func:`export` read-only.
+
+    Args:
+        path (Union[str, Path]): File to map.
+
+    Returns:
+        SharedTables: Lookups into the mapping.
+    """
+    with open(path, "rb") as handle:
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return SharedTables(buffer)
+
+
+class SharedTerminalFormatter(Formatter):
+    """Terminal formatter using an escape table indexed by style slot.
+
+    Built by :meth:`SharedTables.formatter`. Takes the base formatter
+    options; line numbers and the other terminal formatter options are not
+    supported.
+    """
+
+    name = "RosePineShared"
+    aliases: list[str] = []
+    filenames: list[str] = []
+
+    def __init__(
+        self,
+        table: tuple[tuple[str, str], ...],
+        **options: Any,
+    ) -> None:
+        super().__init__(**options)
+        self.table = table
+
+    def format_unencoded(
+        self, tokensource: Iterable[tuple[_TokenType, str]], outfile: IO[str]
+    ) -> None:
+        """Write the tokens as ``TerminalTrueColorFormatter`` does.
+
+        Args:
+            tokensource (Iterable[tuple[_TokenType, str]]): Token stream.
+            outfile (IO[str]): Stream to write to.
+        """
+        table = self.table
+        write = outfile.write
+        for ttype, value in tokensource:
+            on, off = table[token_slot(ttype)]
+            write_escaped(write, value, on, off)
@@ -0,0 +1,229 @@
+"""Compact binary "styled span" output for renderers that paint themselves.
+
+:class:`RosePineSpanFormatter` writes a palette header followed by one
+fixed-size record per styled span, so a frontend can ``mmap`` the output
+and paint the source text without parsing HTML or escape sequences.
+
+Layout (all integers little-endian):
+
+* Header, :data:`HEADER_SIZE` bytes:
+
+  - ``b"RPSP"``, format version (``u16``), number of roles (``u16``) and
+    number of style slots (``u16``), then two bytes of padding.
+  - One ``r, g, b`` triple per palette role, in the field order of the
+    variant's ``Color`` dataclass (i.e. :data:`rosepinepalette.ROLES`).
+  - One ``role, flags`` byte pair per style slot (see
+    :data:`rosepinepalette.STYLE_SLOTS`). ``role`` is an index into the
+    colors above, or 255 for text without a color; ``flags`` combines
+    :data:`BOLD`, :data:`ITALIC` and :data:`UNDERLINE`.
+  - Zero padding up to a multiple of 4 bytes.
+
+* Records, until the end of the stream: ``offset``, ``length`` and
+  ``slot`` as three ``u32``. Offsets and lengths count code points of the
+  lexed text. Adjacent tokens with the same slot are merged and unstyled
+  text (slot 0) is left out.
+
+Slots are the same for every variant and the header has the same size, so
+a span file is re-themed by swapping its header, see :func:`retheme`.
+"""
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import IO, Any, NamedTuple
+
+from pygments.formatter import Formatter
+from pygments.token import _TokenType
+
+from rosepinepalette import (
+    PREFIXES,
+    ROLES,
+    STYLE_SLOTS,
+    VARIANTS,
+    make_color,
+    token_slot,
+)
+
+#: Magic bytes the output starts with.
+MAGIC: bytes = b"RPSP"
+
+#: Version of the layout.
+VERSION: int = 1
+
+#: Style slot flags.
+BOLD, ITALIC, UNDERLINE = 1, 2, 4
+
+#: ``role`` byte of slots without a color.
+NO_ROLE: int = 255
+
+_PREAMBLE = struct.Struct("<4sHHHxx")
+
+#: Size of the header, the same for every variant, padded to 4 bytes.
+HEADER_SIZE: int = _PREAMBLE.size + 3 * len(ROLES) + 2 * len(STYLE_SLOTS)
+HEADER_SIZE += -HEADER_SIZE % 4
+
+#: Number of ``u32`` per record.
+RECORD_FIELDS: int = 3
+
+# Records buffered before each write.
+_BATCH = 4096
+
+
+@lru_cache(maxsize=None)
+def header(variant: str) -> bytes:
+    """Build the header of a variant from its ``Color`` dataclass.
+
+    Args:
+        variant (str): Variant name.
+
+    Returns:
+        bytes: :data:`HEADER_SIZE` bytes.
+
+    Raises:
+        ValueError: If the variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+    color = make_color(variant)
+    prefix = PREFIXES[variant]
+    preamble = _PREAMBLE.pack(MAGIC, VERSION, len(ROLES), len(STYLE_SLOTS))
+    data = bytearray(preamble)
+    for role in ROLES:
+        data += bytes.fromhex(getattr(color, f"{prefix}_{role}").lstrip("#"))
+    for role, extra in STYLE_SLOTS:
+        flags = (
+            BOLD * ("bold" in extra.split())
+            | ITALIC * ("italic" in extra.split())
+            | UNDERLINE * ("underline" in extra.split())
+        )
+        data += bytes((ROLES.index(role) if role else NO_ROLE, flags))
+    data += bytes(HEADER_SIZE - len(data))
+    return bytes(data)
+
+
+class SpanFile(NamedTuple):
+    """Parsed span stream."""
+
+    #: ``#rrggbb`` color of every role.
+    colors: list[str]
+    #: ``(role, flags)`` of every style slot.
+    slots: list[tuple[int, int]]
+    #: Flat ``offset, length, slot`` values of every record.
+    records: memoryview
+
+    def spans(self) -> list[tuple[int, int, int]]:
+        """Group the records into ``(offset, length, slot)`` tuples.
+
+        Returns:
+            list[tuple[int, int, int]]: One tuple per record.
+        """
+        values = self.records.tolist()
+        return list(zip(values[0::3], values[1::3], values[2::3]))
+
+
+def read_spans(data: bytes) -> SpanFile:
+    """Parse a span stream without copying its records.
+
+    Args:
+        data (bytes): Output of :class:`RosePineSpanFormatter`, or any
+            buffer, e.g. an ``mmap``.
+
+    Returns:
+        SpanFile: Palette, slots and records.
+
+    Raises:
+        ValueError: If the data is not a span stream of a known version.
+    """
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise ValueError("not a Rose Pine span stream")
+    magic, version, roles, slots = _PREAMBLE.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a Rose Pine span stream")
+    pos = _PREAMBLE.size
+    end = pos + 3 * roles
+    colors = [f"#{bytes(view[i:i + 3]).hex()}" for i in range(pos, end, 3)]
+    pos += 3 * roles
+    pairs = [(view[i], view[i + 1]) for i in range(pos, pos + 2 * slots, 2)]
+    records = view[HEADER_SIZE:]
+    if sys.byteorder == "big":
+        swapped = array("I", records)
+        swapped.byteswap()
+        records = memoryview(swapped)
+    else:
+        records = records.cast("I")
+    return SpanFile(colors, pairs, records)
+
+
+def retheme(data: bytes, variant: str) -> bytes:
+    """Switch a span stream to another variant.
+
+    Args:
+        data (bytes): Span stream.
+        variant (str): Variant to switch to.
+
+    Returns:
+        bytes: The same records behind the header of ``variant``.
+    """
+    read_spans(data[:HEADER_SIZE])  # Validates the header.
+    return header(variant) + data[HEADER_SIZE:]
+
+
+class RosePineSpanFormatter(Formatter):
+    """Write tokens as a binary span stream, see the module documentation.
+
+    Options accepted:
+
+    ``style`` : string or style class
+        Rose Pine variant, or its style class, whose palette goes in the
+        header. Defaults to ``rose-pine``.
+    """
+
+    name = "RosePineSpans"
+    aliases = ["rose-pine-spans"]
+    filenames = ["*.rpspan"]
+    unicodeoutput = False
+
+    def __init__(self, **options: Any) -> None:
+        style = options.pop("style", "rose-pine")
+        super().__init__(**options)
+        self.variant = style if isinstance(style, str) else style.name
+        self.header = header(self.variant)
+        # Binary output: makes ``pygments.highlight`` collect bytes, as
+        # ``ImageFormatter`` does.
+        self.encoding = "latin1"
+
+    def format(
+        self, tokensource: Iterable[tuple[_TokenType, str]], outfile: IO[bytes]
+    ) -> None:
+        """Write the header and the span records.
+
+        Args:
+            tokensource (Iterable[tuple[_TokenType, str]]): Token stream.
+            outfile (IO[bytes]): Binary stream.
+        """
+        outfile.write(self.header)
+        records = array("I")
+        offset = start = 0
+        current = 0
+        for ttype, value in tokensource:
+            slot = token_slot(ttype)
+            if slot != current:
+                if current and offset > start:
+                    records.extend((start, offset - start, current))
+                    if len(records) >= _BATCH * RECORD_FIELDS:
+                        self._flush(records, outfile)
+                start, current = offset, slot
+            offset += len(value)
+        if current and offset > start:
+            records.extend((start, offset - start, current))
+        self._flush(records, outfile)
+
+    @staticmethod
+    def _flush(records: array, outfile: IO[bytes]) -> None:
+        if sys.byteorder == "big":
+            records.byteswap()
+        outfile.write(records.tobytes())
+        del records[:]
@@ -0,0 +1,230 @@
+"""Streaming highlighting of arbitrarily large inputs.
+
+``pygments.highlight`` needs the whole input, and builds the whole output,
+in memory. :func:`highlight_stream` instead reads the input a chunk of
+lines at a time, resumes the lexer from where the previous chunk left it
+(see :mod:`rosepinelexer`), and hands the output over in bounded chunks,
+so memory use stays flat however large the input is.
+"""
+
+import codecs
+from collections.abc import Iterable, Iterator
+from typing import IO, Optional, Union
+
+from pygments.filter import apply_filters
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.token import _TokenType
+
+from rosepinelexer import (
+    LOOKAHEAD,
+    MAX_CARRY,
+    can_resume,
+    is_stateless,
+    lex_chunks,
+    normalize,
+    resync_chunks,
+)
+from rosepinemetrics import format_tokens
+from rosepineterm import get_formatter
+
+#: Default size of the input and output chunks, in characters.
+CHUNK_SIZE: int = 64 * 1024
+
+
+class ChunkedWriter:
+    """File-like object that forwards writes in chunks of bounded size.
+
+    Formatters write one small piece per token; batching them keeps the
+    number of writes to the underlying stream low while holding at most
+    about ``chunk_size`` characters in memory.
+
+    Args:
+        stream (IO[str]): Writable stream.
+        chunk_size (int): Number of characters to buffer before writing.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._parts: list[Union[str, bytes]] = []
+        self._size = 0
+
+    def write(self, text: Union[str, bytes]) -> int:
+        """Buffer text, writing the buffer out once it is full.
+
+        Args:
+            text (Union[str, bytes]): Text, or bytes when the formatter has
+                an ``encoding`` and ``stream`` is binary.
+
+        Returns:
+            int: Number of characters written.
+        """
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        """Write the buffered text to the underlying stream."""
+        if self._parts:
+            empty = self._parts[0][:0]
+            self.stream.write(empty.join(self._parts))  # type: ignore
+            self._parts.clear()
+            self._size = 0
+
+
+def _decoded(
+    source: Iterable[Union[str, bytes]],
+    lexer: Lexer,
+) -> Iterator[str]:
+    """Decode the lines of a source, dropping a leading byte order mark.
+
+    Args:
+        source (Iterable[Union[str, bytes]]): Text or binary lines.
+        lexer (Lexer): Lexer whose ``encoding`` option to honour.
+
+    Yields:
+        str: Decoded lines.
+    """
+    encoding = lexer.encoding
+    if encoding in ("guess", "chardet"):
+        # Guessing needs the whole input; stick to the common case.
+        encoding = "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    first = True
+    for line in source:
+        text = decoder.decode(line) if isinstance(line, bytes) else line
+        if first and text:
+            text = text.removeprefix("\ufeff")
+            first = False
+        yield text
+
+
+def iter_chunks(
+    source: Iterable[Union[str, bytes]],
+    lexer: Lexer,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[str]:
+    """Split a source into preprocessed chunks of whole lines.
+
+    The chunks concatenate to exactly what ``Lexer.get_tokens`` would lex
+    after its own preprocessing, including the document-wide ``stripnl``,
+    ``stripall`` and ``ensurenl`` options.
+
+    Args:
+        source (Iterable[Union[str, bytes]]): File or iterator of lines.
+        lexer (Lexer): Lexer whose options to honour.
+        chunk_size (int): Approximate chunk size, in characters.
+
+    Yields:
+        str: Chunks ending at line boundaries.
+    """
+    strip = "" if lexer.stripall else "\n" if lexer.stripnl else None
+    buffer: list[str] = []
+    size = 0
+    # The last line with content and the blank lines after it, which are
+    # only known to be trailing once the input is exhausted.
+    pending: list[str] = []
+    started = strip is None
+    for line in _decoded(source, lexer):
+        for piece in normalize(lexer, line).splitlines(keepends=True):
+            if not started:
+                piece = piece.lstrip(strip or None)
+                if not piece:
+                    continue
+                started = True
+            if strip is not None and not piece.strip(strip or None):
+                pending.append(piece)
+                continue
+            buffer.extend(pending)
+            size += sum(map(len, pending))
+            pending = [piece]
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+    if strip is not None and pending:
+        pending = [pending[0].rstrip(strip or None)]
+    tail = "".join(buffer + pending)
+    if lexer.ensurenl and not tail.endswith("\n"):
+        tail += "\n"
+    yield tail
+
+
+def stream_tokens(
+    source: Iterable[Union[str, bytes]],
+    lexer: Lexer,
+    chunk_size: int = CHUNK_SIZE,
+    lookahead: int = LOOKAHEAD,
+    max_carry: int = MAX_CARRY,
+) -> Iterator[tuple[_TokenType, str]]:
+    """Lex a source incrementally, chunk by chunk.
+
+    Lexers that cannot be resumed (see :func:`rosepinelexer.can_resume`)
+    are restarted from scratch where that gives the same tokens (see
+    :func:`rosepinelexer.resync_chunks`), except for lexers that keep no
+    state, like ``TextLexer``, which lex each chunk on its own.
+
+    Args:
+        source (Iterable[Union[str, bytes]]): File or iterator of lines.
+        lexer (Lexer): Lexer to use.
+        chunk_size (int): Approximate chunk size, in characters.
+        lookahead (int): Context kept between chunks, see
+            :func:`rosepinelexer.lex_chunks`.
+        max_carry (int): Context past which tokens are yielded anyway, see
+            :func:`rosepinelexer.lex_chunks`.
+
+    Yields:
+        tuple[_TokenType, str]: Token type and value, after the lexer's
+        filters.
+    """
+    chunks = iter_chunks(source, lexer, chunk_size)
+
+    def unfiltered() -> Iterator[tuple[_TokenType, str]]:
+        if is_stateless(lexer):
+            for chunk in chunks:
+                for _, ttype, value in lexer.get_tokens_unprocessed(chunk):
+                    yield ttype, value
+            return
+        lex = lex_chunks if can_resume(lexer) else resync_chunks
+        for _, ttype, value in lex(lexer, chunks, lookahead, max_carry):
+            yield ttype, value
+
+    return apply_filters(unfiltered(), lexer.filters, lexer)
+
+
+def highlight_stream(
+    source: Iterable[Union[str, bytes]],
+    lexer: Lexer,
+    outfile: IO[str],
+    variant: str = "rose-pine",
+    formatter: Optional[Formatter] = None,
+    chunk_size: int = CHUNK_SIZE,
+    lookahead: int = LOOKAHEAD,
+    max_carry: int = MAX_CARRY,
+) -> None:
+    """Highlight a file or iterator of lines into a writable stream.
+
+    Args:
+        source (Iterable[Union[str, bytes]]): File or iterator of lines.
+        lexer (Lexer): Lexer to use.
+        outfile (IO[str]): Writable text stream.
+        variant (str): Rose Pine variant for the default true color
+            formatter. Defaults to ``rose-pine``.
+        formatter (Optional[Formatter]): Formatter to use instead of the
+            default one, e.g. an ``HtmlFormatter`` with a Rose Pine style.
+        chunk_size (int): Approximate size of the input and output chunks,
+            in characters.
+        lookahead (int): Context kept between chunks, see
+            :func:`rosepinelexer.lex_chunks`.
+        max_carry (int): Context past which tokens are yielded anyway, see
+            :func:`rosepinelexer.lex_chunks`.
+    """
+    if formatter is None:
+        formatter = get_formatter(variant)
+    writer = ChunkedWriter(outfile, chunk_size)
+    tokens = stream_tokens(source, lexer, chunk_size, lookahead, max_carry)
+    format_tokens(tokens, formatter, writer)
+    writer.flush()
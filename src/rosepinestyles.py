@@ -0,0 +1,138 @@
+"""Lightweight ``pygments.styles`` entry points for the Rose Pine variants.
+
+Pygments loads every registered style plugin to list them, e.g. in
+``pygments.styles.get_all_styles()``. The classes in this module are
+placeholders that register the three names without building anything:
+the real style is only built from :mod:`rosepinepalette` the first time
+one of its attributes is used, e.g. when a formatter iterates over it.
+
+The placeholders are still ``Style`` subclasses, so they pass the
+``issubclass`` checks done by hosts such as IPython and prompt_toolkit.
+To customize a variant, subclass the real style instead, e.g.
+``rosepine.RosePineStyle``.
+"""
+
+from pygments.style import Style, StyleMeta
+from pygments.token import _TokenType
+
+from rosepinepalette import ENTRY_POINTS, THEMES, build_style
+
+# Importing ``typing`` would double the cold-start cost of this module.
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from rosepineresolve import StyleRecord
+
+#: Style attributes that are forwarded to the real style class.
+FORWARDED: tuple[str, ...] = (
+    "styles",
+    "_styles",
+    "background_color",
+    "highlight_color",
+    "line_number_color",
+    "line_number_background_color",
+    "line_number_special_color",
+    "line_number_special_background_color",
+    "aliases",
+    "web_style_gallery_exclude",
+    "records",
+)
+
+
+def _forward(attribute: str) -> property:
+    """Build a metaclass property that reads an attribute of the real style.
+
+    Args:
+        attribute (str): Attribute name.
+
+    Returns:
+        property: Read-only property resolving the style on first use.
+    """
+    return property(lambda cls: getattr(cls.resolve(), attribute))
+
+
+class LazyStyleMeta(StyleMeta):
+    """Metaclass of the placeholder styles.
+
+    Unlike ``StyleMeta`` it does not resolve the style definitions when the
+    class is created. The forwarded attributes are data descriptors on the
+    metaclass, so they take precedence over the defaults inherited from
+    ``Style``.
+    """
+
+    _variant: str
+
+    def __new__(
+        mcs, name: str, bases: tuple[type, ...], dct: dict[str, object]
+    ) -> "LazyStyleMeta":
+        """Create the placeholder class without resolving any style.
+
+        Args:
+            name (str): Class name.
+            bases (tuple[type, ...]): Base classes.
+            dct (dict[str, object]): Class namespace.
+
+        Returns:
+            LazyStyleMeta: The placeholder class.
+        """
+        return type.__new__(mcs, name, bases, dct)
+
+    def resolve(cls) -> StyleMeta:
+        """Build (once) and return the real style class.
+
+        Returns:
+            StyleMeta: The style class built from the palette.
+        """
+        return build_style(cls._variant)
+
+    def style_for_token(cls, token: _TokenType) -> dict[str, object]:
+        """Get the resolved style definition of a token type.
+
+        Args:
+            token (_TokenType): Token type known to the style.
+
+        Returns:
+            dict[str, object]: Definition from the real style.
+        """
+        return cls.resolve().style_for_token(token)
+
+    def record_for_token(cls, token: _TokenType) -> "StyleRecord":
+        """Get the compact resolved style of any token type.
+
+        Args:
+            token (_TokenType): Token type.
+
+        Returns:
+            StyleRecord: Resolved style from the real style.
+        """
+        return cls.resolve().record_for_token(token)
+
+
+for _attribute in FORWARDED:
+    setattr(LazyStyleMeta, _attribute, _forward(_attribute))
+
+
+def lazy_style(variant: str) -> LazyStyleMeta:
+    """Create the placeholder style of a variant.
+
+    Args:
+        variant (str): Variant name.
+
+    Returns:
+        LazyStyleMeta: Placeholder registered as a ``pygments.styles`` entry
+        point.
+    """
+    return LazyStyleMeta(
+        ENTRY_POINTS[variant][1],
+        (Style,),
+        {
+            "__doc__": f"Lazily built {THEMES[variant]} style for Pygments.",
+            "__module__": __name__,
+            "name": variant,
+            "_variant": variant,
+        },
+    )
+
+
+RosePineStyle = lazy_style("rose-pine")
+RosePineMoonStyle = lazy_style("rose-pine-moon")
+RosePineDawnStyle = lazy_style("rose-pine-dawn")
@@ -0,0 +1,1018 @@
+"""Precomputed Rose Pine tables.
+
+This file is generated by ``rosepinebuild.py``. Do not edit it by hand.
+"""
+
+# flake8: noqa
+# fmt: off
+
+TERMINAL_ESCAPES = {
+    'rose-pine': {
+        'truecolor': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;2;196;167;231;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;2;49;116;143m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;2;235;188;186m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '256': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;5;147;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;5;31m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;5;217m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '16': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[90m', '\x1b[39m'),
+            'Token.Error': ('\x1b[91m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[91m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[95;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[91m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[36m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[37m', '\x1b[39m'),
+            'Token.Text': ('\x1b[37m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[90m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[37m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[37m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[91m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[90m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+    },
+    'rose-pine-moon': {
+        'truecolor': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;2;196;167;231;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;2;156;207;216m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;2;62;143;176m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;2;235;111;146m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;2;224;222;244m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;2;246;193;119m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;2;234;154;151m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;2;144;140;170m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '256': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;5;147;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;5;116m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;5;67m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;5;204m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;5;189m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;5;215m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;5;210m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;5;103m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '16': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[90m', '\x1b[39m'),
+            'Token.Error': ('\x1b[91m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[91m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[95;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[91m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[36m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[37m', '\x1b[39m'),
+            'Token.Text': ('\x1b[37m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[90m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[37m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[91m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[37m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[37m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[91m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[90m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+    },
+    'rose-pine-dawn': {
+        'truecolor': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;2;180;99;122m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;2;86;148;159m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;2;180;99;122m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;2;86;148;159m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;2;144;122;169;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;2;86;148;159m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;2;180;99;122m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;2;180;99;122m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;2;40;105;131m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;2;180;99;122m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;2;87;82;121m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;2;234;157;52m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;2;215;130;126m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;2;121;117;147m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '256': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Error': ('\x1b[38;5;132m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[38;5;66m', '\x1b[39m'),
+            'Token.Name': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[38;5;132m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[38;5;66m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[38;5;103;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[38;5;66m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[38;5;132m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[38;5;132m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Text': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[38;5;24m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[38;5;132m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[38;5;60m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[38;5;179m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[38;5;174m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[38;5;243m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+        '16': {
+            'Token': ('', ''),
+            'Token.Comment': ('\x1b[90m', '\x1b[39m'),
+            'Token.Error': ('\x1b[31m', '\x1b[39m'),
+            'Token.Keyword': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Namespace': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Constant': ('\x1b[91m', '\x1b[39m'),
+            'Token.Keyword.Type': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Builtin': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Builtin.Pseudo': ('\x1b[31m', '\x1b[39m'),
+            'Token.Name.Class': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Decorator': ('\x1b[35;01m', '\x1b[39;00m'),
+            'Token.Name.Exception': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Function': ('\x1b[31m', '\x1b[39m'),
+            'Token.Name.Variable': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Variable.Magic': ('\x1b[31m', '\x1b[39m'),
+            'Token.Literal': ('', ''),
+            'Token.Literal.Number': ('\x1b[91m', '\x1b[39m'),
+            'Token.Operator': ('\x1b[36m', '\x1b[39m'),
+            'Token.Operator.Word': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Affix': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Escape': ('\x1b[36m', '\x1b[39m'),
+            'Token.Literal.String.Interpol': ('\x1b[94m', '\x1b[39m'),
+            'Token.Text': ('\x1b[94m', '\x1b[39m'),
+            'Token.Punctuation': ('\x1b[90m', '\x1b[39m'),
+            'Token.Text.Whitespace': ('\x1b[94m', '\x1b[39m'),
+            'Token.Escape': ('', ''),
+            'Token.Other': ('', ''),
+            'Token.Keyword.Declaration': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Pseudo': ('\x1b[36m', '\x1b[39m'),
+            'Token.Keyword.Reserved': ('\x1b[36m', '\x1b[39m'),
+            'Token.Name.Attribute': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Constant': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Entity': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Function.Magic': ('\x1b[31m', '\x1b[39m'),
+            'Token.Name.Property': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Label': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Namespace': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Other': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Tag': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Variable.Class': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Variable.Global': ('\x1b[94m', '\x1b[39m'),
+            'Token.Name.Variable.Instance': ('\x1b[94m', '\x1b[39m'),
+            'Token.Literal.Date': ('', ''),
+            'Token.Literal.String.Backtick': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Char': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Delimiter': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Doc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Double': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Heredoc': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Other': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Regex': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Single': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.String.Symbol': ('\x1b[33m', '\x1b[39m'),
+            'Token.Literal.Number.Bin': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Float': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Hex': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Integer.Long': ('\x1b[91m', '\x1b[39m'),
+            'Token.Literal.Number.Oct': ('\x1b[91m', '\x1b[39m'),
+            'Token.Punctuation.Marker': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Hashbang': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Multiline': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Preproc': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.PreprocFile': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Single': ('\x1b[90m', '\x1b[39m'),
+            'Token.Comment.Special': ('\x1b[90m', '\x1b[39m'),
+            'Token.Generic': ('', ''),
+            'Token.Generic.Deleted': ('', ''),
+            'Token.Generic.Emph': ('', ''),
+            'Token.Generic.Error': ('', ''),
+            'Token.Generic.Heading': ('', ''),
+            'Token.Generic.Inserted': ('', ''),
+            'Token.Generic.Output': ('', ''),
+            'Token.Generic.Prompt': ('', ''),
+            'Token.Generic.Strong': ('', ''),
+            'Token.Generic.Subheading': ('', ''),
+            'Token.Generic.EmphStrong': ('', ''),
+            'Token.Generic.Traceback': ('', ''),
+        },
+    },
+}
+
+QUANTIZED = {
+    'rose-pine': {
+        '#191724': (234, 0),
+        '#1f1d2e': (234, 0),
+        '#21202e': (235, 0),
+        '#26233a': (235, 0),
+        '#31748f': (31, 6),
+        '#403d52': (238, 8),
+        '#524f67': (239, 8),
+        '#6e6a86': (60, 8),
+        '#908caa': (103, 8),
+        '#9ccfd8': (116, 6),
+        '#c4a7e7': (147, 13),
+        '#e0def4': (189, 7),
+        '#eb6f92': (204, 9),
+        '#ebbcba': (217, 9),
+        '#f6c177': (215, 3),
+    },
+    'rose-pine-moon': {
+        '#232136': (235, 0),
+        '#2a273f': (235, 0),
+        '#2a283e': (236, 0),
+        '#393552': (237, 4),
+        '#3e8fb0': (67, 6),
+        '#44415a': (238, 8),
+        '#56526e': (240, 8),
+        '#6e6a86': (60, 8),
+        '#908caa': (103, 8),
+        '#9ccfd8': (116, 6),
+        '#c4a7e7': (147, 13),
+        '#e0def4': (189, 7),
+        '#ea9a97': (210, 9),
+        '#eb6f92': (204, 9),
+        '#f6c177': (215, 3),
+    },
+    'rose-pine-dawn': {
+        '#286983': (24, 6),
+        '#56949f': (66, 6),
+        '#575279': (60, 12),
+        '#797593': (243, 8),
+        '#907aa9': (103, 5),
+        '#9893a5': (246, 8),
+        '#b4637a': (132, 1),
+        '#cecacd': (252, 7),
+        '#d7827e': (174, 9),
+        '#dfdad9': (253, 7),
+        '#ea9d34': (179, 3),
+        '#f2e9e1': (255, 7),
+        '#f4ede8': (255, 7),
+        '#faf4ed': (255, 15),
+        '#fffaf3': (231, 15),
+    },
+}
+
+STYLESHEETS = {
+    'rose-pine': b'pre{line-height:125%}td.linenos .normal{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}span.linenos{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}td.linenos .special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}span.linenos.special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}.highlight .hll{background-color:#ffffcc}.highlight{background:#191724;color:#E0DEF4}.highlight .c{color:#908CAA}.highlight .err{color:#EB6F92}.highlight .k{color:#31748F}.highlight .n{color:#E0DEF4}.highlight .o{color:#31748F}.highlight .p{color:#908CAA}.highlight .ch{color:#908CAA}.highlight .cm{color:#908CAA}.highlight .cp{color:#908CAA}.highlight .cpf{color:#908CAA}.highlight .c1{color:#908CAA}.highlight .cs{color:#908CAA}.highlight .kc{color:#EBBCBA}.highlight .kd{color:#31748F}.highlight .kn{color:#31748F}.highlight .kp{color:#31748F}.highlight .kr{color:#31748F}.highlight .kt{color:#9CCFD8}.highlight .m{color:#EBBCBA}.highlight .s{color:#F6C177}.highlight .na{color:#E0DEF4}.highlight .nb{color:#E0DEF4}.highlight .nc{color:#9CCFD8}.highlight .no{color:#E0DEF4}.highlight .nd{color:#C4A7E7;font-weight:bold}.highlight .ni{color:#E0DEF4}.highlight .ne{color:#9CCFD8}.highlight .nf{color:#EB6F92}.highlight .nl{color:#E0DEF4}.highlight .nn{color:#E0DEF4}.highlight .nx{color:#E0DEF4}.highlight .py{color:#E0DEF4}.highlight .nt{color:#E0DEF4}.highlight .nv{color:#E0DEF4}.highlight .ow{color:#31748F}.highlight .pm{color:#908CAA}.highlight .w{color:#E0DEF4}.highlight .mb{color:#EBBCBA}.highlight .mf{color:#EBBCBA}.highlight .mh{color:#EBBCBA}.highlight .mi{color:#EBBCBA}.highlight .mo{color:#EBBCBA}.highlight .sa{color:#31748F}.highlight .sb{color:#F6C177}.highlight .sc{color:#F6C177}.highlight .dl{color:#F6C177}.highlight .sd{color:#F6C177}.highlight .s2{color:#F6C177}.highlight .se{color:#31748F}.highlight .sh{color:#F6C177}.highlight .si{color:#E0DEF4}.highlight .sx{color:#F6C177}.highlight .sr{color:#F6C177}.highlight .s1{color:#F6C177}.highlight .ss{color:#F6C177}.highlight .bp{color:#EB6F92}.highlight .fm{color:#EB6F92}.highlight .vc{color:#E0DEF4}.highlight .vg{color:#E0DEF4}.highlight .vi{color:#E0DEF4}.highlight .vm{color:#EB6F92}.highlight .il{color:#EBBCBA}',
+    'rose-pine-moon': b'pre{line-height:125%}td.linenos .normal{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}span.linenos{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}td.linenos .special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}span.linenos.special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}.highlight .hll{background-color:#ffffcc}.highlight{background:#232136;color:#E0DEF4}.highlight .c{color:#908CAA}.highlight .err{color:#EB6F92}.highlight .k{color:#3E8FB0}.highlight .n{color:#E0DEF4}.highlight .o{color:#3E8FB0}.highlight .p{color:#908CAA}.highlight .ch{color:#908CAA}.highlight .cm{color:#908CAA}.highlight .cp{color:#908CAA}.highlight .cpf{color:#908CAA}.highlight .c1{color:#908CAA}.highlight .cs{color:#908CAA}.highlight .kc{color:#EA9A97}.highlight .kd{color:#3E8FB0}.highlight .kn{color:#3E8FB0}.highlight .kp{color:#3E8FB0}.highlight .kr{color:#3E8FB0}.highlight .kt{color:#9CCFD8}.highlight .m{color:#EA9A97}.highlight .s{color:#F6C177}.highlight .na{color:#E0DEF4}.highlight .nb{color:#E0DEF4}.highlight .nc{color:#9CCFD8}.highlight .no{color:#E0DEF4}.highlight .nd{color:#C4A7E7;font-weight:bold}.highlight .ni{color:#E0DEF4}.highlight .ne{color:#9CCFD8}.highlight .nf{color:#EB6F92}.highlight .nl{color:#E0DEF4}.highlight .nn{color:#E0DEF4}.highlight .nx{color:#E0DEF4}.highlight .py{color:#E0DEF4}.highlight .nt{color:#E0DEF4}.highlight .nv{color:#E0DEF4}.highlight .ow{color:#3E8FB0}.highlight .pm{color:#908CAA}.highlight .w{color:#E0DEF4}.highlight .mb{color:#EA9A97}.highlight .mf{color:#EA9A97}.highlight .mh{color:#EA9A97}.highlight .mi{color:#EA9A97}.highlight .mo{color:#EA9A97}.highlight .sa{color:#3E8FB0}.highlight .sb{color:#F6C177}.highlight .sc{color:#F6C177}.highlight .dl{color:#F6C177}.highlight .sd{color:#F6C177}.highlight .s2{color:#F6C177}.highlight .se{color:#3E8FB0}.highlight .sh{color:#F6C177}.highlight .si{color:#E0DEF4}.highlight .sx{color:#F6C177}.highlight .sr{color:#F6C177}.highlight .s1{color:#F6C177}.highlight .ss{color:#F6C177}.highlight .bp{color:#EB6F92}.highlight .fm{color:#EB6F92}.highlight .vc{color:#E0DEF4}.highlight .vg{color:#E0DEF4}.highlight .vi{color:#E0DEF4}.highlight .vm{color:#EB6F92}.highlight .il{color:#EA9A97}',
+    'rose-pine-dawn': b'pre{line-height:125%}td.linenos .normal{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}span.linenos{color:inherit;background-color:transparent;padding-left:5px;padding-right:5px}td.linenos .special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}span.linenos.special{color:#000000;background-color:#ffffc0;padding-left:5px;padding-right:5px}.highlight .hll{background-color:#ffffcc}.highlight{background:#faf4ed;color:#575279}.highlight .c{color:#797593}.highlight .err{color:#B4637A}.highlight .k{color:#286983}.highlight .n{color:#575279}.highlight .o{color:#286983}.highlight .p{color:#797593}.highlight .ch{color:#797593}.highlight .cm{color:#797593}.highlight .cp{color:#797593}.highlight .cpf{color:#797593}.highlight .c1{color:#797593}.highlight .cs{color:#797593}.highlight .kc{color:#D7827E}.highlight .kd{color:#286983}.highlight .kn{color:#286983}.highlight .kp{color:#286983}.highlight .kr{color:#286983}.highlight .kt{color:#56949F}.highlight .m{color:#D7827E}.highlight .s{color:#EA9D34}.highlight .na{color:#575279}.highlight .nb{color:#575279}.highlight .nc{color:#56949F}.highlight .no{color:#575279}.highlight .nd{color:#907AA9;font-weight:bold}.highlight .ni{color:#575279}.highlight .ne{color:#56949F}.highlight .nf{color:#B4637A}.highlight .nl{color:#575279}.highlight .nn{color:#575279}.highlight .nx{color:#575279}.highlight .py{color:#575279}.highlight .nt{color:#575279}.highlight .nv{color:#575279}.highlight .ow{color:#286983}.highlight .pm{color:#797593}.highlight .w{color:#575279}.highlight .mb{color:#D7827E}.highlight .mf{color:#D7827E}.highlight .mh{color:#D7827E}.highlight .mi{color:#D7827E}.highlight .mo{color:#D7827E}.highlight .sa{color:#286983}.highlight .sb{color:#EA9D34}.highlight .sc{color:#EA9D34}.highlight .dl{color:#EA9D34}.highlight .sd{color:#EA9D34}.highlight .s2{color:#EA9D34}.highlight .se{color:#286983}.highlight .sh{color:#EA9D34}.highlight .si{color:#575279}.highlight .sx{color:#EA9D34}.highlight .sr{color:#EA9D34}.highlight .s1{color:#EA9D34}.highlight .ss{color:#EA9D34}.highlight .bp{color:#B4637A}.highlight .fm{color:#B4637A}.highlight .vc{color:#575279}.highlight .vg{color:#575279}.highlight .vi{color:#575279}.highlight .vm{color:#B4637A}.highlight .il{color:#D7827E}',
+}
+
+STYLESHEET_ETAGS = {
+    'rose-pine': '"2c5e2721e98f044e59333e981016fb87"',
+    'rose-pine-moon': '"108bfae10e0b3d046b43ca7a65c01d9a"',
+    'rose-pine-dawn': '"1e26afc308ef3b079c6d09cdfbcb7e59"',
+}
+
+INLINE_STYLES = {
+    'rose-pine': {
+        'Token.Comment': 'color: #908CAA',
+        'Token.Error': 'color: #EB6F92',
+        'Token.Keyword': 'color: #31748F',
+        'Token.Keyword.Namespace': 'color: #31748F',
+        'Token.Keyword.Constant': 'color: #EBBCBA',
+        'Token.Keyword.Type': 'color: #9CCFD8',
+        'Token.Name': 'color: #E0DEF4',
+        'Token.Name.Builtin': 'color: #E0DEF4',
+        'Token.Name.Builtin.Pseudo': 'color: #EB6F92',
+        'Token.Name.Class': 'color: #9CCFD8',
+        'Token.Name.Decorator': 'color: #C4A7E7; font-weight: bold',
+        'Token.Name.Exception': 'color: #9CCFD8',
+        'Token.Name.Function': 'color: #EB6F92',
+        'Token.Name.Variable': 'color: #E0DEF4',
+        'Token.Name.Variable.Magic': 'color: #EB6F92',
+        'Token.Literal.Number': 'color: #EBBCBA',
+        'Token.Operator': 'color: #31748F',
+        'Token.Operator.Word': 'color: #31748F',
+        'Token.Literal.String': 'color: #F6C177',
+        'Token.Literal.String.Affix': 'color: #31748F',
+        'Token.Literal.String.Escape': 'color: #31748F',
+        'Token.Literal.String.Interpol': 'color: #E0DEF4',
+        'Token.Text': 'color: #E0DEF4',
+        'Token.Punctuation': 'color: #908CAA',
+        'Token.Text.Whitespace': 'color: #E0DEF4',
+        'Token.Keyword.Declaration': 'color: #31748F',
+        'Token.Keyword.Pseudo': 'color: #31748F',
+        'Token.Keyword.Reserved': 'color: #31748F',
+        'Token.Name.Attribute': 'color: #E0DEF4',
+        'Token.Name.Constant': 'color: #E0DEF4',
+        'Token.Name.Entity': 'color: #E0DEF4',
+        'Token.Name.Function.Magic': 'color: #EB6F92',
+        'Token.Name.Property': 'color: #E0DEF4',
+        'Token.Name.Label': 'color: #E0DEF4',
+        'Token.Name.Namespace': 'color: #E0DEF4',
+        'Token.Name.Other': 'color: #E0DEF4',
+        'Token.Name.Tag': 'color: #E0DEF4',
+        'Token.Name.Variable.Class': 'color: #E0DEF4',
+        'Token.Name.Variable.Global': 'color: #E0DEF4',
+        'Token.Name.Variable.Instance': 'color: #E0DEF4',
+        'Token.Literal.String.Backtick': 'color: #F6C177',
+        'Token.Literal.String.Char': 'color: #F6C177',
+        'Token.Literal.String.Delimiter': 'color: #F6C177',
+        'Token.Literal.String.Doc': 'color: #F6C177',
+        'Token.Literal.String.Double': 'color: #F6C177',
+        'Token.Literal.String.Heredoc': 'color: #F6C177',
+        'Token.Literal.String.Other': 'color: #F6C177',
+        'Token.Literal.String.Regex': 'color: #F6C177',
+        'Token.Literal.String.Single': 'color: #F6C177',
+        'Token.Literal.String.Symbol': 'color: #F6C177',
+        'Token.Literal.Number.Bin': 'color: #EBBCBA',
+        'Token.Literal.Number.Float': 'color: #EBBCBA',
+        'Token.Literal.Number.Hex': 'color: #EBBCBA',
+        'Token.Literal.Number.Integer': 'color: #EBBCBA',
+        'Token.Literal.Number.Integer.Long': 'color: #EBBCBA',
+        'Token.Literal.Number.Oct': 'color: #EBBCBA',
+        'Token.Punctuation.Marker': 'color: #908CAA',
+        'Token.Comment.Hashbang': 'color: #908CAA',
+        'Token.Comment.Multiline': 'color: #908CAA',
+        'Token.Comment.Preproc': 'color: #908CAA',
+        'Token.Comment.PreprocFile': 'color: #908CAA',
+        'Token.Comment.Single': 'color: #908CAA',
+        'Token.Comment.Special': 'color: #908CAA',
+    },
+    'rose-pine-moon': {
+        'Token.Comment': 'color: #908CAA',
+        'Token.Error': 'color: #EB6F92',
+        'Token.Keyword': 'color: #3E8FB0',
+        'Token.Keyword.Namespace': 'color: #3E8FB0',
+        'Token.Keyword.Constant': 'color: #EA9A97',
+        'Token.Keyword.Type': 'color: #9CCFD8',
+        'Token.Name': 'color: #E0DEF4',
+        'Token.Name.Builtin': 'color: #E0DEF4',
+        'Token.Name.Builtin.Pseudo': 'color: #EB6F92',
+        'Token.Name.Class': 'color: #9CCFD8',
+        'Token.Name.Decorator': 'color: #C4A7E7; font-weight: bold',
+        'Token.Name.Exception': 'color: #9CCFD8',
+        'Token.Name.Function': 'color: #EB6F92',
+        'Token.Name.Variable': 'color: #E0DEF4',
+        'Token.Name.Variable.Magic': 'color: #EB6F92',
+        'Token.Literal.Number': 'color: #EA9A97',
+        'Token.Operator': 'color: #3E8FB0',
+        'Token.Operator.Word': 'color: #3E8FB0',
+        'Token.Literal.String': 'color: #F6C177',
+        'Token.Literal.String.Affix': 'color: #3E8FB0',
+        'Token.Literal.String.Escape': 'color: #3E8FB0',
+        'Token.Literal.String.Interpol': 'color: #E0DEF4',
+        'Token.Text': 'color: #E0DEF4',
+        'Token.Punctuation': 'color: #908CAA',
+        'Token.Text.Whitespace': 'color: #E0DEF4',
+        'Token.Keyword.Declaration': 'color: #3E8FB0',
+        'Token.Keyword.Pseudo': 'color: #3E8FB0',
+        'Token.Keyword.Reserved': 'color: #3E8FB0',
+        'Token.Name.Attribute': 'color: #E0DEF4',
+        'Token.Name.Constant': 'color: #E0DEF4',
+        'Token.Name.Entity': 'color: #E0DEF4',
+        'Token.Name.Function.Magic': 'color: #EB6F92',
+        'Token.Name.Property': 'color: #E0DEF4',
+        'Token.Name.Label': 'color: #E0DEF4',
+        'Token.Name.Namespace': 'color: #E0DEF4',
+        'Token.Name.Other': 'color: #E0DEF4',
+        'Token.Name.Tag': 'color: #E0DEF4',
+        'Token.Name.Variable.Class': 'color: #E0DEF4',
+        'Token.Name.Variable.Global': 'color: #E0DEF4',
+        'Token.Name.Variable.Instance': 'color: #E0DEF4',
+        'Token.Literal.String.Backtick': 'color: #F6C177',
+        'Token.Literal.String.Char': 'color: #F6C177',
+        'Token.Literal.String.Delimiter': 'color: #F6C177',
+        'Token.Literal.String.Doc': 'color: #F6C177',
+        'Token.Literal.String.Double': 'color: #F6C177',
+        'Token.Literal.String.Heredoc': 'color: #F6C177',
+        'Token.Literal.String.Other': 'color: #F6C177',
+        'Token.Literal.String.Regex': 'color: #F6C177',
+        'Token.Literal.String.Single': 'color: #F6C177',
+        'Token.Literal.String.Symbol': 'color: #F6C177',
+        'Token.Literal.Number.Bin': 'color: #EA9A97',
+        'Token.Literal.Number.Float': 'color: #EA9A97',
+        'Token.Literal.Number.Hex': 'color: #EA9A97',
+        'Token.Literal.Number.Integer': 'color: #EA9A97',
+        'Token.Literal.Number.Integer.Long': 'color: #EA9A97',
+        'Token.Literal.Number.Oct': 'color: #EA9A97',
+        'Token.Punctuation.Marker': 'color: #908CAA',
+        'Token.Comment.Hashbang': 'color: #908CAA',
+        'Token.Comment.Multiline': 'color: #908CAA',
+        'Token.Comment.Preproc': 'color: #908CAA',
+        'Token.Comment.PreprocFile': 'color: #908CAA',
+        'Token.Comment.Single': 'color: #908CAA',
+        'Token.Comment.Special': 'color: #908CAA',
+    },
+    'rose-pine-dawn': {
+        'Token.Comment': 'color: #797593',
+        'Token.Error': 'color: #B4637A',
+        'Token.Keyword': 'color: #286983',
+        'Token.Keyword.Namespace': 'color: #286983',
+        'Token.Keyword.Constant': 'color: #D7827E',
+        'Token.Keyword.Type': 'color: #56949F',
+        'Token.Name': 'color: #575279',
+        'Token.Name.Builtin': 'color: #575279',
+        'Token.Name.Builtin.Pseudo': 'color: #B4637A',
+        'Token.Name.Class': 'color: #56949F',
+        'Token.Name.Decorator': 'color: #907AA9; font-weight: bold',
+        'Token.Name.Exception': 'color: #56949F',
+        'Token.Name.Function': 'color: #B4637A',
+        'Token.Name.Variable': 'color: #575279',
+        'Token.Name.Variable.Magic': 'color: #B4637A',
+        'Token.Literal.Number': 'color: #D7827E',
+        'Token.Operator': 'color: #286983',
+        'Token.Operator.Word': 'color: #286983',
+        'Token.Literal.String': 'color: #EA9D34',
+        'Token.Literal.String.Affix': 'color: #286983',
+        'Token.Literal.String.Escape': 'color: #286983',
+        'Token.Literal.String.Interpol': 'color: #575279',
+        'Token.Text': 'color: #575279',
+        'Token.Punctuation': 'color: #797593',
+        'Token.Text.Whitespace': 'color: #575279',
+        'Token.Keyword.Declaration': 'color: #286983',
+        'Token.Keyword.Pseudo': 'color: #286983',
+        'Token.Keyword.Reserved': 'color: #286983',
+        'Token.Name.Attribute': 'color: #575279',
+        'Token.Name.Constant': 'color: #575279',
+        'Token.Name.Entity': 'color: #575279',
+        'Token.Name.Function.Magic': 'color: #B4637A',
+        'Token.Name.Property': 'color: #575279',
+        'Token.Name.Label': 'color: #575279',
+        'Token.Name.Namespace': 'color: #575279',
+        'Token.Name.Other': 'color: #575279',
+        'Token.Name.Tag': 'color: #575279',
+        'Token.Name.Variable.Class': 'color: #575279',
+        'Token.Name.Variable.Global': 'color: #575279',
+        'Token.Name.Variable.Instance': 'color: #575279',
+        'Token.Literal.String.Backtick': 'color: #EA9D34',
+        'Token.Literal.String.Char': 'color: #EA9D34',
+        'Token.Literal.String.Delimiter': 'color: #EA9D34',
+        'Token.Literal.String.Doc': 'color: #EA9D34',
+        'Token.Literal.String.Double': 'color: #EA9D34',
+        'Token.Literal.String.Heredoc': 'color: #EA9D34',
+        'Token.Literal.String.Other': 'color: #EA9D34',
+        'Token.Literal.String.Regex': 'color: #EA9D34',
+        'Token.Literal.String.Single': 'color: #EA9D34',
+        'Token.Literal.String.Symbol': 'color: #EA9D34',
+        'Token.Literal.Number.Bin': 'color: #D7827E',
+        'Token.Literal.Number.Float': 'color: #D7827E',
+        'Token.Literal.Number.Hex': 'color: #D7827E',
+        'Token.Literal.Number.Integer': 'color: #D7827E',
+        'Token.Literal.Number.Integer.Long': 'color: #D7827E',
+        'Token.Literal.Number.Oct': 'color: #D7827E',
+        'Token.Punctuation.Marker': 'color: #797593',
+        'Token.Comment.Hashbang': 'color: #797593',
+        'Token.Comment.Multiline': 'color: #797593',
+        'Token.Comment.Preproc': 'color: #797593',
+        'Token.Comment.PreprocFile': 'color: #797593',
+        'Token.Comment.Single': 'color: #797593',
+        'Token.Comment.Special': 'color: #797593',
+    },
+}
@@ -0,0 +1,289 @@
+"""Terminal formatters backed by the precomputed Rose Pine escape tables.
+
+The stock terminal formatters walk the whole style and rebuild every escape
+sequence each time they are instantiated. The formatters in this module
+look the sequences up in :mod:`rosepinetables` instead, so building one
+for a Rose Pine style costs next to nothing.
+
+The 256-color and 16-color tables also pick colors by perceptual (OKLab)
+distance rather than the RGB distance ``Terminal256Formatter`` uses, which
+gives closer matches for the muted Rose Pine colors.
+"""
+
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Any, Optional
+
+from pygments.formatter import Formatter
+from pygments.formatters import (
+    Terminal256Formatter,
+    TerminalTrueColorFormatter,
+    get_formatter_by_name,
+)
+from pygments.style import StyleMeta
+from pygments.token import _TokenType
+from pygments.util import get_bool_opt
+
+from rosepinefilter import merge_tokens
+from rosepinemetrics import active
+from rosepinepalette import TERMINAL_FORMATS, VARIANTS, build_style
+from rosepinestyles import LazyStyleMeta
+from rosepinetables import QUANTIZED, TERMINAL_ESCAPES
+
+
+def variant_of(style: StyleMeta) -> Optional[str]:
+    """Get the Rose Pine variant a style class was built for.
+
+    The placeholders registered as ``pygments.styles`` entry points (see
+    :mod:`rosepinestyles`) count as the style they stand for.
+
+    Args:
+        style (StyleMeta): Any Pygments style class.
+
+    Returns:
+        Optional[str]: Variant name, or ``None`` for other styles, including
+        subclasses of the Rose Pine styles.
+    """
+    if isinstance(style, LazyStyleMeta):
+        style = style.resolve()
+    name = getattr(style, "name", None)
+    if name in VARIANTS and build_style(name) is style:
+        return name
+    return None
+
+
+def closest_color(variant: str, color: str, depth: str = "256") -> int:
+    """Get the precomputed terminal color index of a palette color.
+
+    Args:
+        variant (str): Variant name.
+        color (str): Hex color of the variant's palette, e.g. ``#eb6f92``.
+        depth (str): Color depth, ``256`` or ``16``. Defaults to ``256``.
+
+    Returns:
+        int: xterm color index, from 16 to 255 for ``256`` and from 0 to 15
+        for ``16``.
+
+    Raises:
+        ValueError: If the variant, color or depth is unknown.
+    """
+    if variant not in QUANTIZED:
+        raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+    if depth not in ("256", "16"):
+        raise ValueError(f"unknown color depth: {depth!r}")
+    key = "#" + color.lstrip("#").lower()
+    if key not in QUANTIZED[variant]:
+        raise ValueError(f"{color!r} is not a {variant} palette color")
+    return QUANTIZED[variant][key][0 if depth == "256" else 1]
+
+
+def escape_table(
+    style: StyleMeta,
+    depth: str,
+) -> Optional[dict[str, tuple[str, str]]]:
+    """Get the precomputed escape table of a style, if there is one.
+
+    Args:
+        style (StyleMeta): Style the formatter was asked to use.
+        depth (str): Color depth, one of ``truecolor``, ``256`` or ``16``.
+
+    Returns:
+        Optional[dict[str, tuple[str, str]]]: ``(on, off)`` pairs keyed by
+        token name, or ``None`` when the style is not a Rose Pine one.
+    """
+    variant = variant_of(style)
+    if variant is None:
+        return None
+    return TERMINAL_ESCAPES[variant][depth]
+
+
+#: SGR parameter of each text attribute formatters can turn off.
+ATTRIBUTES: dict[str, str] = {"bold": "01", "underline": "04", "italic": "03"}
+
+
+@lru_cache(maxsize=None)
+def stripped_table(
+    variant: str, depth: str, attributes: frozenset[str]
+) -> dict[str, tuple[str, str]]:
+    """Get a precomputed escape table without some text attributes.
+
+    The sequences are the ones the formatters build with ``nobold``,
+    ``nounderline`` or ``noitalic``, at the same color depth.
+
+    Args:
+        variant (str): Variant name.
+        depth (str): Color depth, one of ``truecolor``, ``256`` or ``16``.
+        attributes (frozenset[str]): Attributes to leave out, keys of
+            :data:`ATTRIBUTES`.
+
+    Returns:
+        dict[str, tuple[str, str]]: ``(on, off)`` pairs keyed by token name.
+    """
+    # Color parameters are written without leading zeros, so they never
+    # clash with the attribute ones.
+    dropped = {ATTRIBUTES[attribute] for attribute in attributes}
+    table = {}
+    for name, (on, off) in TERMINAL_ESCAPES[variant][depth].items():
+        if on:
+            on_params = [p for p in on[2:-1].split(";") if p not in dropped]
+            keep_reset = not set(on_params).isdisjoint(ATTRIBUTES.values())
+            off_params = off[2:-1].split(";")
+            if not keep_reset:
+                off_params = [p for p in off_params if p != "00"]
+            on = f"\x1b[{';'.join(on_params)}m" if on_params else ""
+            off = f"\x1b[{';'.join(off_params)}m" if off_params else ""
+        table[name] = on, off
+    return table
+
+
+class _PrecomputedMixin:
+    """Swap the per-instance style walk for a shared table lookup."""
+
+    depth: str = "truecolor"
+    merge: bool
+    style: StyleMeta
+    style_string: dict[str, tuple[str, str]]
+    usebold: bool
+    useunderline: bool
+    useitalic: bool
+
+    def __init__(self, **options: Any) -> None:
+        options.setdefault("style", build_style("rose-pine"))
+        super().__init__(**options)  # type: ignore[call-arg]
+        self.merge = get_bool_opt(options, "merge", False)
+
+    def _escapes(self, ttype: _TokenType) -> tuple[str, str]:
+        # Looked up the same way ``format_unencoded`` does.
+        while str(ttype) not in self.style_string:
+            ttype = ttype.parent
+        return self.style_string[str(ttype)]
+
+    def format_unencoded(self, tokensource: Any, outfile: Any) -> None:
+        if self.merge:
+            # Colors that map to the same terminal color merge as well.
+            tokensource = merge_tokens(tokensource, self.style, self._escapes)
+        super().format_unencoded(tokensource, outfile)  # type: ignore[misc]
+
+    def _precomputed(self) -> Optional[dict[str, tuple[str, str]]]:
+        variant = variant_of(self.style)
+        if variant is None:
+            return None
+        # The tables are built with every attribute enabled.
+        disabled = frozenset(
+            attribute
+            for attribute in ATTRIBUTES
+            if not getattr(self, f"use{attribute}")
+        )
+        if not disabled:
+            return TERMINAL_ESCAPES[variant][self.depth]
+        return stripped_table(variant, self.depth, disabled)
+
+    def _build_color_table(self) -> None:
+        if self._precomputed() is None:
+            super()._build_color_table()  # type: ignore[misc]
+
+    def _setup_styles(self) -> None:
+        table = self._precomputed()
+        if table is None:
+            super()._setup_styles()  # type: ignore[misc]
+        else:
+            # Formatters only read ``style_string``, so the table is shared.
+            self.style_string = table
+
+
+class RosePineTrueColorFormatter(
+    _PrecomputedMixin,
+    TerminalTrueColorFormatter,
+):
+    """True color (24-bit) terminal formatter for the Rose Pine styles."""
+
+    name = "RosePineTrueColor"
+    aliases: list[str] = []
+    depth = "truecolor"
+
+
+class RosePine256Formatter(_PrecomputedMixin, Terminal256Formatter):
+    """256-color terminal formatter for the Rose Pine styles."""
+
+    name = "RosePine256"
+    aliases: list[str] = []
+    depth = "256"
+
+
+class RosePine16Formatter(_PrecomputedMixin, Terminal256Formatter):
+    """16-color terminal formatter for the Rose Pine styles.
+
+    Colors are mapped to the nearest of the basic terminal colors, so the
+    output also works on terminals without 256-color support. Other styles
+    fall back to the regular 256-color conversion.
+    """
+
+    name = "RosePine16"
+    aliases: list[str] = []
+    depth = "16"
+
+
+FORMATTERS: dict[str, type[Terminal256Formatter]] = {
+    "truecolor": RosePineTrueColorFormatter,
+    "256": RosePine256Formatter,
+    "16": RosePine16Formatter,
+}
+
+
+def get_formatter(
+    style: "str | StyleMeta" = "rose-pine",
+    depth: str = "truecolor",
+    **options: Any,
+) -> Terminal256Formatter:
+    """Build a terminal formatter that reuses the precomputed escape tables.
+
+    Args:
+        style (str | StyleMeta): Rose Pine variant name or style class.
+            Defaults to ``rose-pine``.
+        depth (str): Color depth, one of ``truecolor``, ``256`` or ``16``.
+            Defaults to ``truecolor``.
+        **options (Any): Extra options passed on to the formatter. With
+            ``merge=True``, adjacent tokens sharing a style are written as
+            one span (see :mod:`rosepinefilter`).
+
+    Returns:
+        Terminal256Formatter: Formatter for the requested depth.
+
+    Raises:
+        ValueError: If the variant or the depth is unknown.
+    """
+    if isinstance(style, str):
+        if style not in VARIANTS:
+            raise ValueError(f"unknown Rose Pine variant: {style!r}")
+        style = build_style(style)
+    if depth not in FORMATTERS:
+        raise ValueError(f"unknown color depth: {depth!r}")
+    return FORMATTERS[depth](style=style, **options)
+
+
+def formatter_for(variant: str, fmt: str, **options: Any) -> Formatter:
+    """Build any Pygments formatter for a variant.
+
+    Terminal aliases (see :data:`TERMINAL_FORMATS`) get the precomputed
+    formatters of this module.
+
+    Args:
+        variant (str): Rose Pine variant name.
+        fmt (str): Pygments formatter alias, e.g. ``html`` or ``terminal16m``.
+        **options (Any): Extra options passed on to the formatter.
+
+    Returns:
+        Formatter: Formatter using the variant's style.
+
+    Raises:
+        ValueError: If the variant is unknown.
+        ClassNotFound: If no formatter has the alias.
+    """
+    metrics = active()
+    with metrics.stage("style") if metrics else nullcontext():
+        if fmt in TERMINAL_FORMATS:
+            return get_formatter(variant, TERMINAL_FORMATS[fmt], **options)
+        if variant not in VARIANTS:
+            raise ValueError(f"unknown Rose Pine variant: {variant!r}")
+        style = build_style(variant)
+        return get_formatter_by_name(fmt, style=style, **options)
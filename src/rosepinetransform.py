@@ -0,0 +1,254 @@
+"""Vectorized palette transforms for deriving custom variants.
+
+Needs NumPy, installed with the ``numpy`` extra. :func:`load` reads the
+``Color`` dataclasses of the variants into an array of OKLab colors of
+shape ``(variants, roles, 3)``, :func:`adjust` changes lightness,
+saturation and contrast of any number of palettes at once, and
+:func:`make_style` and :func:`tables` turn each derived palette into a
+``Style`` subclass and its ready-to-serve escape and CSS tables::
+
+    lab = load()                                   # (3, roles, 3)
+    levels = np.array([0.8, 0.9, 1.0])[:, None]    # (3, 1): per tenant
+    derived = adjust(lab, lightness=levels)        # (3, 3, roles, 3)
+    for colors in palettes(derived):
+        style = make_style("rose-pine-dimmed", colors)
+
+Transforms work in OKLab, so lightness and saturation changes keep hues.
+Colors that end up outside of sRGB are clipped.
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    extra = "pip install 'pygments-rose-pine[numpy]'"
+    raise ImportError(f"rosepinetransform needs NumPy: {extra}") from err
+from pygments.formatters import TerminalTrueColorFormatter
+from pygments.style import Style, StyleMeta
+from pygments.token import string_to_tokentype
+
+from rosepinedefs import SLOT_STYLES, TOKEN_SLOTS
+from rosepinehtml import stylesheet_for
+from rosepinepalette import (
+    BACKGROUND_ROLE,
+    PREFIXES,
+    ROLES,
+    STYLE_SLOTS,
+    TOKEN_ROLES,
+    VARIANTS,
+    make_color,
+    role_definitions,
+)
+from rosepineresolve import RosePineStyleMeta
+from rosepineroles import slot_token
+
+# sRGB (linear) to LMS, and LMS (cube root) to OKLab, see
+# https://bottosson.github.io/posts/oklab/.
+_RGB_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_LMS_TO_LAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+_LAB_TO_LMS = np.linalg.inv(_LMS_TO_LAB)
+_LMS_TO_RGB = np.linalg.inv(_RGB_TO_LMS)
+
+_BACKGROUND = ROLES.index(BACKGROUND_ROLE)
+
+
+def to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB colors into OKLab.
+
+    Args:
+        rgb (np.ndarray): Array of shape ``(..., 3)``, from 0 to 1.
+
+    Returns:
+        np.ndarray: Lightness, green-red and blue-yellow axes, same shape.
+    """
+    curve = ((rgb + 0.055) / 1.055) ** 2.4
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, curve)
+    return np.cbrt(linear @ _RGB_TO_LMS.T) @ _LMS_TO_LAB.T
+
+
+def to_srgb(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab colors into sRGB, clipping them to its gamut.
+
+    Args:
+        lab (np.ndarray): Array of shape ``(..., 3)``.
+
+    Returns:
+        np.ndarray: Red, green and blue components from 0 to 1, same shape.
+    """
+    linear = np.clip(((lab @ _LAB_TO_LMS.T) ** 3) @ _LMS_TO_RGB.T, 0, 1)
+    curve = 1.055 * linear ** (1 / 2.4) - 0.055
+    return np.where(linear <= 0.0031308, linear * 12.92, curve)
+
+
+def load(variants: Iterable[str] = VARIANTS) -> np.ndarray:
+    """Read the palettes of variants from their ``Color`` dataclasses.
+
+    Args:
+        variants (Iterable[str]): Variant names. Defaults to all of them.
+
+    Returns:
+        np.ndarray: OKLab colors of shape ``(variants, roles, 3)``, with
+        roles in the order of :data:`rosepinepalette.ROLES`.
+    """
+    colors = []
+    for variant in variants:
+        color, prefix = make_color(variant), PREFIXES[variant]
+        colors.append([getattr(color, f"{prefix}_{role}") for role in ROLES])
+    values = np.array([[int(c[1:], 16) for c in row] for row in colors])
+    rgb = np.stack([values >> 16, values >> 8 & 0xFF, values & 0xFF], axis=-1)
+    return to_oklab(rgb / 255)
+
+
+def adjust(
+    lab: np.ndarray,
+    lightness: Any = 1.0,
+    saturation: Any = 1.0,
+    contrast: Any = 1.0,
+) -> np.ndarray:
+    """Transform palettes in OKLab.
+
+    Each factor is a number or an array broadcasting against the palette
+    dimensions of ``lab`` (all but the last two), e.g. of shape ``(n, 1)``
+    to derive ``n`` versions of each of the palettes of :func:`load`.
+
+    Args:
+        lab (np.ndarray): Palettes of shape ``(..., roles, 3)``.
+        lightness (Any): Factor applied to the lightness of every color.
+            Defaults to 1.
+        saturation (Any): Factor applied to the chroma of every color.
+            Defaults to 1.
+        contrast (Any): Factor applied to the lightness difference between
+            every color and the background. Defaults to 1.
+
+    Returns:
+        np.ndarray: Transformed palettes, of the broadcast shape.
+    """
+    lightness, saturation, contrast = (
+        np.asarray(factor, dtype=float)[..., None]
+        for factor in (lightness, saturation, contrast)
+    )
+    light = lab[..., 0] * lightness
+    background = light[..., _BACKGROUND, None]
+    light = np.clip(background + (light - background) * contrast, 0, 1)
+    chroma = lab[..., 1:] * saturation[..., None]
+    shape = np.broadcast_shapes(light.shape, chroma.shape[:-1])
+    return np.concatenate(
+        [
+            np.broadcast_to(light, shape)[..., None],
+            np.broadcast_to(chroma, (*shape, 2)),
+        ],
+        axis=-1,
+    )
+
+
+def to_hex(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab colors into ``#rrggbb`` strings.
+
+    Args:
+        lab (np.ndarray): Array of shape ``(..., 3)``.
+
+    Returns:
+        np.ndarray: Strings of shape ``(...)``.
+    """
+    rgb = np.rint(to_srgb(lab) * 255).astype(np.int64)
+    values = rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]
+    hexes = np.array([f"#{value:06x}" for value in values.ravel()])
+    return hexes.reshape(values.shape)
+
+
+def palettes(lab: np.ndarray) -> list[dict[str, str]]:
+    """Convert palettes into role to color mappings.
+
+    Args:
+        lab (np.ndarray): Palettes of shape ``(..., roles, 3)``.
+
+    Returns:
+        list[dict[str, str]]: ``#rrggbb`` color of every role, for every
+        palette in row-major order.
+    """
+    colors = to_hex(lab).reshape(-1, len(ROLES)).tolist()
+    return [dict(zip(ROLES, palette)) for palette in colors]
+
+
+@lru_cache(maxsize=None)
+def _tokentypes() -> tuple[Any, ...]:
+    return tuple(string_to_tokentype(token) for token in TOKEN_ROLES)
+
+
+def make_style(
+    name: str,
+    colors: dict[str, str],
+    base: str = "rose-pine",
+) -> StyleMeta:
+    """Build a ``Style`` subclass for a derived palette.
+
+    The parsed definitions of ``base`` are reused with the new colors, so
+    building a style skips the parsing of the style strings.
+
+    Args:
+        name (str): Style name, e.g. ``rose-pine-dimmed``.
+        colors (dict[str, str]): ``#rrggbb`` color of every role, e.g. from
+            :func:`palettes`.
+        base (str): Variant whose extra attributes are kept. Defaults to
+            ``rose-pine``.
+
+    Returns:
+        StyleMeta: The style class.
+
+    Raises:
+        ValueError: If the base variant is unknown.
+    """
+    if base not in VARIANTS:
+        raise ValueError(f"unknown Rose Pine variant: {base!r}")
+    slot_styles = tuple(
+        (colors[role][1:], *ndef[1:]) if role else ndef
+        for (role, _), ndef in zip(STYLE_SLOTS, SLOT_STYLES[base])
+    )
+    namespace = {
+        "__module__": __name__,
+        "name": name,
+        "background_color": colors[BACKGROUND_ROLE],
+        "styles": dict(zip(_tokentypes(), role_definitions(colors).values())),
+        "token_slots": TOKEN_SLOTS,
+        "slot_styles": slot_styles,
+    }
+    class_name = "".join(part.title() for part in name.split("-")) + "Style"
+    return RosePineStyleMeta(class_name, (Style,), namespace)
+
+
+def tables(style: StyleMeta, cssclass: str = "highlight") -> dict[str, Any]:
+    """Precompute the output tables of a style.
+
+    Args:
+        style (StyleMeta): Style class, e.g. from :func:`make_style`.
+        cssclass (str): Class of the HTML container. Defaults to
+            ``highlight``.
+
+    Returns:
+        dict[str, Any]: ``escapes``, the 24-bit ``(on, off)`` escape pair of
+        every style slot as used by :func:`rosepineroles.escapes`, and
+        ``stylesheet``, the CSS of the slot classes of
+        :class:`rosepinehtml.RosePineHtmlFormatter`.
+    """
+    escapes = TerminalTrueColorFormatter(style=style).style_string
+    return {
+        "escapes": tuple(
+            escapes[str(slot_token(slot))] for slot in range(len(STYLE_SLOTS))
+        ),
+        "stylesheet": stylesheet_for(style, cssclass),
+    }
@@ -0,0 +1,198 @@
+"""Rendering of line windows of large documents, for viewport viewers.
+
+A code viewer shows a few dozen lines of documents that can run to a
+million lines, so highlighting the whole document before showing anything
+makes the first paint as slow as the document is long.
+:class:`WindowedHighlighter` only renders the lines it is asked for. It
+keeps a sparse index of checkpoints, the lexer state at a line start every
+:data:`CHECKPOINT_INTERVAL` lines or so, and resumes lexing from the
+closest checkpoint before the window::
+
+    highlighter = WindowedHighlighter(text, PythonLexer(), "rose-pine-moon")
+    output = highlighter.render(0, 60)           # First paint.
+    output = highlighter.render(120_000, 120_060)
+
+The index is extended as far as the windows rendered so far, or further
+with :meth:`WindowedHighlighter.build_index` (e.g. while the viewer is
+idle after the first paint). Once it covers a window, rendering that
+window lexes at most the interval and the window itself, wherever it is
+in the document.
+
+Windows are rendered line by line, which gives the same output as the
+same lines of the whole document for the terminal formatters (the default)
+and the other line-oriented formatters, such as ``HtmlFormatter`` with
+``nowrap``.
+"""
+
+import bisect
+import io
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from pygments.formatter import Formatter
+from pygments.lexer import Lexer
+from pygments.token import _TokenType
+
+from rosepinelexer import ROOT, can_resume, normalize, tokens_from
+from rosepineterm import formatter_for
+
+#: Default number of lines between two checkpoints.
+CHECKPOINT_INTERVAL: int = 1000
+
+
+class WindowedHighlighter:
+    """Highlighter rendering line ranges of a document on demand.
+
+    Lexers that cannot be resumed (see :func:`rosepinelexer.can_resume`)
+    still work, but lex the document from its start for every window. The
+    lexer's ``stripnl``, ``stripall`` and filters are not applied, so line
+    numbers are those of the document. Instances are not thread-safe.
+
+    Args:
+        text (str): Whole document.
+        lexer (Lexer): Lexer to use.
+        variant (str): Rose Pine variant name. Defaults to ``rose-pine``.
+        fmt (str): Pygments formatter alias. Defaults to ``terminal16m``.
+        formatter (Optional[Formatter]): Formatter to use instead of
+            building one from ``variant`` and ``fmt``.
+        interval (int): Number of lines between two checkpoints. Smaller
+            intervals make windows faster to render from an index and the
+            index larger. Defaults to :data:`CHECKPOINT_INTERVAL`.
+        **options (Any): Extra formatter options.
+
+    Raises:
+        ValueError: If the interval is not positive.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        lexer: Lexer,
+        variant: str = "rose-pine",
+        fmt: str = "terminal16m",
+        formatter: Optional[Formatter] = None,
+        interval: int = CHECKPOINT_INTERVAL,
+        **options: Any,
+    ) -> None:
+        if interval < 1:
+            raise ValueError(
+                f"checkpoint interval must be positive: {interval}",
+            )
+        self.lexer = lexer
+        self.formatter = formatter or formatter_for(variant, fmt, **options)
+        self.interval = interval
+        self.resumable = can_resume(lexer)
+        text = normalize(lexer, text)
+        if lexer.ensurenl and not text.endswith("\n"):
+            text += "\n"
+        #: Preprocessed document.
+        self.text = text
+        #: Line, offset and state stack of every checkpoint, in order.
+        self.checkpoints: list[tuple[int, int, tuple[str, ...]]] = [
+            (0, 0, ROOT),
+        ]
+        #: Number of lines lexed from the start of the document so far; the
+        #: index is complete up to there.
+        self.indexed = 0
+        self._lines: Optional[int] = None
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines of the document."""
+        if self._lines is None:
+            text = self.text
+            self._lines = text.count("\n") + (not text.endswith("\n"))
+        return self._lines
+
+    def _tokens(
+        self,
+        offset: int,
+        stack: tuple[str, ...],
+        line_states: list[tuple[int, tuple[str, ...]]],
+    ) -> Iterator[tuple[int, _TokenType, str]]:
+        """Lex the document from a checkpoint."""
+        if not self.resumable:
+            return self.lexer.get_tokens_unprocessed(self.text)
+        return tokens_from(
+            self.lexer,
+            self.text,
+            list(stack),
+            line_states=line_states,
+            start=offset,
+        )
+
+    def _lex(self, start: int, stop: int) -> Iterator[tuple[_TokenType, str]]:
+        """Lex lines from the closest checkpoint, extending the index.
+
+        Yields the tokens of lines ``start`` to ``stop``, split at line
+        breaks.
+        """
+        index = 0
+        if self.resumable:
+            key = (start, float("inf"))
+            index = bisect.bisect_right(self.checkpoints, key) - 1
+        line, offset, stack = self.checkpoints[index]
+        line_states: list[tuple[int, tuple[str, ...]]] = []
+        target = self.checkpoints[-1][0] + self.interval
+        line_start = True
+        for position, ttype, value in self._tokens(offset, stack, line_states):
+            if line_start:
+                line_start = False
+                if line >= stop:
+                    break
+                saved = line_states[-1] if line_states else None
+                if line >= target and saved and saved[0] == position:
+                    self.checkpoints.append((line, position, saved[1]))
+                    target = line + self.interval
+                # Keep the last state, which ``tokens_from`` compares the
+                # next line start with.
+                del line_states[:-1]
+            if "\n" not in value:
+                if line >= start:
+                    yield ttype, value
+                continue
+            while value:
+                piece, newline, value = value.partition("\n")
+                if start <= line < stop:
+                    yield ttype, piece + newline
+                if newline:
+                    line += 1
+                    self.indexed = max(self.indexed, line)
+                    if not value:
+                        line_start = True
+                    elif line >= stop:
+                        break
+            if line >= stop and not line_start:
+                break
+        else:
+            self.indexed = self.line_count
+
+    def render(self, start: int, stop: int) -> str:
+        """Render a range of lines.
+
+        Args:
+            start (int): Index of the first line, from 0.
+            stop (int): Index of the line after the last one; ranges past
+                the end of the document are cut short.
+
+        Returns:
+            str: Output of the lines.
+        """
+        start, stop = max(start, 0), min(stop, self.line_count)
+        if start >= stop:
+            return ""
+        buffer = io.StringIO()
+        self.formatter.format(self._lex(start, stop), buffer)
+        return buffer.getvalue()
+
+    def build_index(self, stop: Optional[int] = None) -> None:
+        """Lex ahead to extend the checkpoint index, without rendering.
+
+        Args:
+            stop (Optional[int]): Line to index up to. Defaults to the end
+                of the document.
+        """
+        stop = self.line_count if stop is None else min(stop, self.line_count)
+        if self.resumable and stop > self.indexed:
+            for _ in self._lex(stop, stop):
+                pass
@@ -0,0 +1,43 @@
+// Debounced search box, with most JavaScript token types.
+'use strict';
+
+import { fetchJson } from './http.js';
+
+const DELAY = 250;
+const pattern = /^[a-z0-9_-]{2,}$/gi;
+
+/**
+ * Wait for the user to stop typing.
+ * @param {Function} fn
+ */
+export function debounce(fn, delay = DELAY) {
+  let timer = null;
+  return (...args) => {
+    clearTimeout(timer);
+    timer = setTimeout(() => fn.apply(this, args), delay);
+  };
+}
+
+class SearchBox extends HTMLElement {
+  static observedAttributes = ['query'];
+  #results = [];
+
+  async search(query) {
+    if (!pattern.test(query) || query.length > 0x40) return;
+    try {
+      const { items = [] } = await fetchJson(`/search?q=${encodeURIComponent(query)}`);
+      this.#results = items.filter((item) => item?.score >= 0.5e0);
+    } catch (error) {
+      console.error("search failed:", error);
+    } finally {
+      this.render(typeof query === 'string' ? query : undefined);
+    }
+  }
+
+  render(query) {
+    this.innerHTML = this.#results.map((r, i) => `<li data-i="${i}">${r.title}</li>`).join('');
+    return void query ?? null;
+  }
+}
+
+customElements.define('search-box', SearchBox);
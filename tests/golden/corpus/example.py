@@ -0,0 +1,68 @@
+"""Inventory service: a sample of most Python token types."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+__all__ = ["Item", "Inventory"]
+
+PATTERN = re.compile(rb"^(?P<sku>[A-Z]{3}-\d{4})$")
+LIMIT: int = 0x_FF + 0o17 + 0b1010 + 1_000
+RATIO = 3.14e-2j
+
+
+@dataclass(frozen=True, slots=True)
+class Item:
+    """An item in stock."""
+
+    sku: str
+    price: float = 0.0
+    tags: list[str] = field(default_factory=list)
+    kind: ClassVar[str] = 'item'
+
+    def __str__(self) -> str:
+        tags = ', '.join(self.tags)
+        return f"{self.sku!r:>12} costs {self.price:.2f} ({tags})"
+
+
+class Inventory(dict[str, Item]):
+    def add(self, *items: Item, **extra: Any) -> None:
+        for item in items:
+            if item.sku in self or not PATTERN.match(item.sku.encode()):
+                raise ValueError("bad sku: %s" % item.sku)
+            self[item.sku] = item
+        del extra
+
+    async def restock(self, delay: float = .5) -> int:
+        await asyncio.sleep(delay)
+        total = sum(item.price for item in self.values() if item.price > 0)
+        match total:
+            case 0 | None:
+                return 0
+            case float(x) if x >= LIMIT:
+                return int(x) // 2
+            case _:
+                return -1
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0 and self is not None
+
+
+def main() -> None:
+    inventory = Inventory()
+    inventory.add(Item("ABC-1234", 9.99, ["new"]))
+    lam = lambda x, /, y=None: (x, y)  # noqa: E731
+    try:
+        print(asyncio.run(inventory.restock()), lam(1), u'\N{BULLET}\t\x00')
+    except (ValueError, TypeError) as group:
+        print(group, end="")
+    finally:
+        assert True, ...
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+//! A bounded queue, with most Rust token types.
+
+use std::collections::VecDeque;
+use std::fmt;
+
+/// Error returned when the queue is full.
+#[derive(Debug, Clone, PartialEq)]
+pub struct Full<T>(pub T);
+
+pub struct Queue<T> {
+    items: VecDeque<T>,
+    capacity: usize,
+}
+
+impl<T: fmt::Debug> Queue<T> {
+    pub const DEFAULT: usize = 0x10;
+
+    pub fn new(capacity: usize) -> Self {
+        Self { items: VecDeque::with_capacity(capacity), capacity }
+    }
+
+    pub fn push(&mut self, item: T) -> Result<(), Full<T>> {
+        if self.items.len() >= self.capacity {
+            return Err(Full(item));
+        }
+        self.items.push_back(item);
+        Ok(())
+    }
+
+    pub fn pop(&mut self) -> Option<T> {
+        self.items.pop_front()
+    }
+}
+
+fn main() {
+    let mut queue: Queue<&'static str> = Queue::new(2);
+    for word in ["a", "b", "c"] {
+        match queue.push(word) {
+            Ok(()) => println!("pushed {word}"),
+            Err(Full(w)) => eprintln!("full, dropped {:?} at {}", w, 1.5e3_f64),
+        }
+    }
+    let _ = queue.pop().unwrap_or_else(|| '\n'.to_string().leak());
+}
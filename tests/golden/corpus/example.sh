@@ -0,0 +1,24 @@
+#!/usr/bin/env bash
+# Rotate the logs older than a week.
+set -euo pipefail
+
+LOG_DIR="${LOG_DIR:-/var/log/app}"
+readonly DAYS=7
+
+rotate() {
+    local file="$1"
+    gzip -9 "$file" && echo "rotated ${file##*/}" >&2
+}
+
+for file in "$LOG_DIR"/*.log; do
+    if [[ -f $file && $(find "$file" -mtime +$DAYS) ]]; then
+        rotate "$file" || exit 1
+    fi
+done
+
+count=$(ls "$LOG_DIR" | wc -l)
+printf 'kept %d files\n' "$count"
+case "$count" in
+    0) exit 2 ;;
+    *) exit 0 ;;
+esac
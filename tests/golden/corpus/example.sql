@@ -0,0 +1,24 @@
+-- Monthly revenue per customer, with most SQL token types.
+CREATE TABLE IF NOT EXISTS orders (
+    id          BIGSERIAL PRIMARY KEY,
+    customer_id INTEGER NOT NULL REFERENCES customers (id),
+    placed_at   TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    total       NUMERIC(10, 2) CHECK (total >= 0),
+    note        TEXT
+);
+
+/* Only paid orders count. */
+SELECT c.name,
+       date_trunc('month', o.placed_at) AS month,
+       SUM(o.total) AS revenue,
+       COUNT(*) FILTER (WHERE o.total > 100.50) AS large_orders
+  FROM orders AS o
+  JOIN customers c ON c.id = o.customer_id
+ WHERE o.note IS NULL OR o.note NOT LIKE '%refund%'
+ GROUP BY 1, 2
+HAVING SUM(o.total) BETWEEN 1e3 AND 1e6
+ ORDER BY revenue DESC
+ LIMIT 10;
+
+UPDATE orders SET note = E'flagged\n' WHERE id IN (SELECT id FROM audit);
+DROP TABLE IF EXISTS "Legacy Orders";
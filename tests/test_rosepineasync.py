@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexer import Lexer
+from pygments.lexers import PythonLexer
+from pygments.token import Text
+
+from rosepineasync import FormatterPool, HighlightService, highlight_async
+from rosepinepalette import build_style
+from rosepineterm import get_formatter
+
+CODE = "def answer() -> int:\n    return 42\n"
+
+
+class SlowLexer(Lexer):
+    """Lexer yielding one token every few milliseconds."""
+
+    name = "Slow"
+
+    def __init__(self, tokens: int = 5, **options) -> None:
+        super().__init__(**options)
+        self.tokens = tokens
+        self.active = 0
+        self.peak = 0
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+
+    def get_tokens_unprocessed(
+        self,
+        text: str,
+    ) -> Iterator[tuple[int, object, str]]:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            for index in range(self.tokens):
+                time.sleep(0.01)
+                yield index, Text, "x"
+        finally:
+            with self._lock:
+                self.active -= 1
+            self.finished.set()
+
+
+def test_highlight_async() -> None:
+    """Results should match ``pygments.highlight``."""
+    html = asyncio.run(highlight_async(CODE, "python", "rose-pine-moon"))
+    formatter = HtmlFormatter(style=build_style("rose-pine-moon"))
+    assert html == pygments.highlight(CODE, PythonLexer(), formatter)
+    job = highlight_async(CODE, PythonLexer(), fmt="terminal256")
+    formatter = get_formatter("rose-pine", "256")
+    terminal = asyncio.run(job)
+    assert terminal == pygments.highlight(CODE, PythonLexer(), formatter)
+
+
+def test_formatters_are_reused() -> None:
+    """Sequential calls should share one formatter instance."""
+
+    async def run(service: HighlightService) -> None:
+        for _ in range(5):
+            await service.highlight(CODE, "python", linenos="table")
+
+    service = HighlightService()
+    asyncio.run(run(service))
+    service.close()
+    assert service.pool.created == 1
+
+
+def test_pool_hands_out_distinct_formatters() -> None:
+    """Concurrent borrowers should not share an instance."""
+    pool = FormatterPool()
+    with pool.borrow("rose-pine", "html") as first:
+        with pool.borrow("rose-pine", "html") as second:
+            assert first is not second
+    with pool.borrow("rose-pine", "html") as third:
+        assert third in (first, second)
+    assert pool.created == 2
+
+
+def test_backpressure() -> None:
+    """No more than ``max_pending`` calls should be handed to the workers."""
+    lexer = SlowLexer()
+
+    async def run(service: HighlightService) -> list:
+        calls = [service.highlight("x", lexer, fmt="text") for _ in range(8)]
+        return await asyncio.gather(*calls)
+
+    service = HighlightService(max_workers=4, max_pending=2)
+    assert asyncio.run(run(service)) == ["xxxxx"] * 8
+    service.close()
+    assert lexer.peak == 2
+
+
+def test_timeout_frees_the_worker() -> None:
+    """A timed out call should stop and let other calls through."""
+    huge = SlowLexer(tokens=10_000)
+
+    async def run(service: HighlightService) -> str:
+        with pytest.raises(asyncio.TimeoutError):
+            await service.highlight("x", huge, fmt="text", timeout=0.05)
+        return await service.highlight(CODE, "python", timeout=5)
+
+    service = HighlightService(max_workers=1)
+    start = time.perf_counter()
+    assert "answer" in asyncio.run(run(service))
+    assert time.perf_counter() - start < 5
+    assert huge.finished.wait(1) and huge.active == 0
+    service.close()
+
+
+def test_event_loop_stays_responsive() -> None:
+    """The loop should keep running while a call is being highlighted."""
+    lexer = SlowLexer(tokens=20)
+
+    async def run(service: HighlightService) -> int:
+        ticks = 0
+        task = asyncio.create_task(service.highlight("x", lexer, fmt="text"))
+        while not task.done():
+            await asyncio.sleep(0.005)
+            ticks += 1
+        await task
+        return ticks
+
+    service = HighlightService()
+    assert asyncio.run(run(service)) > 5
+    service.close()
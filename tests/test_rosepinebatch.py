@@ -0,0 +1,107 @@
+import pygments
+import pytest
+
+from pygments.lexers import PythonLexer, get_lexer_by_name
+from pygments.util import ClassNotFound
+
+from rosepinebatch import Batch, highlight_batch
+from rosepinemetrics import collect
+from rosepineterm import formatter_for
+
+SNIPPETS = [
+    ("def f(x):\n    return x + 1\n", "python"),
+    ("SELECT * FROM users WHERE id = 1;", "sql"),
+    ("", "python"),
+    ("let values = [1, 2, 3];\n", "javascript"),
+    ('fn main() {\n    println!("hi");\n}\n', "rust"),
+]
+
+
+@pytest.mark.parametrize(
+    "fmt,options",
+    [
+        ("terminal16m", {}),
+        ("terminal256", {}),
+        ("html", {"nowrap": True}),
+        ("html", {"linenos": "table"}),
+    ],
+)
+def test_same_as_highlight(fmt: str, options: dict) -> None:
+    """Every snippet should get the output of its own highlight call."""
+    batch = highlight_batch(SNIPPETS, "rose-pine-moon", fmt, **options)
+    expected = [
+        pygments.highlight(
+            code,
+            get_lexer_by_name(name),
+            formatter_for("rose-pine-moon", fmt, **options),
+        )
+        for code, name in SNIPPETS
+    ]
+    assert list(batch) == expected
+    assert [batch[i] for i in range(len(batch))] == expected
+    assert batch.output == "".join(expected)
+
+
+def test_slices() -> None:
+    """Snippets should be slices of the single output buffer."""
+    batch = highlight_batch(SNIPPETS)
+    assert len(batch) == len(SNIPPETS)
+    start, end = batch.span(1)
+    assert batch.output[start:end] == batch[1]
+    assert batch.span(-1) == (batch.offsets[-2], len(batch.output))
+    assert batch[-1] == batch[len(batch) - 1]
+    assert batch[1:3] == [batch[1], batch[2]]
+    with pytest.raises(IndexError):
+        batch[len(batch)]
+
+
+def test_lexer_instances() -> None:
+    """Lexer instances should be accepted besides names."""
+    lexer = PythonLexer()
+    batch = highlight_batch([("x = 1\n", lexer), ("y = 2\n", "python")])
+    formatter = formatter_for("rose-pine", "terminal16m")
+    assert batch[0] == pygments.highlight("x = 1\n", lexer, formatter)
+    assert batch[1] == pygments.highlight("y = 2\n", lexer, formatter)
+
+
+def test_encoding() -> None:
+    """Formatters with an encoding should give bytes."""
+    batch = highlight_batch(
+        [("s = 'é'\n", "python")] * 2, "rose-pine-dawn", encoding="utf-8"
+    )
+    assert isinstance(batch.output, bytes)
+    assert (
+        batch[0]
+        == batch[1]
+        == pygments.highlight(
+            "s = 'é'\n",
+            PythonLexer(),
+            formatter_for("rose-pine-dawn", "terminal16m", encoding="utf-8"),
+        )
+    )
+
+
+def test_empty() -> None:
+    """An empty batch should have no snippets."""
+    batch = highlight_batch([])
+    assert isinstance(batch, Batch)
+    assert len(batch) == 0
+    assert list(batch) == []
+    assert batch.output == ""
+
+
+def test_errors() -> None:
+    """Unknown variants and lexer names should be rejected."""
+    with pytest.raises(ValueError, match="unknown Rose Pine variant"):
+        highlight_batch(SNIPPETS, "rose-pine-noon")
+    with pytest.raises(ClassNotFound):
+        highlight_batch([("x", "no-such-language")])
+
+
+def test_metrics() -> None:
+    """Every snippet should be recorded as a highlight."""
+    with collect() as metrics:
+        batch = highlight_batch(SNIPPETS)
+    assert metrics.counters["highlights"] == len(SNIPPETS)
+    size = len(batch.output.encode("utf-8"))
+    assert metrics.counters["output_bytes"] == size
@@ -0,0 +1,75 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+import rosepinebench
+from rosepinepalette import VARIANTS
+
+
+def test_corpora_are_deterministic() -> None:
+    """Every run should benchmark the same input."""
+    for generate, lexer_class in rosepinebench.CORPORA.values():
+        first = generate(4096, random.Random(0))
+        assert len(first) >= 4096
+        assert first == generate(4096, random.Random(0))
+        tokens = lexer_class().get_tokens(first)
+        assert "Error" not in {str(ttype) for ttype, _ in tokens}
+
+
+def test_run() -> None:
+    """There should be one lexing case per corpus and one case per style."""
+    results = rosepinebench.run(size=2048, repeat=1)
+    cases = 1 + len(VARIANTS) * len(rosepinebench.FORMATTERS)
+    assert len(results) == len(rosepinebench.CORPORA) * cases
+    for measurement in results.values():
+        assert measurement.tokens_per_second > 0
+        assert measurement.mb_per_second > 0
+    data = rosepinebench.to_json(results)
+    assert set(data["results"]) == set(results)
+    assert "python/rose-pine-dawn/latex" in rosepinebench.report(results)
+
+
+def test_regressions() -> None:
+    """Only cases slower than the threshold should be flagged."""
+    results = {
+        "json/lex": rosepinebench.Measurement(100, 1_000_000, 1.0),
+        "json/rose-pine/html": rosepinebench.Measurement(100, 1_000_000, 2.0),
+        "json/rose-pine/latex": rosepinebench.Measurement(100, 1_000_000, 1.0),
+    }
+    baseline = {
+        "results": {
+            "json/lex": {"mb_per_second": 1.1},
+            "json/rose-pine/html": {"mb_per_second": 1.0},
+        }
+    }
+    found = rosepinebench.regressions(results, baseline, threshold=0.25)
+    assert found == ["json/rose-pine/html: 0.500 MB/s, baseline 1.000 MB/s"]
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """The runner should record a baseline and compare to it."""
+    baseline = tmp_path / "baseline.json"
+    argv = ["--size", "1", "--repeat", "1", "--corpus", "json", "--variant"]
+    argv += ["rose-pine", "--baseline", str(baseline)]
+    assert rosepinebench.main([*argv, "--update"]) == 0
+    data = json.loads(baseline.read_text())
+    assert data["environment"]["python"]
+    data["results"]["json/rose-pine/html"]["mb_per_second"] = 1e9
+    baseline.write_text(json.dumps(data))
+    assert rosepinebench.main(argv) == 1
+    assert "regression: json/rose-pine/html" in capsys.readouterr().err
+
+
+def test_baseline_covers_every_case() -> None:
+    """The committed baseline should have every default case."""
+    data = json.loads(rosepinebench.BASELINE_PATH.read_text())
+    cases = {f"{corpus}/lex" for corpus in rosepinebench.CORPORA}
+    cases |= {
+        f"{corpus}/{variant}/{name}"
+        for corpus in rosepinebench.CORPORA
+        for variant in VARIANTS
+        for name in rosepinebench.FORMATTERS
+    }
+    assert set(data["results"]) == cases
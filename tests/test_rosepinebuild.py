@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+import rosepinebuild
+from rosepinepalette import PALETTE, TOKEN_ROLES, VARIANTS
+
+
+def test_definitions_are_up_to_date() -> None:
+    """The committed pre-parsed definitions should match a fresh build."""
+    assert rosepinebuild.DEFINITIONS_PATH.read_text(encoding="utf-8") == (
+        rosepinebuild.render_definitions()
+    )
+
+
+def test_report_is_up_to_date() -> None:
+    """The committed contrast report should match a fresh build."""
+    assert rosepinebuild.REPORT_PATH.read_text(encoding="utf-8") == (
+        rosepinebuild.render_report()
+    )
+
+
+def test_definitions_are_valid() -> None:
+    """The shipped palettes and token roles should pass validation."""
+    rosepinebuild.validate()
+
+
+def test_validate_rejects_bad_colors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Malformed colors should be reported for the palette and ``Color``."""
+    monkeypatch.setitem(PALETTE["rose-pine-moon"], "love", "#EB6F9")
+    with pytest.raises(ValueError) as info:
+        rosepinebuild.validate()
+    message = str(info.value)
+    assert "rose-pine-moon: love is not a #rrggbb color" in message
+    assert "Color.moon_love" in message
+
+
+def test_validate_rejects_bad_roles(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unknown token types, roles and attributes should all be reported."""
+    monkeypatch.setitem(TOKEN_ROLES, "Name.Tag", ("blush", "blink"))
+    monkeypatch.setitem(TOKEN_ROLES, "Name.Nonexistent", ("love", ""))
+    with pytest.raises(ValueError) as info:
+        rosepinebuild.validate()
+    message = str(info.value)
+    assert "Name.Tag: unknown role 'blush'" in message
+    assert "Name.Tag: unknown attribute 'blink'" in message
+    assert "Name.Nonexistent: not a standard token type" in message
+
+
+def test_contrast_ratio() -> None:
+    """Contrast ratios should follow the WCAG 2 definition."""
+    ratio = rosepinebuild.contrast_ratio
+    assert ratio("#ffffff", "#000000") == pytest.approx(21)
+    assert ratio("#000000", "#ffffff") == pytest.approx(21)
+    assert rosepinebuild.contrast_ratio("#777777", "#777777") == 1
+    assert rosepinebuild.contrast_ratio("#767676", "#ffffff") == pytest.approx(
+        4.54, abs=0.01
+    )
+
+
+@pytest.mark.parametrize(
+    "ratio,level",
+    [(21, "AAA"), (7, "AAA"), (4.5, "AA"), (3.2, "AA-large"), (2, "fail")],
+)
+def test_wcag_level(ratio: float, level: str) -> None:
+    """Ratios should map to the best level they reach."""
+    assert rosepinebuild.wcag_level(ratio) == level
+
+
+def test_contrast_report() -> None:
+    """The report should cover every role used by a token, per variant."""
+    report = json.loads(rosepinebuild.render_report())
+    used = {role for role, _ in TOKEN_ROLES.values()}
+    for variant in VARIANTS:
+        entry = report[variant]
+        assert entry["background"] == PALETTE[variant]["base"]
+        assert set(entry["roles"]) == used
+        assert entry["minimum_contrast"] == min(
+            role["contrast"] for role in entry["roles"].values()
+        )
+        assert entry["tokens"]["Comment"] == "subtle"
+    assert report["rose-pine"]["roles"]["text"]["level"] == "AAA"
+    assert report["rose-pine"]["roles"]["pine"]["level"] == "AA-large"
@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+from rosepinecache import RenderCache, render_key
+from rosepinepalette import VARIANTS, build_style
+from rosepineterm import get_formatter
+
+CODE = "def answer() -> int:\n    return 42\n"
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_highlight(tmp_path: Path, variant: str) -> None:
+    """Cached output should be the output of ``pygments.highlight``."""
+    cache = RenderCache(tmp_path)
+    formatter = HtmlFormatter(style=build_style(variant))
+    expected = pygments.highlight(CODE, PythonLexer(), formatter)
+    assert cache.highlight(CODE, PythonLexer(), formatter) == expected
+    assert cache.highlight(CODE, PythonLexer(), formatter) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_bytes_output(tmp_path: Path) -> None:
+    """Encoded output should come back as bytes."""
+    cache = RenderCache(tmp_path)
+    formatter = get_formatter("rose-pine-dawn", encoding="utf-8")
+    first = cache.highlight(CODE, PythonLexer(), formatter)
+    assert isinstance(first, bytes)
+    assert cache.highlight(CODE, PythonLexer(), formatter) == first
+    assert cache.hits == 1
+
+
+def test_key() -> None:
+    """Keys should change with the code, lexer, style and options."""
+    lexer = PythonLexer()
+    html = HtmlFormatter(style=build_style("rose-pine"))
+    key = render_key(CODE, lexer, html)
+    same = HtmlFormatter(style=build_style("rose-pine"))
+    assert key == render_key(CODE, PythonLexer(), same)
+    moon = HtmlFormatter(style=build_style("rose-pine-moon"))
+    others = {
+        render_key(CODE + "\n", lexer, html),
+        render_key(CODE, PythonLexer(stripnl=False), html),
+        render_key(CODE, lexer, moon),
+        render_key(CODE, lexer, HtmlFormatter(style=html.style, linenos=True)),
+        render_key(CODE, lexer, get_formatter("rose-pine")),
+    }
+    assert key not in others and len(others) == 5
+
+
+def test_key_filters() -> None:
+    """Keys should change with the lexer's filters and their options."""
+    html = HtmlFormatter(style=build_style("rose-pine"))
+
+    def filtered(*filters: tuple[str, dict]) -> str:
+        lexer = PythonLexer()
+        for name, options in filters:
+            lexer.add_filter(name, **options)
+        return render_key(CODE, lexer, html)
+
+    keys = {
+        filtered(),
+        filtered(("keywordcase", {})),
+        filtered(("keywordcase", {"case": "upper"})),
+        filtered(("keywordcase", {"case": "upper"}), ("whitespace", {})),
+        filtered(("whitespace", {"spaces": True})),
+    }
+    assert len(keys) == 5
+    assert filtered(("keywordcase", {"case": "upper"})) in keys
+
+
+def test_survives_restart(tmp_path: Path) -> None:
+    """A new cache on the same directory should see the stored entries."""
+    RenderCache(tmp_path).put("ab" * 32, "output")
+    cache = RenderCache(tmp_path)
+    assert len(cache) == 1 and cache.size > 0
+    assert cache.get("ab" * 32) == "output"
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """The least recently used entries should go first."""
+    blob = os.urandom(1000).hex()  # Does not compress much.
+    cache = RenderCache(tmp_path, max_size=3500)
+    for key in ("aa", "bb", "cc"):
+        cache.put(key * 32, blob)
+    assert cache.get("aa" * 32) == blob
+    cache.put("dd" * 32, blob)
+    assert "bb" * 32 not in cache
+    assert not (tmp_path / "bb" / ("bb" * 32 + ".z")).exists()
+    assert all(key * 32 in cache for key in ("aa", "cc", "dd"))
+    assert cache.size <= cache.max_size
+
+
+def test_missing_and_corrupt_entries(tmp_path: Path) -> None:
+    """Entries removed or damaged behind the cache's back are misses."""
+    cache = RenderCache(tmp_path)
+    cache.put("aa" * 32, "output")
+    cache.put("bb" * 32, "output")
+    (tmp_path / "aa" / ("aa" * 32 + ".z")).unlink()
+    (tmp_path / "bb" / ("bb" * 32 + ".z")).write_bytes(b"sgarbage")
+    assert cache.get("aa" * 32) is None
+    assert cache.get("bb" * 32) is None
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_clear(tmp_path: Path) -> None:
+    """Clearing should delete every entry file."""
+    cache = RenderCache(tmp_path)
+    cache.put("aa" * 32, "output")
+    cache.clear()
+    assert len(cache) == 0
+    assert not list(tmp_path.glob("*/*.z"))
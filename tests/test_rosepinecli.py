@@ -0,0 +1,117 @@
+import os
+import stat
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatter import Formatter
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+import rosepinecli
+from rosepinehtml import RosePineHtmlFormatter
+from rosepinepalette import build_style
+from rosepinespan import RosePineSpanFormatter
+from rosepineterm import get_formatter
+
+CODE = "def answer() -> int:\n    return 42\n"
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a small source tree to highlight."""
+    source = tmp_path / "src"
+    (source / "pkg").mkdir(parents=True)
+    (source / ".git").mkdir()
+    (source / "main.py").write_text(CODE)
+    (source / "pkg" / "data.json").write_text('{"a": 1}\n')
+    (source / "pkg" / "blob.unknown-extension").write_text("???")
+    (source / ".git" / "config.py").write_text(CODE)
+    return source
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_highlights_tree(
+    tree: Path, tmp_path: Path, jobs: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Every known file should be written as HTML, mirroring the tree."""
+    output = tmp_path / "out"
+    status = rosepinecli.main(
+        [str(tree), str(output), "-s", "rose-pine-moon", "-j", jobs]
+    )
+    assert status == 1  # The unknown file is reported.
+    paths = output.rglob("*")
+    written = sorted(p.relative_to(output).as_posix() for p in paths)
+    assert written == ["main.py.html", "pkg", "pkg/data.json.html"]
+    formatter = HtmlFormatter(style=build_style("rose-pine-moon"))
+    expected = pygments.highlight(CODE, PythonLexer(), formatter)
+    assert (output / "main.py.html").read_text() == expected
+    report = capsys.readouterr().err
+    assert "blob.unknown-extension" in report
+    assert "highlighted 2 files" in report
+    assert "files/s" in report and "MB/s" in report
+
+
+def test_terminal_format_and_options(tree: Path, tmp_path: Path) -> None:
+    """Terminal output should use the precomputed formatters."""
+    output = tmp_path / "out"
+    argv = [str(tree), str(output), "-f", "terminal256", "-g", "*.py"]
+    assert rosepinecli.main([*argv, "-j", "1"]) == 0
+    formatter = get_formatter(depth="256")
+    expected = pygments.highlight(CODE, PythonLexer(), formatter)
+    assert (output / "main.py.txt").read_text() == expected
+
+
+def test_unknown_format(tree: Path, tmp_path: Path) -> None:
+    """Unknown formats should fail before doing any work."""
+    argv = [str(tree), str(tmp_path / "out"), "-f", "nope"]
+    assert rosepinecli.main(argv) == 2
+    assert not (tmp_path / "out").exists()
+
+
+def test_parse_options() -> None:
+    """Formatter options should be parsed like ``pygmentize -O``."""
+    assert rosepinecli.parse_options(["full,linenos=table", "title=x"]) == {
+        "full": True,
+        "linenos": "table",
+        "title": "x",
+    }
+
+
+def test_write_atomic_leaves_no_temporary_files(tmp_path: Path) -> None:
+    """Only the final file should remain after writing."""
+    target = tmp_path / "a" / "b.html"
+    rosepinecli.write_atomic(target, b"one")
+    rosepinecli.write_atomic(target, b"two")
+    assert target.read_bytes() == b"two"
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_write_atomic_permissions(tmp_path: Path) -> None:
+    """Files should get the umask permissions, or keep the ones they had."""
+    target = tmp_path / "out.html"
+    umask = os.umask(0o022)
+    try:
+        rosepinecli.write_atomic(target, b"one")
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+    target.chmod(0o640)
+    rosepinecli.write_atomic(target, b"two")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+@pytest.mark.parametrize(
+    "formatter,suffix",
+    [
+        (HtmlFormatter(), ".html"),
+        (RosePineHtmlFormatter(), ".html"),
+        (get_formatter(), ".txt"),
+        (RosePineSpanFormatter(), ".rpspan"),
+    ],
+    ids=["html", "rose-pine-html", "terminal", "rose-pine-spans"],
+)
+def test_output_suffix(formatter: Formatter, suffix: str) -> None:
+    """Formatters extending a stock one should get its suffix."""
+    assert rosepinecli.output_suffix(formatter) == suffix
@@ -0,0 +1,52 @@
+import hashlib
+
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.token import Token
+
+import rosepinecss
+from rosepinepalette import VARIANTS, build_style
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_stylesheet(variant: str) -> None:
+    """Every rule of ``get_style_defs`` should be in the minified sheet."""
+    css = rosepinecss.stylesheet(variant)
+    assert css is rosepinecss.stylesheet(variant)
+    assert b"/*" not in css and b"\n" not in css
+    background = build_style(variant).background_color.encode()
+    assert b".highlight{background:" + background in css
+    formatter = HtmlFormatter(style=build_style(variant))
+    defs = formatter.get_style_defs(".highlight")
+    assert css.count(b"}") == defs.count("}")
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_etag(variant: str) -> None:
+    """ETags should be quoted and follow the stylesheet content."""
+    digest = hashlib.sha256(rosepinecss.stylesheet(variant)).hexdigest()
+    assert rosepinecss.etag(variant) == f'"{digest[:32]}"'
+
+
+def test_etags_differ() -> None:
+    """Each variant should get its own ETag."""
+    etags = {rosepinecss.etag(variant) for variant in VARIANTS}
+    assert len(etags) == len(VARIANTS)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_inline_styles(variant: str) -> None:
+    """Inline styles should match the ones ``HtmlFormatter`` inlines."""
+    formatter = HtmlFormatter(style=build_style(variant), noclasses=True)
+    doc = Token.Literal.String.Doc
+    for ttype in (Token.Keyword, Token.Name.Decorator, doc):
+        css_class = formatter._get_css_inline_styles(ttype)
+        expected = formatter.class2style[css_class][0]
+        assert rosepinecss.inline_style(variant, str(ttype)) == expected
+
+
+def test_unknown_variant() -> None:
+    """Unknown variants should be rejected."""
+    with pytest.raises(ValueError):
+        rosepinecss.stylesheet("rose-pine-noon")
@@ -0,0 +1,91 @@
+from functools import partial
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+from pygments.token import Token
+
+from rosepinefilter import MergeStyleFilter, merge_tokens, style_key
+from rosepinepalette import VARIANTS, build_style
+from rosepineterm import get_formatter
+
+SOURCE = (Path(__file__).parents[1] / "src/rosepinestream.py").read_text()
+
+
+def styled_characters(tokens: list, style: type) -> list:
+    """Expand tokens into one ``(character, style)`` pair per character."""
+    key = partial(style_key, style)
+    return [(c, key(ttype)) for ttype, value in tokens for c in value]
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_merge_keeps_every_character_style(variant: str) -> None:
+    """Merging should not change the style of any character."""
+    style = build_style(variant)
+    tokens = list(PythonLexer().get_tokens(SOURCE))
+    merged = list(merge_tokens(tokens, style))
+    assert len(merged) < len(tokens)
+    assert styled_characters(merged, style) == styled_characters(tokens, style)
+    keys = [style_key(style, ttype) for ttype, _ in merged]
+    assert all(a != b for a, b in zip(keys, keys[1:]))
+
+
+def test_namespace_example() -> None:
+    """Names and the spaces between them should share one escape pair."""
+    formatter = get_formatter("rose-pine", merge=True)
+    code = "from rosepine import RosePineStyle"
+    output = pygments.highlight(code, PythonLexer(), formatter)
+    assert output == (
+        "\x1b[38;2;49;116;143mfrom\x1b[39m"
+        "\x1b[38;2;224;222;244m rosepine \x1b[39m"
+        "\x1b[38;2;49;116;143mimport\x1b[39m"
+        "\x1b[38;2;224;222;244m RosePineStyle\x1b[39m\n"
+    )
+
+
+@pytest.mark.parametrize("depth", ["truecolor", "256", "16"])
+def test_merged_output_is_smaller(depth: str) -> None:
+    """Merged terminal output should be smaller on real code."""
+    formatter = get_formatter(depth=depth)
+    plain = pygments.highlight(SOURCE, PythonLexer(), formatter)
+    merged = pygments.highlight(
+        SOURCE, PythonLexer(), get_formatter(depth=depth, merge=True)
+    )
+    assert len(merged) < 0.9 * len(plain)
+
+
+def test_filter() -> None:
+    """The filter should merge tokens for any formatter."""
+    lexer = PythonLexer()
+    lexer.add_filter(MergeStyleFilter(style="rose-pine-dawn"))
+    formatter = HtmlFormatter(style=build_style("rose-pine-dawn"))
+    html = pygments.highlight("a = b", lexer, formatter)
+    assert html.count("<span") == 3  # "a ", "=", " b\n"
+
+
+def test_unknown_token_types_resolve_to_parents() -> None:
+    """Token types the style does not define should use their parent."""
+    style = build_style("rose-pine")
+    custom = Token.Name.Custom.Thing
+    assert style_key(style, custom) == style_key(style, Token.Name)
+    assert list(merge_tokens([(Token.Name, "a"), (custom, "b")], style)) == [
+        (Token.Name, "ab")
+    ]
+
+
+def test_unknown_variant() -> None:
+    """The filter should reject unknown variants."""
+    with pytest.raises(ValueError):
+        MergeStyleFilter(style="rose-pine-noon")
+
+
+def test_key_without_style() -> None:
+    """A key should be enough to merge, and one of the two is needed."""
+    tokens = [(Token.Name, "a"), (Token.Name.Other, "b"), (Token.Text, " ")]
+    merged = merge_tokens(tokens, key=lambda ttype: ttype in Token.Name)
+    assert list(merged) == [(Token.Name, "ab"), (Token.Text, " ")]
+    with pytest.raises(ValueError):
+        list(merge_tokens(tokens))
@@ -0,0 +1,106 @@
+import io
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.lexers import PythonLexer
+
+from rosepinefused import highlight_python
+from rosepinepalette import VARIANTS
+from rosepineterm import formatter_for
+from test_rosepine import BASE_CASES, DAWN_CASES, MOON_CASES
+
+SOURCES = sorted((Path(__file__).parent.parent / "src").glob("*.py"))
+
+# Every file of the golden corpus is lexed as Python, whatever its language.
+CORPUS = sorted(
+    path
+    for path in (Path(__file__).parent / "golden" / "corpus").iterdir()
+    if path.is_file()
+)
+
+
+# The highlighting cases of the styles, for the variant they test.
+VARIANT_CASES = zip(VARIANTS, (BASE_CASES, MOON_CASES, DAWN_CASES))
+CASES = [
+    pytest.param(variant, *case.values, id=f"{variant}-{case.id}")
+    for variant, cases in VARIANT_CASES
+    for case in cases
+]
+
+
+def generic(code: str, variant: str) -> str:
+    return pygments.highlight(
+        code, PythonLexer(), formatter_for(variant, "terminal16m")
+    )
+
+
+@pytest.mark.parametrize("variant,code,expected", CASES)
+def test_highlighting(variant: str, code: str, expected: str) -> None:
+    """Every highlighting case of the styles should give the same output."""
+    assert highlight_python(code, variant) == expected
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("path", CORPUS, ids=lambda path: path.name)
+def test_golden_corpus(path: Path, variant: str) -> None:
+    """The golden corpus should match the generic pipeline."""
+    code = path.read_text(encoding="utf-8")
+    assert highlight_python(code, variant) == generic(code, variant)
+
+
+@pytest.mark.parametrize("path", SOURCES, ids=lambda path: path.name)
+def test_sources(path: Path) -> None:
+    """The sources of the package should match the generic pipeline."""
+    code = path.read_text(encoding="utf-8")
+    for variant in VARIANTS:
+        assert highlight_python(code, variant) == generic(code, variant)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "",
+        "\n\n\nx = 1\n\n",
+        "if x:\r\n\ty = 2\r\n",
+        "\ufeffimport os\n",
+        "a $ b ? c\n",
+        "def f(:\n    '''unterminated",
+        "f\"{x!r:>{width}}\" rb'\\x00' F'''{a}\n'''\n",
+        "match command:\n    case [x, *_]:\n        pass\n",
+        "no trailing newline",
+    ],
+)
+def test_edge_cases(code: str) -> None:
+    """Edge cases should match the generic pipeline."""
+    expected = generic(code, "rose-pine-moon")
+    assert highlight_python(code, "rose-pine-moon") == expected
+
+
+def test_outfile() -> None:
+    """Output should be written to the given stream."""
+    code = "def f():\n    return 1\n"
+    outfile = io.StringIO()
+    assert highlight_python(code, outfile=outfile) is None
+    assert outfile.getvalue() == generic(code, "rose-pine")
+
+
+def test_lexer_options() -> None:
+    """Lexer options should apply, with filters going the generic way."""
+    code = "\n\nx = 1\n\n"
+    formatter = formatter_for("rose-pine", "terminal16m")
+    expected = pygments.highlight(code, PythonLexer(stripnl=False), formatter)
+    assert highlight_python(code, stripnl=False) == expected
+    expected = pygments.highlight(
+        code,
+        PythonLexer(filters=["whitespace"]),
+        formatter_for("rose-pine", "terminal16m"),
+    )
+    assert highlight_python(code, filters=("whitespace",)) == expected
+
+
+def test_unknown_variant() -> None:
+    """Unknown variants should be rejected."""
+    with pytest.raises(ValueError, match="unknown Rose Pine variant"):
+        highlight_python("x = 1\n", "rose-pine-noon")
@@ -0,0 +1,92 @@
+import json
+import shutil
+import zlib
+from pathlib import Path
+
+import pytest
+
+import rosepinegolden
+from rosepinepalette import TOKEN_ROLES, VARIANTS
+
+
+def test_golden_files() -> None:
+    """The output should match the golden files; see rosepinegolden.py."""
+    problems = rosepinegolden.verify()
+    assert not problems, "\n".join(problems)
+
+
+def test_matrix() -> None:
+    """Every variant, format, corpus file and token role should be covered."""
+    path = rosepinegolden.GOLDEN_PATH / "manifest.json"
+    manifest = json.loads(path.read_text())
+    cases = {f"{v}/{f}" for v in VARIANTS for f in rosepinegolden.FORMATS}
+    assert set(manifest["outputs"]) == cases
+    samples = list(rosepinegolden.iter_samples(rosepinegolden.CORPUS_PATH))
+    assert set(manifest["samples"]) == set(samples)
+    for digests in manifest["outputs"].values():
+        assert {f"roles/{token}" for token in TOKEN_ROLES} <= set(digests)
+        assert set(samples) - {"roles"} <= set(digests)
+
+
+@pytest.fixture
+def golden(tmp_path: Path) -> tuple[Path, Path]:
+    """A small corpus and its golden files."""
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for name in ("example.py", "example.json"):
+        shutil.copy(rosepinegolden.CORPUS_PATH / name, corpus)
+    (corpus / "notes.unknown-extension").write_bytes(b"\xa7 not text")
+    count = rosepinegolden.generate(corpus, tmp_path / "golden")
+    cases = len(VARIANTS) * len(rosepinegolden.FORMATS)
+    assert count == cases * (len(TOKEN_ROLES) + 2)
+    return corpus, tmp_path / "golden"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_verify(golden: tuple[Path, Path], jobs: int) -> None:
+    """Freshly generated golden files should verify, serially or not."""
+    assert rosepinegolden.verify(*golden, jobs=jobs) == []
+
+
+def test_changed_output(golden: tuple[Path, Path]) -> None:
+    """Changed outputs should be reported with their difference."""
+    corpus, path = golden
+    case = "rose-pine-moon/terminal16m"
+    outputs = rosepinegolden.load_outputs(path, case)
+    manifest = json.loads((path / "manifest.json").read_text())
+    outputs["example.json"] = outputs["example.json"].replace("rose", "ROSE")
+    manifest["outputs"][case]["example.json"] = "0" * 32
+    rosepinegolden._output_path(path, case).write_bytes(
+        zlib.compress(json.dumps(outputs).encode())
+    )
+    (path / "manifest.json").write_text(json.dumps(manifest))
+    problems = rosepinegolden.verify(corpus, path)
+    assert len(problems) == 1
+    assert problems[0].startswith(f"{case}: example.json: output changed")
+    assert "ROSE" in problems[0]
+
+
+def test_changed_corpus(golden: tuple[Path, Path]) -> None:
+    """Added, removed and edited samples should be reported."""
+    corpus, path = golden
+    (corpus / "example.py").write_text("x = 2\n")
+    (corpus / "example.json").unlink()
+    (corpus / "example.sql").write_text("SELECT 1;\n")
+    assert sorted(rosepinegolden.verify(corpus, path)) == [
+        "example.json: missing from the corpus",
+        "example.py: source changed since the golden files",
+        "example.sql: not in the golden files",
+    ]
+
+
+def test_main(
+    golden: tuple[Path, Path],
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """The command line should fail on differences."""
+    corpus, path = golden
+    args = ["--corpus", str(corpus), "--golden", str(path), "-j", "1"]
+    assert rosepinegolden.main(args) == 0
+    (corpus / "example.py").write_text("x = 2\n")
+    assert rosepinegolden.main(args) == 1
+    assert "1 differences" in capsys.readouterr().out
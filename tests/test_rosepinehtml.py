@@ -0,0 +1,118 @@
+import html
+import re
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import JsonLexer, PythonLexer
+from pygments.token import STANDARD_TYPES
+
+from rosepinefilter import style_key
+from rosepinehtml import (
+    SLOT_CLASSES,
+    RosePineHtmlFormatter,
+    stylesheet,
+    stylesheet_for,
+)
+from rosepinepalette import STYLE_SLOTS, VARIANTS, build_style, token_slot
+from rosepineroles import slot_token
+
+SOURCE = (Path(__file__).parents[1] / "src/rosepinestream.py").read_text()
+JSON = '{"a": [1, 2.5, null]}\n' * 50
+
+TAG = re.compile(r"<[^>]*>")
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_slots_cover_the_style(variant: str) -> None:
+    """Every token type should look the same as the token of its slot."""
+    style = build_style(variant)
+    for ttype in STANDARD_TYPES:
+        assert style_key(style, ttype) == style_key(
+            style, slot_token(token_slot(ttype))
+        )
+
+
+def test_classes() -> None:
+    """Classes should be distinct letters, none for default-color text."""
+    names = [name for name in SLOT_CLASSES if name]
+    assert len(names) == len(STYLE_SLOTS) - 2
+    assert len(set(names)) == len(names)
+    assert all(len(name) == 1 for name in names)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_stylesheet(variant: str) -> None:
+    """The stylesheet should set the container colors and every class."""
+    css = stylesheet(variant)
+    style = build_style(variant)
+    assert css.startswith(f".highlight{{background:{style.background_color};")
+    for name in filter(None, SLOT_CLASSES):
+        assert f".highlight .{name}{{color:#" in css
+    assert ".highlight .g{color:#" in stylesheet(variant)
+    assert stylesheet(variant, "code").startswith(".code{")
+    with pytest.raises(ValueError):
+        stylesheet("rose-pine-noon")
+    assert stylesheet_for(style, "code") == stylesheet(variant, "code")
+
+
+@pytest.mark.parametrize("lexer_class", [PythonLexer, JsonLexer])
+def test_same_text_and_smaller(lexer_class: type) -> None:
+    """Output should hold the same text as the stock output, in fewer bytes."""
+    code = SOURCE if lexer_class is PythonLexer else JSON
+    stock = pygments.highlight(code, lexer_class(), HtmlFormatter())
+    compact = pygments.highlight(code, lexer_class(), RosePineHtmlFormatter())
+    text = html.unescape(TAG.sub("", compact))
+    assert text == html.unescape(TAG.sub("", stock))
+    assert len(compact) < 0.75 * len(stock)
+
+
+def test_markup() -> None:
+    """Spans should use unquoted slot classes and merge equal neighbours."""
+    formatter = RosePineHtmlFormatter(style="rose-pine-dawn", nowrap=True)
+    output = pygments.highlight('print("<a>", x.y)', PythonLexer(), formatter)
+    assert output == (
+        'print<span class=a>(</span><span class=c>"&lt;a&gt;"</span>'
+        "<span class=a>,</span> x<span class=e>.</span>"
+        "y<span class=a>)</span>\n"
+    )
+
+
+def test_themes_share_markup() -> None:
+    """Markup should not depend on the variant."""
+    outputs = set()
+    for variant in VARIANTS:
+        formatter = RosePineHtmlFormatter(style=variant)
+        outputs.add(pygments.highlight(SOURCE, PythonLexer(), formatter))
+    assert len(outputs) == 1
+
+
+def test_style_defs_and_options() -> None:
+    """Stock options should keep working with the slot classes."""
+    formatter = RosePineHtmlFormatter(style=build_style("rose-pine-moon"))
+    defs = formatter.get_style_defs(".highlight")
+    assert ".highlight { background: #232136; color: #e0def4 }" in defs
+    assert ".highlight .g { color: #c4a7e7; font-weight: bold }" in defs
+
+    full = RosePineHtmlFormatter(full=True, classprefix="rp-")
+    output = pygments.highlight("x = 1\n", PythonLexer(), full)
+    assert ".rp-e { color: #31748f }" in output
+    assert "<span class=rp-e>=</span>" in output
+
+    inline = RosePineHtmlFormatter(noclasses=True)
+    output = pygments.highlight("x = 1\n", PythonLexer(), inline)
+    assert '<span style="color: #31748f">=</span>' in output
+    style = "background: #191724; color: #e0def4"
+    assert f'<div class="highlight" style="{style}">' in output
+
+    inline = RosePineHtmlFormatter(
+        noclasses=True, nobackground=True, cssstyles="margin: 0"
+    )
+    output = pygments.highlight("x = 1\n", PythonLexer(), inline)
+    style = "color: #e0def4; margin: 0"
+    assert f'<div class="highlight" style="{style}">' in output
+
+    with pytest.raises(ValueError):
+        RosePineHtmlFormatter(style="rose-pine-noon")
@@ -0,0 +1,156 @@
+import random
+
+import pygments
+import pytest
+
+from pygments.lexer import Lexer
+from pygments.lexers import MarkdownLexer, PythonLexer, RubyLexer
+
+from rosepineincremental import IncrementalHighlighter
+from rosepineterm import get_formatter
+
+CELL = '''import math
+
+
+def area(radius: float) -> float:
+    """Compute the area of a circle.
+
+    Args:
+        radius (float): Radius.
+    """
+    return math.pi * radius ** 2  # Exact enough.
+
+
+print(f"{area(2):.2f}")
+'''
+
+DOC = """# Title
+
+Some `code` and *emphasis*.
+
+```python
+def f():
+    return 1
+```
+
+- item
+"""
+
+
+def highlight(text: str, lexer: Lexer) -> str:
+    return pygments.highlight(text, lexer, get_formatter("rose-pine-moon"))
+
+
+@pytest.mark.parametrize(
+    "lexer,text,lookahead",
+    [
+        (PythonLexer(stripnl=False), CELL * 3, 0),
+        (MarkdownLexer(stripnl=False), DOC * 3, 10_000),
+        (RubyLexer(stripnl=False), "def f(x)\n  x * 2 # twice\nend\n" * 5, 0),
+    ],
+)
+def test_random_edits_match_full_highlighting(
+    lexer: Lexer, text: str, lookahead: int
+) -> None:
+    """Output should match highlighting the whole buffer after every edit."""
+    rng = random.Random(0)
+    highlighter = IncrementalHighlighter(lexer, lookahead=lookahead)
+    inserts = ['"', "'", '"""', "#", "\n", "x", "(", "`", "```\n"]
+    for _ in range(200):
+        position = rng.randrange(len(text) + 1)
+        if rng.random() < 0.6:
+            insert = rng.choice(inserts)
+            text = text[:position] + insert + text[position:]
+        else:
+            end = position + rng.randrange(1, 5)
+            text = text[:position] + text[end:]
+        highlighter.update(text)
+        assert highlighter.render() == highlight(text, lexer)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_adversarial_edits_match_full_highlighting(seed: int) -> None:
+    """Edits closing constructs opened lines before should be caught.
+
+    A regular expression tried before the edited line, like the docstring
+    rule of ``PythonLexer``, can look past it, so the cached state of the
+    edited line may be wrong.
+    """
+    fragments = ['"""', "'''", "\n", "    ", "if ", "#", '"', "x", "(", ")"]
+    fragments += [":", "\\", "```", "`"]
+    rng = random.Random(seed)
+    for lexer, lookahead in (
+        (PythonLexer(stripnl=False), 0),
+        (MarkdownLexer(stripnl=False), 10_000),
+    ):
+        size = rng.randrange(5, 60)
+        text = "".join(rng.choice(fragments) for _ in range(size))
+        highlighter = IncrementalHighlighter(lexer, lookahead=lookahead)
+        highlighter.update(text)
+        for _ in range(10):
+            position = rng.randrange(len(text) + 1)
+            if rng.random() < 0.6:
+                fragment = rng.choice(fragments)
+                text = text[:position] + fragment + text[position:]
+            else:
+                end = position + rng.randrange(1, 5)
+                text = text[:position] + text[end:]
+            highlighter.update(text)
+            assert highlighter.render() == highlight(text, lexer)
+
+
+def test_edit_closing_earlier_docstring() -> None:
+    """Closing a docstring opened before the edited line should re-lex it."""
+    lexer = PythonLexer(stripnl=False)
+    text = (
+        '"""A.\n"""\n    """F.\n    """\n        """B# t.\n'
+        '            """    an.\n        """\n    """D.\n    """\n'
+        '    if encoding in ("g"):\n'
+    )
+    highlighter = IncrementalHighlighter(lexer)
+    highlighter.update(text)
+    position = text.index("if") + len("if")
+    text = text[:position] + '"""' + text[position:]
+    highlighter.update(text)
+    assert highlighter.render() == highlight(text, lexer)
+
+
+def test_small_edits_relex_few_lines() -> None:
+    """Typing in a long cell should only redraw the edited line.
+
+    The lines from the closest one in the root state before it, here the
+    ``def`` line, are re-lexed too, to check its cached state is still valid.
+    """
+    lexer = PythonLexer(stripnl=False)
+    text = CELL * 200
+    highlighter = IncrementalHighlighter(lexer)
+    assert highlighter.update(text) == range(0, len(highlighter.lines))
+    position = text.index("return math.pi", len(text) // 2)
+    text = text[:position] + "x = 1; " + text[position:]
+    changed = highlighter.update(text)
+    assert len(changed) == 1
+    assert highlighter.relexed == 6
+    assert highlighter.render() == highlight(text, lexer)
+    assert highlighter.update(text) == range(0, 0)
+
+
+def test_state_changes_propagate() -> None:
+    """Opening a string should re-lex until the state lines up again."""
+    lexer = PythonLexer(stripnl=False)
+    text = CELL * 20
+    highlighter = IncrementalHighlighter(lexer)
+    highlighter.update(text)
+    text = '"""\n' + text
+    highlighter.update(text)
+    assert highlighter.relexed > 100
+    assert highlighter.render() == highlight(text, lexer)
+
+
+def test_variant_and_format() -> None:
+    """The formatter should follow the variant and format."""
+    lexer = PythonLexer(stripnl=False)
+    dawn = "rose-pine-dawn"
+    highlighter = IncrementalHighlighter(lexer, dawn, "terminal256")
+    highlighter.update(CELL)
+    formatter = get_formatter(dawn, "256")
+    assert highlighter.render() == pygments.highlight(CELL, lexer, formatter)
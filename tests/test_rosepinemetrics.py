@@ -0,0 +1,117 @@
+import asyncio
+import io
+import json
+from functools import partial
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.lexers import PythonLexer
+
+from rosepineasync import HighlightService
+from rosepinecache import RenderCache
+from rosepinemetrics import (
+    COUNTERS,
+    STAGES,
+    Metrics,
+    active,
+    collect,
+    highlight,
+)
+from rosepinestream import highlight_stream
+from rosepineterm import formatter_for
+
+CODE = "def answer() -> int:\n    return 42\n"
+
+
+def test_inactive_by_default() -> None:
+    """Nothing should be collected outside ``collect``."""
+    assert active() is None
+    formatter = formatter_for("rose-pine", "terminal16m")
+    assert highlight(CODE, PythonLexer(), formatter) == pygments.highlight(
+        CODE, PythonLexer(), formatter
+    )
+    with collect() as metrics:
+        assert active() is metrics
+        with collect(Metrics()) as inner:
+            assert active() is inner
+        assert active() is metrics
+    assert active() is None
+
+
+@pytest.mark.parametrize("fmt", ["terminal256", "html"])
+def test_stages_and_counters(fmt: str) -> None:
+    """A highlight should record every stage, its tokens and its output."""
+    with collect() as metrics:
+        formatter = formatter_for("rose-pine-moon", fmt, encoding="utf-8")
+        output = highlight(CODE, PythonLexer(), formatter)
+    assert output == pygments.highlight(CODE, PythonLexer(), formatter)
+    assert all(metrics.seconds[stage] > 0 for stage in STAGES)
+    assert all(metrics.calls[stage] == 1 for stage in STAGES)
+    assert metrics.counters["highlights"] == 1
+    tokens = list(PythonLexer().get_tokens(CODE))
+    assert metrics.counters["tokens"] == len(tokens)
+    assert metrics.counters["output_bytes"] == len(output)
+
+
+def test_stream_counts_written_bytes() -> None:
+    """Output written to a stream should be counted."""
+    buffer = io.StringIO()
+    with collect() as metrics:
+        highlight_stream(io.StringIO("é = 1\n"), PythonLexer(), buffer)
+    assert metrics.counters["output_bytes"] == len(buffer.getvalue().encode())
+    assert metrics.counters["highlights"] == 1
+
+
+def test_cache_hit_rate(tmp_path: Path) -> None:
+    """Cache lookups should be counted."""
+    cache = RenderCache(tmp_path)
+    formatter = formatter_for("rose-pine", "html")
+    with collect() as metrics:
+        assert metrics.cache_hit_rate is None
+        for _ in range(4):
+            cache.highlight(CODE, PythonLexer(), formatter)
+    assert metrics.counters["cache_hits"] == 3
+    assert metrics.counters["cache_misses"] == 1
+    assert metrics.counters["highlights"] == 1
+    assert metrics.cache_hit_rate == 0.75
+
+
+def test_worker_threads_are_recorded() -> None:
+    """Calls run on the async service's threads should be recorded."""
+
+    async def run() -> None:
+        async with HighlightService(max_workers=2) as service:
+            call = partial(service.highlight, CODE, "python", fmt="html")
+            await asyncio.gather(*[call() for _ in range(3)])
+
+    with collect() as metrics:
+        asyncio.run(run())
+    assert metrics.counters["highlights"] == 3
+
+
+def test_exports(tmp_path: Path) -> None:
+    """Metrics should export to Prometheus text and JSON files."""
+    with collect() as metrics:
+        formatter = formatter_for("rose-pine", "terminal16m")
+        highlight(CODE, PythonLexer(), formatter)
+        RenderCache(tmp_path / "cache").get("0" * 64)
+    text = metrics.to_prometheus()
+    assert 'rose_pine_stage_seconds_total{stage="lex"} ' in text
+    assert 'rose_pine_stage_calls_total{stage="format"} 1\n' in text
+    assert "rose_pine_highlights_total 1\n" in text
+    assert "rose_pine_cache_hit_ratio 0.0\n" in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.split(" ")) == 2
+
+    metrics.write_prometheus(tmp_path / "metrics.prom")
+    assert (tmp_path / "metrics.prom").read_text() == text
+    metrics.write_json(tmp_path / "metrics.json")
+    data = json.loads((tmp_path / "metrics.json").read_text())
+    assert set(data["stages"]) == set(STAGES)
+    assert all(name in data for name in COUNTERS)
+    assert data["cache_misses"] == 1
+
+    metrics.reset()
+    assert metrics.snapshot()["highlights"] == 0
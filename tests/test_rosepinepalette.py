@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import rosepine
+import rosepinedawn
+import rosepinemoon
+from rosepinepalette import PALETTE, ROLES, TOKEN_ROLES, VARIANTS, build_style
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_palette_is_complete(variant: str) -> None:
+    """Every variant should define every role, in the same order."""
+    assert tuple(PALETTE[variant]) == ROLES
+
+
+def test_token_roles_exist() -> None:
+    """Token roles should only reference palette roles."""
+    assert {role for role, _ in TOKEN_ROLES.values()} <= set(ROLES)
+
+
+@pytest.mark.parametrize(
+    "module,variant,prefix",
+    [
+        (rosepine, "rose-pine", "pine"),
+        (rosepinemoon, "rose-pine-moon", "moon"),
+        (rosepinedawn, "rose-pine-dawn", "dawn"),
+    ],
+)
+def test_color_dataclass(module: object, variant: str, prefix: str) -> None:
+    """The ``Color`` dataclasses should expose the palette of their variant."""
+    color = module.Color  # type: ignore[attr-defined]
+    for role, value in PALETTE[variant].items():
+        assert getattr(color, f"{prefix}_{role}") == value
+
+
+def test_entry_points_are_shared() -> None:
+    """Every access should get the same style class."""
+    assert rosepine.RosePineStyle is build_style("rose-pine")
+    assert rosepinemoon.RosePineMoonStyle is build_style("rose-pine-moon")
+    assert rosepinedawn.RosePineDawnStyle is build_style("rose-pine-dawn")
+    assert rosepine.RosePineStyle.name == "rose-pine"
+
+
+def test_unknown_attribute() -> None:
+    """Other attributes should still raise ``AttributeError``."""
+    with pytest.raises(AttributeError):
+        rosepine.RosePineMoonStyle  # noqa: B018
+
+
+def test_import_is_lazy() -> None:
+    """Importing a variant should not build any style class."""
+    code = (
+        "import sys, rosepinemoon;"
+        "assert 'pygments.style' not in sys.modules;"
+        "rosepinemoon.RosePineMoonStyle;"
+        "assert 'pygments.style' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -0,0 +1,151 @@
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pygments
+import pytest
+
+from pygments.lexer import Lexer
+from pygments.lexers import MarkdownLexer, PythonLexer, SqlLexer, YamlLexer
+
+from rosepineparallel import (
+    can_split,
+    highlight_chunk,
+    highlight_parallel,
+    split_points,
+)
+from rosepineterm import formatter_for
+
+SOURCE = (Path(__file__).parents[1] / "src/rosepinestream.py").read_text()
+
+# Blank lines followed by top-level code inside strings and fences, which
+# look like resync points but are not.
+TRAPS = {
+    "python": 'x = """\n\nimport os\n\ny = 1\n"""\n\n',
+    "markdown": "# Title\n\n```python\n\ndef f():\n\n    pass\n```\n\n",
+    "sql": "SELECT 'a\n\nFROM b' FROM c;\n\n/* x\n\nSELECT 1 */\n\n",
+}
+
+CASES = [
+    pytest.param(PythonLexer, (SOURCE + TRAPS["python"]) * 3, id="python"),
+    pytest.param(
+        MarkdownLexer,
+        (TRAPS["markdown"] + "Some *text*.\n\n") * 40,
+        id="markdown",
+    ),
+    pytest.param(
+        SqlLexer,
+        (TRAPS["sql"] + "SELECT * FROM t WHERE x = 1;\n\n") * 40,
+        id="sql",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("lexer_class, code", CASES)
+@pytest.mark.parametrize(
+    "fmt, options",
+    [
+        ("terminal16m", {}),
+        ("terminal256", {"merge": True}),
+        ("terminal16", {"encoding": "utf-8"}),
+        ("html", {"nowrap": True}),
+    ],
+)
+def test_identical_to_serial(
+    pool: ProcessPoolExecutor,
+    lexer_class: type[Lexer],
+    code: str,
+    fmt: str,
+    options: dict,
+) -> None:
+    """Parallel output should be byte-identical to ``pygments.highlight``."""
+    expected = pygments.highlight(
+        code, lexer_class(), formatter_for("rose-pine-moon", fmt, **options)
+    )
+    output = highlight_parallel(
+        code,
+        lexer_class(),
+        "rose-pine-moon",
+        fmt,
+        chunk_size=200,
+        executor=pool,
+        **options,
+    )
+    assert output == expected
+
+
+def test_lexer_options(pool: ProcessPoolExecutor) -> None:
+    """Preprocessing options should apply to the whole document."""
+    code = "\n\n\tx = 1\r\n" * 50 + "\n\n"
+    lexer = PythonLexer(stripall=True, tabsize=4)
+    formatter = formatter_for("rose-pine", "terminal16m")
+    expected = pygments.highlight(code, lexer, formatter)
+    output = highlight_parallel(code, lexer, chunk_size=64, executor=pool)
+    assert output == expected
+
+
+def test_split_points() -> None:
+    """Splits should prefer top-level lines after blank lines."""
+    text = "ab\ncd\n\nef\ngh\n"
+    assert split_points(text, 4) == [0, 7, len(text)]
+    assert split_points(text, 100) == [0, len(text)]
+    assert split_points("a\nb\nc\n", 1) == [0, 2, 4, 6]
+
+
+def test_false_resync_point_is_rejected() -> None:
+    """A chunk ending inside a multi-line token should be rejected."""
+    text = TRAPS["python"]
+    end = text.index("import")
+    args = (PythonLexer(), "rose-pine", "html", ())
+    assert highlight_chunk(text, 0, end, *args) is None
+    assert highlight_chunk(text, 0, text.index("y ="), *args) is None
+    assert highlight_chunk(text, 0, len(text), *args)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool counting the chunks submitted to it."""
+
+    def __init__(self) -> None:
+        super().__init__(2)
+        self.submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> Future:
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_failed_merges_go_serial() -> None:
+    """Chunks should not be merged over and over when no point resyncs."""
+    code = '"""\n' + "\n\nx = 1\n" * 2000 + '"""\n'
+    points = split_points(code, 100)
+    formatter = formatter_for("rose-pine", "terminal16m")
+    expected = pygments.highlight(code, PythonLexer(), formatter)
+    with CountingExecutor() as executor:
+        output = highlight_parallel(
+            code, PythonLexer(), chunk_size=100, executor=executor
+        )
+    assert output == expected
+    assert len(points) > 100
+    assert executor.submitted <= len(points)
+
+
+def test_serial_fallback() -> None:
+    """Unsupported lexers and formats should fall back to a serial run."""
+    assert not can_split(PythonLexer(), "html", {})
+    assert not can_split(PythonLexer(), "terminal16m", {"linenos": True})
+    assert not can_split(YamlLexer(), "terminal16m", {})
+    lexer = PythonLexer()
+    lexer.add_filter("whitespace", spaces=True)
+    assert not can_split(lexer, "terminal16m", {})
+    code = SOURCE[:2000]
+    formatter = formatter_for("rose-pine", "html")
+    expected = pygments.highlight(code, lexer, formatter)
+    output = highlight_parallel(code, lexer, fmt="html", chunk_size=100)
+    assert output == expected
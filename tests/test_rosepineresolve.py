@@ -0,0 +1,79 @@
+import pytest
+
+from pygments.style import Style
+from pygments.token import STANDARD_TYPES, Token, string_to_tokentype
+
+import rosepinestyles
+from rosepinepalette import (
+    VARIANTS,
+    build_style,
+    parse_style,
+    style_definitions,
+)
+from rosepineresolve import StyleRecord
+
+
+def reference(variant: str) -> type:
+    """Build the variant with the stock ``StyleMeta``, as it used to be."""
+    return type(
+        "Reference",
+        (Style,),
+        {
+            "styles": {
+                string_to_tokentype(token): value
+                for token, value in style_definitions(variant).items()
+            },
+        },
+    )
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_matches_stock_resolution(variant: str) -> None:
+    """Resolved styles should match what ``StyleMeta`` computes."""
+    style, stock = build_style(variant), reference(variant)
+    assert set(STANDARD_TYPES) <= set(style.records)
+    for token in STANDARD_TYPES:
+        assert style.style_for_token(token) == stock.style_for_token(token)
+
+
+def test_lookup_is_cached() -> None:
+    """Repeated lookups should return the same objects."""
+    style = build_style("rose-pine")
+    token = Token.Name.Builtin.Pseudo
+    assert style.style_for_token(token) is style.style_for_token(token)
+    record = StyleRecord("eb6f92", False, False, None)
+    assert style.record_for_token(token) == record
+
+
+def test_record_slots() -> None:
+    """Records should not carry a ``__dict__``."""
+    style = build_style("rose-pine-dawn")
+    record = style.record_for_token(Token.Name.Decorator)
+    assert not hasattr(record, "__dict__")
+    assert record.bold and record.color == "907aa9"
+
+
+def test_unknown_token_inherits() -> None:
+    """Token types created at runtime should resolve to their parent."""
+    style = build_style("rose-pine-moon")
+    token = Token.Keyword.Namespace.Custom
+    parent = style.record_for_token(token.parent)
+    assert style.record_for_token(token) is parent
+
+
+def test_placeholder_forwards() -> None:
+    """The lazy entry points should expose the same tables."""
+    style, real = rosepinestyles.RosePineStyle, build_style("rose-pine")
+    assert style.records is real.records
+    assert style.style_for_token(Token) is real.style_for_token(Token)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_precompiled_matches_parsing(variant: str) -> None:
+    """Styles loaded from the generated definitions should match parsing."""
+    style, parsed = build_style(variant), parse_style(variant)
+    assert list(style._styles.items()) == list(parsed._styles.items())
+    assert list(style) == list(parsed)
+    assert style.styles == parsed.styles
+    records = {token: style.records[token] for token in parsed.records}
+    assert records == parsed.records
@@ -0,0 +1,77 @@
+import io
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import MarkdownLexer, PythonLexer
+from pygments.token import Token
+
+from rosepinefilter import style_key
+from rosepinepalette import STYLE_SLOTS, VARIANTS, build_style, token_slot
+from rosepineroles import lex_runs, render, slot_token, tokens
+from rosepineterm import TERMINAL_FORMATS, get_formatter
+
+SOURCE = (Path(__file__).parents[1] / "src/rosepinestream.py").read_text()
+
+
+def test_slot_tokens_round_trip() -> None:
+    """Every slot should be represented by a token type of that slot."""
+    assert slot_token(0) is Token
+    for slot in range(len(STYLE_SLOTS)):
+        assert token_slot(slot_token(slot)) == slot
+
+
+def test_runs_keep_the_text() -> None:
+    """Runs should cover the lexed text, with distinct adjacent slots."""
+    runs = lex_runs(SOURCE, PythonLexer())
+    text = "".join(value for _, value in PythonLexer().get_tokens(SOURCE))
+    assert "".join(value for value, _ in runs) == text
+    slots = [slot for _, slot in runs]
+    assert all(a != b for a, b in zip(slots, slots[1:]))
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_runs_keep_every_character_style(variant: str) -> None:
+    """Rendering runs should style each character as the lexer tokens do."""
+    style = build_style(variant)
+    lexed = PythonLexer().get_tokens(SOURCE)
+    expected = [(c, style_key(style, t)) for t, value in lexed for c in value]
+    runs = tokens(lex_runs(SOURCE, PythonLexer()))
+    actual = [(c, style_key(style, t)) for t, value in runs for c in value]
+    assert actual == expected
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("fmt", TERMINAL_FORMATS)
+def test_terminal_render_matches_formatter(variant: str, fmt: str) -> None:
+    """The table-driven renderer should match the terminal formatters."""
+    runs = lex_runs(SOURCE + "\n\n  \n", MarkdownLexer())
+    buffer = io.StringIO()
+    get_formatter(variant, TERMINAL_FORMATS[fmt]).format(tokens(runs), buffer)
+    assert render(runs, variant, fmt) == buffer.getvalue()
+
+
+def test_render_other_formats() -> None:
+    """Other formats should render through their formatter."""
+    runs = lex_runs("x = 'a'\n", PythonLexer())
+    html = render(runs, "rose-pine-dawn", "html", nowrap=True)
+    assert html == pygments.format(tokens(runs), HtmlFormatter(nowrap=True))
+    numbered = render(runs, "rose-pine", "terminal256", linenos=True)
+    assert numbered.startswith("0001: \x1b[38;5;")
+
+
+def test_retheme_does_not_lex(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Switching variants should not run the lexer again."""
+    lexer = PythonLexer()
+    runs = lex_runs(SOURCE, lexer)
+    monkeypatch.setattr(lexer, "get_tokens", None)
+    outputs = {render(runs, variant) for variant in VARIANTS}
+    assert len(outputs) == len(VARIANTS)
+
+
+def test_unknown_variant() -> None:
+    """Unknown variants should be rejected."""
+    with pytest.raises(ValueError):
+        render([], "rose-pine-noon")
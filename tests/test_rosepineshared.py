@@ -0,0 +1,98 @@
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.lexers import PythonLexer
+
+import rosepinecss
+import rosepinehtml
+import rosepineshared
+from rosepinepalette import VARIANTS
+from rosepineroles import escapes
+from rosepineterm import formatter_for
+
+CODE = '''@decorator
+class Example(Base):
+    """Docstring."""
+
+    def method(self, value: int = 0x1F) -> str:
+        return f"{value!r} \\n" % (1, None, True)
+'''
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared tables exported once for the module."""
+    path = tmp_path_factory.mktemp("shared") / "rose-pine.tables"
+    rosepineshared.export(path)
+    return path
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("fmt", list(rosepineshared.TERMINAL_FORMATS))
+def test_same_output(path: Path, variant: str, fmt: str) -> None:
+    """Formatting from the shared tables should match the stock formatters."""
+    tables = rosepineshared.attach(path)
+    stock = formatter_for(variant, fmt)
+    expected = pygments.highlight(CODE, PythonLexer(), stock)
+    shared = tables.formatter(variant, fmt)
+    assert pygments.highlight(CODE, PythonLexer(), shared) == expected
+    encoded = tables.formatter(variant, fmt, encoding="utf-8")
+    output = pygments.highlight(CODE, PythonLexer(), encoded)
+    assert output == expected.encode()
+    depth = rosepineshared.TERMINAL_FORMATS[fmt]
+    assert tables.escapes(variant, depth) == escapes(variant, depth)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_stylesheets_are_views(path: Path, variant: str) -> None:
+    """Stylesheets should be views into the mapping."""
+    tables = rosepineshared.attach(path)
+    css = tables.stylesheet(variant)
+    assert isinstance(css, memoryview) and css.readonly
+    assert css == rosepinecss.stylesheet(variant)
+    compact = tables.stylesheet(variant, compact=True)
+    assert compact == rosepinehtml.stylesheet(variant).encode()
+    assert tables.etag(variant) == rosepinecss.etag(variant)
+
+
+def test_export_replaces_read_only_file(path: Path) -> None:
+    """Exporting again should replace the read-only file atomically."""
+    tables = rosepineshared.attach(path)
+    rosepineshared.export(path)
+    writable = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    assert not path.stat().st_mode & writable
+    assert tables.etag() == rosepineshared.attach(path).etag()
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_rejects_other_data(path: Path) -> None:
+    """Other files and unknown names should be rejected."""
+    with pytest.raises(ValueError):
+        rosepineshared.SharedTables(b"RPSP")
+    with pytest.raises(ValueError):
+        rosepineshared.SharedTables(b"RPSP" + bytes(64))
+    tables = rosepineshared.attach(path)
+    with pytest.raises(ValueError):
+        tables.stylesheet("rose-pine-noon")
+    with pytest.raises(ValueError):
+        tables.escapes("rose-pine", "8")
+    with pytest.raises(ValueError):
+        tables.formatter("rose-pine", "html")
+
+
+def test_workers_skip_tables(path: Path) -> None:
+    """Attaching should not import the tables nor build any style."""
+    code = (
+        "import sys, pygments, rosepineshared\n"
+        "from pygments.lexers import PythonLexer\n"
+        f"tables = rosepineshared.attach({str(path)!r})\n"
+        "pygments.highlight('x = 1', PythonLexer(), tables.formatter())\n"
+        "assert 'rosepinetables' not in sys.modules\n"
+        "assert 'rosepineresolve' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
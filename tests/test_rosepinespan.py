@@ -0,0 +1,105 @@
+import mmap
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.lexers import PythonLexer
+from pygments.token import STANDARD_TYPES
+
+from rosepinepalette import VARIANTS, build_style, token_slot
+from rosepinespan import (
+    BOLD,
+    HEADER_SIZE,
+    NO_ROLE,
+    RosePineSpanFormatter,
+    header,
+    read_spans,
+    retheme,
+)
+
+CODE = '''@decorator
+class Example(Base):
+    """Docstring."""
+
+    def method(self, value: int = 0x1F) -> str:
+        return f"{value!r}"  # Comment.
+'''
+
+
+def spans_of(code: str, variant: str) -> bytes:
+    formatter = RosePineSpanFormatter(style=variant)
+    return pygments.highlight(code, PythonLexer(), formatter)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_slots_match_the_style(variant: str) -> None:
+    """Header colors and flags should be what the style resolves to."""
+    style = build_style(variant)
+    parsed = read_spans(header(variant))
+    for ttype in STANDARD_TYPES:
+        role, flags = parsed.slots[token_slot(ttype)]
+        ndef = style.style_for_token(ttype)
+        color = None if role == NO_ROLE else parsed.colors[role].lstrip("#")
+        assert color == ndef["color"], ttype
+        assert bool(flags & BOLD) == ndef["bold"], ttype
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_spans_cover_the_tokens(variant: str) -> None:
+    """Every styled character should be in a span with its token's slot."""
+    parsed = read_spans(spans_of(CODE, variant))
+    expected = []
+    for ttype, value in PythonLexer().get_tokens(CODE):
+        expected.extend([token_slot(ttype)] * len(value))
+    painted = [0] * len(expected)
+    for offset, length, slot in parsed.spans():
+        assert slot != 0
+        end = offset + length
+        painted[offset:end] = [slot] * length
+    assert painted == expected
+    spans = parsed.spans()
+    pairs = list(zip(spans, spans[1:]))
+    assert all(a[0] + a[1] <= b[0] for a, b in pairs)
+    assert all(a[2] != b[2] or a[0] + a[1] < b[0] for a, b in pairs)
+
+
+def test_retheme() -> None:
+    """Swapping the header should be the same as formatting again."""
+    data = spans_of(CODE, "rose-pine")
+    assert len({len(header(variant)) for variant in VARIANTS}) == 1
+    assert retheme(data, "rose-pine-dawn") == spans_of(CODE, "rose-pine-dawn")
+    assert data[HEADER_SIZE:] == spans_of(CODE, "rose-pine-moon")[HEADER_SIZE:]
+
+
+def test_style_class_option() -> None:
+    """The style option should also accept the style classes."""
+    formatter = RosePineSpanFormatter(style=build_style("rose-pine-moon"))
+    assert formatter.header == header("rose-pine-moon")
+
+
+def test_mmap(tmp_path: Path) -> None:
+    """Span files should be readable straight from a memory map."""
+    path = tmp_path / "code.rpspan"
+    with open(path, "wb") as handle:
+        tokens = PythonLexer().get_tokens(CODE * 2000)
+        RosePineSpanFormatter().format(tokens, handle)
+    with open(path, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as view:
+        parsed = read_spans(view)
+        assert len(parsed.records) % 3 == 0 and len(parsed.records) > 3 * 4096
+        assert parsed.colors[0] == build_style("rose-pine").background_color
+        count = len(parsed.records)
+        del parsed
+    assert path.stat().st_size == HEADER_SIZE + 4 * count
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"nope" + bytes(100), header("rose-pine")[:4]],
+)
+def test_invalid_streams(data: bytes) -> None:
+    """Other data should be rejected."""
+    with pytest.raises(ValueError):
+        read_spans(data)
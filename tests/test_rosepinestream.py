@@ -0,0 +1,221 @@
+import io
+import itertools
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter
+from pygments.lexer import Lexer
+from pygments.lexers import (
+    CLexer,
+    JsonLexer,
+    MarkdownLexer,
+    PythonLexer,
+    TextLexer,
+    YamlLexer,
+)
+
+from rosepinelexer import lex_chunks, resync_chunks
+
+from rosepinepalette import build_style
+from rosepinestream import (
+    ChunkedWriter,
+    highlight_stream,
+    iter_chunks,
+    stream_tokens,
+)
+from rosepineterm import get_formatter
+
+ROOT = Path(__file__).parent.parent
+
+SOURCES = [
+    pytest.param((ROOT / "src/rosepinestream.py").read_text(), id="python"),
+    pytest.param((ROOT / "README.md").read_text(), id="markdown"),
+    pytest.param('{"a": [1, 2.5, null],\n "b": "c"}\n', id="json"),
+    pytest.param("\n\n  x = 1\t# tab\r\n\n\n", id="blank-lines"),
+    pytest.param('a\r"""doc\n\nstill doc\n"""\n   \n', id="docstring"),
+    pytest.param("", id="empty"),
+]
+
+LEXERS = [
+    PythonLexer(),
+    PythonLexer(stripnl=False),
+    PythonLexer(stripall=True),
+    PythonLexer(ensurenl=False),
+    JsonLexer(),
+    MarkdownLexer(),
+    CLexer(),  # Cannot be resumed, so it is resynced.
+    TextLexer(),
+]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("lexer", LEXERS, ids=lambda lexer: repr(lexer))
+@pytest.mark.parametrize("chunk_size", [1, 64, 4096])
+def test_matches_highlight(source: str, lexer: Lexer, chunk_size: int) -> None:
+    """Streaming should give the same output as ``pygments.highlight``."""
+    expected = pygments.highlight(source, lexer, get_formatter())
+    out = io.StringIO()
+    highlight_stream(io.StringIO(source), lexer, out, chunk_size=chunk_size)
+    assert out.getvalue() == expected
+
+
+def test_custom_formatter_and_bytes() -> None:
+    """Binary lines and other formatters should be supported."""
+    source = "café = 'crème'\n" * 3
+    formatter = HtmlFormatter(style=build_style("rose-pine-dawn"))
+    out = io.StringIO()
+    lines = io.BytesIO(("\ufeff" + source).encode("utf-8"))
+    lexer = PythonLexer(encoding="utf-8")
+    highlight_stream(lines, lexer, out, formatter=formatter)
+    expected = pygments.highlight(source, PythonLexer(), formatter)
+    assert out.getvalue() == expected
+
+
+def test_chunks_are_bounded() -> None:
+    """Chunks should only hold about ``chunk_size`` characters of lines."""
+    lines = (f"x{i} = {i}\n" for i in range(1000))
+    chunks = list(iter_chunks(lines, PythonLexer(), chunk_size=100))
+    assert max(map(len, chunks)) < 120
+    assert all(chunk.endswith("\n") for chunk in chunks)
+
+
+def test_writer_batches_writes() -> None:
+    """The writer should forward writes in a few large pieces."""
+    out = io.StringIO()
+    writes = []
+    out.write = writes.append  # type: ignore[method-assign]
+    writer = ChunkedWriter(out, chunk_size=10)
+    for _ in range(25):
+        writer.write("ab")
+    writer.flush()
+    assert "".join(writes) == "ab" * 25
+    assert len(writes) == 5
+
+
+class NullWriter(io.StringIO):
+    """Stream that discards everything written to it."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def generated(count: int) -> Iterator[str]:
+    """Generate a Python source of ``count`` functions, line by line."""
+    for i in range(count):
+        yield f"def f{i}(x):\n"
+        yield f'    """Doc {i}."""\n'
+        yield "    return x\n"
+        yield "\n"
+
+
+def generated_json(count: int) -> Iterator[str]:
+    """Generate a JSON array of ``count`` objects, line by line."""
+    yield "[\n"
+    for i in range(count):
+        name = f'"name": "item {i}"'
+        yield f'  {{"id": {i}, {name}, "tags": ["a", "b"], "ok": true}},\n'
+    yield "  null\n]\n"
+
+
+def generated_log(count: int) -> Iterator[str]:
+    """Generate ``count`` log lines."""
+    for i in range(count):
+        time = f"12:{i // 60 % 60:02}:{i % 60:02}"
+        yield f"2024-05-01 {time} INFO worker {i}: done\n"
+
+
+def peak_memory(lines: Iterator[str], lexer: Lexer) -> int:
+    """Measure the peak memory used to stream lines."""
+    tracemalloc.start()
+    out = NullWriter()
+    highlight_stream(lines, lexer, out, chunk_size=1024, lookahead=1024)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize(
+    "generate,lexer",
+    [(generated, PythonLexer()), (generated_json, JsonLexer())]
+    + [(generated_log, TextLexer())],
+    ids=["python", "json", "log"],
+)
+def test_memory_is_flat(
+    generate: Callable[[int], Iterator[str]],
+    lexer: Lexer,
+) -> None:
+    """Memory use should not grow with the size of the input."""
+    small = peak_memory(generate(500), lexer)
+    large = peak_memory(generate(5_000), lexer)
+    assert large < small * 1.5
+
+
+@pytest.mark.parametrize(
+    "lexer,source",
+    [
+        (JsonLexer(), '{"a": 1,\n /* c\n */ "b"\n : [true, null]}\n' * 40),
+        (
+            CLexer(),
+            "/* a\n b */\nint main(void) {\n  return 0; // x\n}\n" * 40,
+        ),
+        (
+            YamlLexer(),
+            "a:\n  b: |\n    text\n    more\n  c: [1, 2]\n- x\n" * 40,
+        ),
+    ],
+    ids=["json", "c", "yaml"],
+)
+@pytest.mark.parametrize("chunk_size,lookahead", [(64, 256), (256, 1024)])
+def test_resync_matches_highlight(
+    lexer: Lexer, source: str, chunk_size: int, lookahead: int
+) -> None:
+    """Restarting lexers that cannot be resumed should not change tokens."""
+    expected = pygments.highlight(source, lexer, get_formatter())
+    out = io.StringIO()
+    sizes = {"chunk_size": chunk_size, "lookahead": lookahead}
+    highlight_stream(io.StringIO(source), lexer, out, **sizes)
+    assert out.getvalue() == expected
+    chunks = iter_chunks(io.StringIO(source), lexer, chunk_size)
+    tokens = list(resync_chunks(lexer, chunks, lookahead))
+    assert tokens == list(lexer.get_tokens_unprocessed(source))
+
+
+def test_carry_is_capped() -> None:
+    """Text should not be carried over past ``max_carry`` characters."""
+    lexer = PythonLexer()
+    source = '"""' + "doc\n" * 10_000 + '"""\nx = 1\n'
+    chunks = list(iter_chunks(io.StringIO(source), lexer, chunk_size=100))
+    seen = []
+
+    def spy() -> Iterator[str]:
+        for chunk in chunks:
+            seen.append(chunk)
+            yield chunk
+
+    carried = []
+    tokens = lex_chunks(lexer, spy(), lookahead=100, max_carry=1000)
+    for offset, _, value in tokens:
+        carried.append(sum(map(len, seen)) - offset)
+        assert source.startswith(value, offset)
+    assert max(carried) < 1500
+    # Lines longer than ``max_carry`` are cut between tokens.
+    line = "[" + "1, " * 5000 + "1]\n"
+    cases = [(lex_chunks, PythonLexer()), (resync_chunks, JsonLexer())]
+    for lex, lexer in cases:
+        tokens = lex(lexer, iter([line, line]), 100, 1000)
+        assert "".join(value for _, _, value in tokens) == line * 2
+
+
+def test_lines_are_consumed_lazily() -> None:
+    """The source should only be read as far as needed."""
+    lines = generated(10**9)
+    out = io.StringIO()
+    writer = ChunkedWriter(out, 100)
+    formatter = get_formatter()
+    tokens = stream_tokens(lines, PythonLexer(), chunk_size=100)
+    formatter.format(itertools.islice(tokens, 1000), writer)
+    assert out.getvalue()
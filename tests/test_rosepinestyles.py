@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pygments
+import pytest
+
+from pygments.formatters import HtmlFormatter, TerminalTrueColorFormatter
+from pygments.lexers import PythonLexer
+from pygments.style import Style
+
+import rosepinestyles
+from rosepinepalette import ENTRY_POINTS, VARIANTS, build_style
+
+# Resolve the three entry points the way ``get_all_styles()`` does.
+DISCOVER = "import rosepinestyles; " + "; ".join(
+    f"rosepinestyles.{name}" for _, name in ENTRY_POINTS.values()
+)
+
+
+def test_discovery_does_not_build() -> None:
+    """Resolving the entry points should not build any style class."""
+    modules = {"rosepinetables", "rosepinedefs"}
+    modules.update(module for module, _ in ENTRY_POINTS.values())
+    code = f"""
+import gc
+import sys
+{DISCOVER}
+import rosepinepalette
+from pygments.style import Style, StyleMeta
+from rosepinestyles import LazyStyleMeta
+loaded = sorted({sorted(modules)!r} & sys.modules.keys())
+assert not loaded, loaded
+styles = [o for o in gc.get_objects() if isinstance(o, StyleMeta)]
+built = [o for o in styles if not isinstance(o, LazyStyleMeta)]
+assert built == [Style], built
+assert rosepinepalette.build_style.cache_info().currsize == 0
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_placeholder_behaves_like_style(variant: str) -> None:
+    """Formatters should not be able to tell the placeholder apart."""
+    placeholder = getattr(rosepinestyles, ENTRY_POINTS[variant][1])
+    style = build_style(variant)
+    assert issubclass(placeholder, Style)
+    assert placeholder.name == variant
+    assert placeholder.background_color == style.background_color
+    assert placeholder.styles is style.styles
+    assert list(placeholder) == list(style)
+    for formatter in (HtmlFormatter, TerminalTrueColorFormatter):
+        lazy, real = formatter(style=placeholder), formatter(style=style)
+        assert pygments.highlight("def f(): pass", PythonLexer(), lazy) == (
+            pygments.highlight("def f(): pass", PythonLexer(), real)
+        )
+    assert HtmlFormatter(style=placeholder).get_style_defs() == (
+        HtmlFormatter(style=style).get_style_defs()
+    )
@@ -0,0 +1,188 @@
+from importlib.metadata import EntryPoint
+
+import pygments
+import pygments.plugin
+import pytest
+
+from pygments.formatters import (
+    Terminal256Formatter,
+    TerminalTrueColorFormatter,
+)
+from pygments.lexers import PythonLexer
+from pygments.styles import get_style_by_name
+from pygments.styles.monokai import MonokaiStyle
+
+import rosepinebuild
+from rosepinepalette import ENTRY_POINTS, VARIANTS, build_style
+from rosepineterm import (
+    RosePine16Formatter,
+    RosePine256Formatter,
+    RosePineTrueColorFormatter,
+    closest_color,
+    get_formatter,
+)
+from rosepinetables import QUANTIZED, TERMINAL_ESCAPES
+
+CODE = '''@decorator
+class Example(Base):
+    """Docstring."""
+
+    def method(self, value: int = 0x1F) -> str:
+        try:
+            return f"{value!r} \\n" % (1, None, True)
+        except ValueError as err:
+            raise RuntimeError("boom") from err
+'''
+
+
+def test_tables_are_up_to_date() -> None:
+    """The committed tables should match a fresh build."""
+    assert rosepinebuild.TABLES_PATH.read_text(encoding="utf-8") == (
+        rosepinebuild.render()
+    )
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_matches_stock_formatter(variant: str) -> None:
+    """The true color formatter should be byte-identical to the stock one."""
+    stock = TerminalTrueColorFormatter(style=build_style(variant))
+    expected = pygments.highlight(CODE, PythonLexer(), stock)
+    actual = pygments.highlight(CODE, PythonLexer(), get_formatter(variant))
+    assert actual == expected
+
+
+class PerceptualFormatter(Terminal256Formatter):
+    """Stock 256-color formatter with the precomputed color matches."""
+
+    def _closest_color(self, r: int, g: int, b: int) -> int:
+        color = f"#{r:02x}{g:02x}{b:02x}"
+        return closest_color(self.style.name, color)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_256_colors(variant: str) -> None:
+    """The 256-color table should only change which colors are picked."""
+    stock = PerceptualFormatter(style=build_style(variant))
+    expected = pygments.highlight(CODE, PythonLexer(), stock)
+    formatter = get_formatter(variant, "256")
+    actual = pygments.highlight(CODE, PythonLexer(), formatter)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_quantization_is_perceptually_closer(variant: str) -> None:
+    """Matches should never be further in OKLab than Pygments' RGB search."""
+    stock = Terminal256Formatter()
+    for color, (index, _) in QUANTIZED[variant].items():
+        rgb = rosepinebuild.hex_to_rgb(color)
+        lab = rosepinebuild.srgb_to_oklab(rgb)
+        assert 16 <= index < 256
+        assert rosepinebuild.oklab_distance(lab, index) <= (
+            rosepinebuild.oklab_distance(lab, stock._closest_color(*rgb))
+        )
+
+
+def test_sixteen_colors_keep_hues() -> None:
+    """Accent colors should keep their hue in 16-color mode."""
+    assert closest_color("rose-pine", "#eb6f92", "16") == 9  # love: red
+    assert closest_color("rose-pine", "#f6c177", "16") == 3  # gold: yellow
+    assert closest_color("rose-pine", "#9ccfd8", "16") == 6  # foam: cyan
+    assert closest_color("rose-pine", "#c4a7e7", "16") == 13  # iris: magenta
+    assert closest_color("rose-pine", "#191724", "16") == 0  # base: black
+    assert closest_color("rose-pine-dawn", "#FAF4ED", "16") == 15
+
+
+@pytest.mark.parametrize(
+    "variant,color,depth",
+    [("rose-pine-noon", "#eb6f92", "256"), ("rose-pine", "#000000", "256")]
+    + [("rose-pine", "#eb6f92", "8")],
+)
+def test_closest_color_errors(variant: str, color: str, depth: str) -> None:
+    """Only palette colors of known variants have precomputed matches."""
+    with pytest.raises(ValueError):
+        closest_color(variant, color, depth)
+
+
+def test_table_is_shared() -> None:
+    """Formatters should reuse the table instead of rebuilding it."""
+    formatter = get_formatter("rose-pine-moon")
+    table = TERMINAL_ESCAPES["rose-pine-moon"]["truecolor"]
+    assert formatter.style_string is table
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("option", ["nobold", "noitalic", "nounderline"])
+def test_disabled_attributes(variant: str, option: str) -> None:
+    """Turning attributes off should give the escapes Pygments builds."""
+    style = build_style(variant)
+    formatter = get_formatter(variant, **{option: True})
+    stock = TerminalTrueColorFormatter(style=style, **{option: True})
+    assert formatter.style_string == stock.style_string
+    formatter = get_formatter(variant, "256", **{option: True})
+    stock = PerceptualFormatter(style=style, **{option: True})
+    assert formatter.style_string == stock.style_string
+    assert get_formatter(variant, "256", **{option: True}).style_string is (
+        formatter.style_string
+    )
+
+
+@pytest.mark.parametrize("option", ["nobold", "noitalic", "nounderline"])
+def test_sixteen_colors_disabled_attributes(option: str) -> None:
+    """Turning attributes off should keep the basic SGR colors."""
+    formatter = get_formatter("rose-pine-dawn", "16", **{option: True})
+    output = pygments.highlight(CODE, PythonLexer(), formatter)
+    assert "38;" not in output
+    decorator = formatter.style_string["Token.Name.Decorator"]
+    if option == "nobold":
+        assert decorator == ("\x1b[35m", "\x1b[39m")
+        assert "01" not in output
+    else:
+        assert decorator == ("\x1b[35;01m", "\x1b[39;00m")
+
+
+def test_entry_point_styles(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Styles found through the entry points should use the tables."""
+    # As registered in pyproject.toml.
+    entry_points = [
+        EntryPoint(variant, f"rosepinestyles:{name}", "pygments.styles")
+        for variant, (_, name) in ENTRY_POINTS.items()
+    ]
+    monkeypatch.setattr(
+        pygments.plugin,
+        "iter_entry_points",
+        lambda _: entry_points,
+    )
+    style = get_style_by_name("rose-pine")
+    assert style is not build_style("rose-pine")
+    formatter = RosePine256Formatter(style=style)
+    assert formatter.style_string is TERMINAL_ESCAPES["rose-pine"]["256"]
+    output = pygments.highlight("x = 1\n", PythonLexer(), formatter)
+    assert "\x1b[38;5;31m=" in output  # Not Pygments' 38;5;66.
+    merged = RosePine256Formatter(style=style, merge=True)
+    output = pygments.highlight("x = 1\n", PythonLexer(), merged)
+    assert output.count("\x1b[39m") == 4
+
+
+def test_other_styles_fall_back() -> None:
+    """Non Rose Pine styles should still work with the formatters."""
+    formatter = RosePineTrueColorFormatter(style=MonokaiStyle)
+    stock = TerminalTrueColorFormatter(style=MonokaiStyle)
+    assert formatter.style_string == stock.style_string
+
+
+def test_sixteen_colors() -> None:
+    """The 16-color formatter should only emit basic SGR colors."""
+    formatter = RosePine16Formatter()
+    output = pygments.highlight("@decorator", PythonLexer(), formatter)
+
+    assert "38;" not in output
+    assert output.startswith("\x1b[")
+
+
+@pytest.mark.parametrize(
+    "variant,depth", [("rose-pine-noon", "truecolor"), ("rose-pine", "8")]
+)
+def test_unknown_arguments(variant: str, depth: str) -> None:
+    """Unknown variants and depths should be rejected."""
+    with pytest.raises(ValueError):
+        get_formatter(variant, depth)
@@ -0,0 +1,74 @@
+import pytest
+
+from pygments.token import Token
+
+np = pytest.importorskip("numpy")
+
+import rosepinetransform  # noqa: E402
+from rosepinehtml import stylesheet  # noqa: E402
+from rosepinepalette import PALETTE, ROLES, VARIANTS, build_style  # noqa: E402
+from rosepineroles import escapes  # noqa: E402
+
+
+def test_load_round_trips() -> None:
+    """Loading and converting back should give the original palettes."""
+    lab = rosepinetransform.load()
+    assert lab.shape == (len(VARIANTS), len(ROLES), 3)
+    assert rosepinetransform.palettes(lab) == [PALETTE[v] for v in VARIANTS]
+
+
+def test_oklab_reference() -> None:
+    """White should be at full lightness without chroma."""
+    lab = rosepinetransform.to_oklab(np.array([1.0, 1.0, 1.0]))
+    assert lab == pytest.approx([1, 0, 0], abs=1e-6)
+
+
+def test_adjust_broadcasts() -> None:
+    """Per-palette factors should derive one palette per factor."""
+    lab = rosepinetransform.load()
+    derived = rosepinetransform.adjust(lab, lightness=np.array([[0.5], [1.0]]))
+    assert derived.shape == (2, len(VARIANTS), len(ROLES), 3)
+    assert derived[1] == pytest.approx(lab)
+    assert derived[0, ..., 0] == pytest.approx(lab[..., 0] * 0.5)
+
+
+def test_adjust_saturation_and_contrast() -> None:
+    """Saturation should scale chroma, contrast the distance to the base."""
+    lab = rosepinetransform.load(["rose-pine-dawn"])
+    gray = rosepinetransform.adjust(lab, saturation=0)
+    assert gray[..., 1:] == pytest.approx(0)
+    assert gray[..., 0] == pytest.approx(lab[..., 0])
+    base = ROLES.index("base")
+    flat = rosepinetransform.adjust(lab, contrast=0)
+    assert flat[..., 0] == pytest.approx(lab[0, base, 0])
+    strong = rosepinetransform.adjust(lab, contrast=1.5)
+    assert (
+        abs(strong[0, :, 0] - lab[0, base, 0]).sum()
+        > abs(lab[0, :, 0] - lab[0, base, 0]).sum()
+    )
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_make_style_matches_variant(variant: str) -> None:
+    """A style built from an unchanged palette should match the variant."""
+    palette = PALETTE[variant]
+    style = rosepinetransform.make_style(variant, palette, base=variant)
+    reference = build_style(variant)
+    assert list(style) == list(reference)
+    assert style.background_color == reference.background_color
+    tables = rosepinetransform.tables(style)
+    assert tables["escapes"] == escapes(variant, "truecolor")
+    assert tables["stylesheet"] == stylesheet(variant)
+
+
+def test_make_style_derived() -> None:
+    """Derived styles should use the new colors and keep the attributes."""
+    lab = rosepinetransform.adjust(rosepinetransform.load(["rose-pine"]), 0.8)
+    colors = rosepinetransform.palettes(lab)[0]
+    style = rosepinetransform.make_style("rose-pine-dimmed", colors)
+    assert style.__name__ == "RosePineDimmedStyle"
+    function = style.style_for_token(Token.Name.Function)
+    assert function["color"] == colors["love"][1:]
+    assert style.style_for_token(Token.Name.Decorator)["bold"]
+    with pytest.raises(ValueError):
+        rosepinetransform.make_style("x", colors, base="rose-pine-noon")
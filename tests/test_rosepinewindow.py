@@ -0,0 +1,115 @@
+import random
+from pathlib import Path
+
+import pygments
+import pytest
+
+from pygments.lexer import Lexer
+from pygments.lexers import HtmlLexer, JsonLexer, MarkdownLexer, PythonLexer
+
+from rosepineterm import formatter_for
+from rosepinewindow import WindowedHighlighter
+
+CORPUS = Path(__file__).parent / "golden" / "corpus"
+
+
+def repeated(name: str) -> str:
+    """A corpus file, repeated to make a long document."""
+    return (CORPUS / name).read_text() * 20
+
+
+def whole_lines(
+    text: str,
+    lexer: Lexer,
+    variant: str = "rose-pine",
+) -> list[str]:
+    """Output of every line when highlighting the whole document."""
+    formatter = formatter_for(variant, "terminal16m")
+    output = pygments.highlight(text, lexer, formatter)
+    return [line + "\n" for line in output.split("\n")[:-1]]
+
+
+@pytest.mark.parametrize(
+    "lexer,text",
+    [
+        (PythonLexer(stripnl=False), repeated("example.py")),
+        (MarkdownLexer(stripnl=False), repeated("example.md")),
+        (HtmlLexer(stripnl=False), repeated("example.html")),
+        (JsonLexer(stripnl=False), repeated("example.json")),
+    ],
+    ids=["python", "markdown", "html", "json"],
+)
+@pytest.mark.parametrize("interval", [1, 25, 1000])
+def test_windows_match_whole_highlighting(
+    lexer: Lexer, text: str, interval: int
+) -> None:
+    """Any window should be the same lines of the whole document."""
+    lines = whole_lines(text, lexer)
+    highlighter = WindowedHighlighter(text, lexer, interval=interval)
+    assert highlighter.line_count == len(lines)
+    rng = random.Random(0)
+    for _ in range(50):
+        start = rng.randrange(len(lines))
+        stop = start + rng.randrange(1, 60)
+        assert highlighter.render(start, stop) == "".join(lines[start:stop])
+
+
+def test_checkpoints() -> None:
+    """Checkpoints should be spaced by the interval, as far as was lexed."""
+    text = (CORPUS / "example.py").read_text() * 50
+    highlighter = WindowedHighlighter(text, PythonLexer(), interval=100)
+    highlighter.render(0, 60)
+    assert highlighter.checkpoints == [(0, 0, ("root",))]
+    assert highlighter.indexed == 60
+    highlighter.render(1000, 1010)
+    lines = [line for line, _, _ in highlighter.checkpoints]
+    assert lines == sorted(lines) and lines[-1] <= 1000
+    assert all(b - a >= 100 for a, b in zip(lines, lines[1:]))
+    assert highlighter.indexed == 1010
+    highlighter.build_index()
+    assert highlighter.indexed == highlighter.line_count
+    assert len(highlighter.checkpoints) > highlighter.line_count // 200
+    for line, offset, stack in highlighter.checkpoints:
+        assert offset == 0 or highlighter.text[offset - 1] == "\n"
+        assert highlighter.text.count("\n", 0, offset) == line
+        assert stack[0] == "root"
+
+
+def test_window_after_index_lexes_from_checkpoint() -> None:
+    """Once indexed, a window should only lex from the closest checkpoint."""
+    text = "x = 1\n" * 10_000
+    highlighter = WindowedHighlighter(text, PythonLexer(), interval=100)
+    highlighter.build_index()
+    lexed = []
+    tokens = highlighter._tokens
+    highlighter._tokens = lambda *args: lexed.append(args) or tokens(*args)
+    expected = whole_lines(text, PythonLexer(stripnl=False))[9_950:9_960]
+    assert highlighter.render(9_950, 9_960) == "".join(expected)
+    assert [offset for offset, _, _ in lexed] == [9_900 * len("x = 1\n")]
+
+
+def test_ranges() -> None:
+    """Ranges should be clipped to the document."""
+    highlighter = WindowedHighlighter("a = 1\nb = 2", PythonLexer())
+    assert highlighter.line_count == 2
+    assert highlighter.render(1, 1) == ""
+    assert highlighter.render(5, 10) == ""
+    lines = whole_lines("a = 1\nb = 2\n", PythonLexer())
+    assert highlighter.render(-3, 100) == "".join(lines)
+    assert highlighter.render(1, 2) == lines[1]
+
+
+def test_formatter_and_options() -> None:
+    """A formatter, or formatter options, should be accepted."""
+    text = "def f():\n    return 1\n"
+    formatter = formatter_for("rose-pine-dawn", "html", nowrap=True)
+    highlighter = WindowedHighlighter(text, PythonLexer(), formatter=formatter)
+    assert highlighter.render(1, 2) == pygments.highlight(
+        "    return 1\n", PythonLexer(), formatter
+    )
+    highlighter = WindowedHighlighter(
+        text, PythonLexer(), "rose-pine-moon", "html", nowrap=True
+    )
+    assert highlighter.render(0, 1).startswith("<span")
+    with pytest.raises(ValueError):
+        WindowedHighlighter(text, PythonLexer(), interval=0)